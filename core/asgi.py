@@ -14,7 +14,7 @@ from channels.routing import ProtocolTypeRouter, URLRouter
 from channels.security.websocket import AllowedHostsOriginValidator
 from django.core.asgi import get_asgi_application
 
-from tcn.channels.urls import urlpatterns
+from tcn.channels.urls import websocket_urlpatterns
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 
@@ -30,7 +30,7 @@ application = ProtocolTypeRouter(
         "http": django_asgi_app,
         # WebSocket chat handler
         "websocket": AllowedHostsOriginValidator(
-            AuthMiddlewareStack(URLRouter(urlpatterns))
+            AuthMiddlewareStack(URLRouter(websocket_urlpatterns))
         ),
     }
 )
@@ -45,6 +45,7 @@ ALLOWED_HOSTS = json.loads(os.environ.get("ALLOWED_HOSTS", "[]"))
 INSTALLED_APPS = [
     # The Certain News
     "tcn",
+    "tcn.api",
     "tcn.apps.articles",
     "tcn.apps.categories",
     "tcn.apps.feeds",
@@ -128,6 +129,7 @@ MIDDLEWARE = [
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.locale.LocaleMiddleware",
+    "tcn.apps.locales.LocaleResolutionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -173,6 +175,27 @@ DATABASES = {
 }
 
 
+# Caches
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Buffered counters, boards and invalidation versions are shared by every
+# process through Redis at redis://host:port/db. Without it each process keeps
+# its own in memory, and the management commands working on them refuse to run
+REDIS_URL = os.environ.get("REDIS_URL")
+CACHES = {
+    "default": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+        if REDIS_URL
+        else {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "OPTIONS": {"MAX_ENTRIES": 100_000},
+        }
+    )
+}
+
+
 # Email
 # https://docs.djangoproject.com/en/5.2/ref/settings/#std-setting-DEFAULT_FROM_EMAIL
 DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL")
@@ -245,7 +268,44 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
 # Channels settings
-CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
+# Share the live feed across processes and hosts through `run_channel_broker`,
+# at unix:///path/to/private/dir/socket or tcp://host:port on a private network.
+# Processes authenticate with a secret, derived from SECRET_KEY if unset.
+CHANNEL_BROKER_ADDRESS = os.environ.get("CHANNEL_BROKER_ADDRESS")
+CHANNEL_BROKER_SECRET = os.environ.get("CHANNEL_BROKER_SECRET")
+CHANNEL_LAYERS = {
+    "default": (
+        {
+            "BACKEND": "tcn.channels.layers.BrokerChannelLayer",
+            "CONFIG": {
+                "address": CHANNEL_BROKER_ADDRESS,
+                "secret": CHANNEL_BROKER_SECRET,
+            },
+        }
+        if CHANNEL_BROKER_ADDRESS
+        else {"BACKEND": "channels.layers.InMemoryChannelLayer"}
+    )
+}
+
+# Breaking news are sent from an outbox, `dispatch_live_events` retries the
+# events still pending after this many failed attempts
+LIVE_OUTBOX_MAX_ATTEMPTS = int(os.environ.get("LIVE_OUTBOX_MAX_ATTEMPTS", 5))
+# Recent breaking news replayed to readers joining the live feed, per language,
+# reloaded from the outbox every N seconds
+LIVE_REPLAY_SIZE = int(os.environ.get("LIVE_REPLAY_SIZE", 50))
+LIVE_REPLAY_TIMEOUT = int(os.environ.get("LIVE_REPLAY_TIMEOUT", 5 * 60))
+# Messages a live feed reader may fall behind before it is disconnected, and
+# the window to batch bursts into a single frame, in seconds
+LIVE_FEED_QUEUE_SIZE = int(os.environ.get("LIVE_FEED_QUEUE_SIZE", 100))
+LIVE_FEED_COALESCE_DELAY = float(os.environ.get("LIVE_FEED_COALESCE_DELAY", 0.05))
+# Breaking news staff may broadcast from their socket, per minute
+LIVE_FEED_INBOUND_RATE = int(os.environ.get("LIVE_FEED_INBOUND_RATE", 10))
+# Server-sent events fallback of the live feed, concurrent streams per worker
+# and seconds between keep-alive comments
+LIVE_SSE_MAX_STREAMS = int(os.environ.get("LIVE_SSE_MAX_STREAMS", 1000))
+LIVE_SSE_KEEPALIVE = int(os.environ.get("LIVE_SSE_KEEPALIVE", 15))
+# Bearer token of the Prometheus scrapers of /metrics/live/, staff only if unset
+LIVE_METRICS_TOKEN = os.environ.get("LIVE_METRICS_TOKEN")
 
 
 # Wagtail CMS settings
@@ -266,6 +326,11 @@ WAGTAILDOCS_EXTENSIONS = [
     "zip",
 ]
 
+# Full-text search, FTS5 on SQLite and tsvector stemmed per locale on PostgreSQL,
+# in the configurations of tcn.cms.search.LANGUAGE_CONFIGS unless a
+# LANGUAGE_CONFIGS param replaces them
+WAGTAILSEARCH_BACKENDS = {"default": {"BACKEND": "tcn.cms.search"}}
+
 # Wagtail Localize
 WAGTAILLOCALIZE_MACHINE_TRANSLATOR = {
     "CLASS": "tcn.cms.translators.HuggingFaceTranslator"
@@ -278,6 +343,59 @@ AUTH_USER_MODEL = "users.User"
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 10_000
 HF_TRANSLATION_MODEL = os.environ.get("HF_TRANSLATION_MODEL", "openai/gpt-oss-20b")
 
+# Machine translations pack segments in completions of about N tokens, and
+# run N completions at once
+HF_TRANSLATION_BATCH_TOKENS = int(os.environ.get("HF_TRANSLATION_BATCH_TOKENS", 1500))
+HF_TRANSLATION_WORKERS = int(os.environ.get("HF_TRANSLATION_WORKERS", 4))
+
+# Buffered link views are written to the database every N seconds or hits
+LINK_VIEWS_FLUSH_INTERVAL = int(os.environ.get("LINK_VIEWS_FLUSH_INTERVAL", 30))
+LINK_VIEWS_FLUSH_THRESHOLD = int(os.environ.get("LINK_VIEWS_FLUSH_THRESHOLD", 1000))
+
+# Short link targets are resolved again at least every N seconds
+LINK_URLS_TIMEOUT = int(os.environ.get("LINK_URLS_TIMEOUT", 15 * 60))
+
+# Search query hits are written every N seconds, or once N queries are pending
+SEARCH_HITS_FLUSH_INTERVAL = int(os.environ.get("SEARCH_HITS_FLUSH_INTERVAL", 60))
+SEARCH_HITS_FLUSH_THRESHOLD = int(os.environ.get("SEARCH_HITS_FLUSH_THRESHOLD", 10_000))
+
+# Ids of the best N results kept per search, for at most N seconds
+SEARCH_RESULTS_SIZE = 1000
+SEARCH_RESULTS_TIMEOUT = int(os.environ.get("SEARCH_RESULTS_TIMEOUT", 15 * 60))
+
+# Rendered RSS/Atom feeds are rendered again at least every N seconds
+FEEDS_TIMEOUT = int(os.environ.get("FEEDS_TIMEOUT", 15 * 60))
+
+# Articles per locale, category and owner are counted again every N seconds
+ARTICLE_COUNTS_TIMEOUT = int(os.environ.get("ARTICLE_COUNTS_TIMEOUT", 5 * 60))
+
+# Typeahead suggestions per type, popular queries suggested, newest articles
+# indexed per locale, how often (seconds) processes look for articles
+# published by others, and rebuild
+TYPEAHEAD_LIMIT = 5
+TYPEAHEAD_QUERIES = 1000
+TYPEAHEAD_ARTICLES = int(os.environ.get("TYPEAHEAD_ARTICLES", 10_000))
+TYPEAHEAD_REFRESH = int(os.environ.get("TYPEAHEAD_REFRESH", 60))
+TYPEAHEAD_MAX_AGE = int(os.environ.get("TYPEAHEAD_MAX_AGE", 15 * 60))
+
+# Processes look for locales saved by others every N seconds
+LOCALES_MAX_AGE = int(os.environ.get("LOCALES_MAX_AGE", 30))
+
+# Trending articles, views lose half of their weight every half life (seconds),
+# the most viewed articles shown while a board is cold are read every N seconds
+TRENDING_SIZE = 10
+TRENDING_HALF_LIFE = int(os.environ.get("TRENDING_HALF_LIFE", 6 * 60 * 60))
+TRENDING_FALLBACK_TIMEOUT = int(os.environ.get("TRENDING_FALLBACK_TIMEOUT", 5 * 60))
+
+# Number of similar articles stored for each article, and the worker threads
+# that store them after a publish
+RECOMMENDATIONS_SIZE = 6
+RECOMMENDATION_WORKERS = int(os.environ.get("RECOMMENDATION_WORKERS", 1))
+
+# Renditions built for every image on upload and article publish
+IMAGE_RENDITIONS = ["fill-1920x1080", "fill-1080x1080", "fill-1200x630"]
+IMAGE_RENDITION_WORKERS = int(os.environ.get("IMAGE_RENDITION_WORKERS", 2))
+
 REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": [
         "rest_framework.filters.SearchFilter",
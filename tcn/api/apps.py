@@ -9,3 +9,10 @@ class APIConfig(AppConfig):
 
     name = "tcn.api"
     default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self) -> None:
+        """Register signal receivers"""
+
+        from tcn.api.signals import register_typeahead_signal_receivers
+
+        register_typeahead_signal_receivers()
@@ -0,0 +1,81 @@
+"""API Paginations"""
+
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.paginator import InvalidPage
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+from wagtail.api.v2.pagination import WagtailPagination
+from wagtail.api.v2.utils import BadRequestError
+
+from tcn.apps.paginators import CursorPaginator
+
+
+# Create your paginations here.
+class ArticleCursorPagination(CursorPagination):
+    """Newest articles first, by keyset, without counting them"""
+
+    ordering = ("-created_at", "-pk")
+
+
+class ArticleKeysetPagination(WagtailPagination):
+    """
+    Wagtail API pagination by keyset, unless `offset`, `order` or `search` is
+    requested
+
+    Pages are requested with `?cursor=`, which takes the `next` or `previous`
+    cursor of another page, or `last`.
+    """
+
+    query_parameters = frozenset(["cursor"])
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if {"offset", "order", "search"} & set(request.GET):
+            self.paginator = None
+            return super().paginate_queryset(queryset, request, view)
+
+        limit_max = getattr(settings, "WAGTAILAPI_LIMIT_MAX", 20)
+
+        try:
+            limit = int(request.GET.get("limit", min(20, limit_max or 20)))
+            if limit <= 0:
+                raise ValueError()
+
+        except ValueError as e:
+            raise BadRequestError("limit must be a positive integer") from e
+
+        if limit_max and limit > limit_max:
+            raise BadRequestError("limit cannot be higher than %d" % limit_max)
+
+        self.view = view
+        self.paginator = CursorPaginator(queryset, limit)
+
+        try:
+            self.page = self.paginator.page(request.GET.get("cursor"))
+
+        except InvalidPage as e:
+            raise BadRequestError(str(e)) from e
+
+        return self.page.object_list
+
+    def get_paginated_response(self, data):
+        if self.paginator is None:
+            return super().get_paginated_response(data)
+
+        return Response(
+            OrderedDict(
+                [
+                    (
+                        "meta",
+                        OrderedDict(
+                            [
+                                ("next", self.page.next_cursor),
+                                ("previous", self.page.previous_cursor),
+                            ]
+                        ),
+                    ),
+                    ("items", data),
+                ]
+            )
+        )
@@ -0,0 +1,21 @@
+"""Signals to keep typeahead suggestions up to date"""
+
+from django.db.models.signals import post_delete
+from wagtail.signals import page_published, page_unpublished
+
+from tcn.api.typeahead import typeahead
+from tcn.apps.articles.models import Article
+
+
+def suggest_article(sender, **kwargs):
+    """Add, replace or remove the suggestions of a changed article"""
+
+    typeahead.update(kwargs["instance"])
+
+
+def register_typeahead_signal_receivers():
+    """Register `suggest_article` for published, unpublished and deleted articles"""
+
+    page_published.connect(suggest_article, sender=Article)
+    page_unpublished.connect(suggest_article, sender=Article)
+    post_delete.connect(suggest_article, sender=Article)
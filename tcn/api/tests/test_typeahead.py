@@ -0,0 +1,216 @@
+"""Tests for the typeahead suggestions"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework import status
+from wagtail.contrib.search_promotions.models import Query
+
+from tcn.api.typeahead import PrefixIndex, Typeahead, typeahead
+from tcn.apps.articles.tests import create_article, create_category
+
+
+# Create your tests here.
+class PrefixIndexTests(SimpleTestCase):
+    """PrefixIndex tests"""
+
+    def texts(self, results, kind: str = "article"):
+        return [item["text"] for item in results[kind]]
+
+    def test_search(self) -> None:
+        """Test that word starts match, best weights first"""
+
+        index = PrefixIndex()
+        index.add("article", 1, "Élection results", 1)
+        index.add("article", 2, "Weather before the election", 2)
+        index.add("article", 3, "Electricity prices", 3)
+
+        self.assertEqual(
+            self.texts(index.search("ELEC", 5)),
+            ["Electricity prices", "Weather before the election", "Élection results"],
+        )
+        self.assertEqual(
+            self.texts(index.search("elect", 2)),
+            ["Electricity prices", "Weather before the election"],
+        )
+        self.assertEqual(
+            self.texts(index.search("election r", 5)), ["Élection results"]
+        )
+        self.assertEqual(self.texts(index.search("results", 5)), ["Élection results"])
+        self.assertEqual(self.texts(index.search("sports", 5)), [])
+
+    def test_update(self) -> None:
+        """Test that replaced and removed suggestions are no longer matched"""
+
+        index = PrefixIndex()
+        index.add("article", 1, "Election results", 1)
+        self.assertEqual(len(index.search("ele", 5)["article"]), 1)
+
+        index.add("article", 1, "Weather", 1)
+        self.assertEqual(self.texts(index.search("ele", 5)), [])
+        self.assertEqual(self.texts(index.search("wea", 5)), ["Weather"])
+
+        index.remove("article", 1)
+        self.assertEqual(self.texts(index.search("wea", 5)), [])
+        self.assertEqual(len(index), 0)
+        self.assertEqual((index.keys["article"], index.ranked["article"]), ([], []))
+
+    def test_wide_prefix(self) -> None:
+        """Test that wide ranges are ranked by walking the best suggestions"""
+
+        index = PrefixIndex(scan=2)
+        index.extend(
+            "article",
+            [(ref, f"Election {ref}", ref, {}) for ref in range(5)]
+            + [(5, "Weather", 10, {})],
+        )
+
+        self.assertEqual(self.texts(index.search("e", 2)), ["Election 4", "Election 3"])
+        self.assertEqual(self.texts(index.search("election 1", 2)), ["Election 1"])
+
+
+class TypeaheadTests(TestCase):
+    """Typeahead tests"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup data"""
+
+        cls.category = create_category()
+        cls.article = create_article(cls.category, "election-results")
+        cls.article.tags.add("Elections")
+        cls.article.save_revision().publish()
+        create_article(cls.category, "weather")
+
+        Query.get("election day").add_hit()
+        Query.get("elecciones").add_hit()
+
+    def setUp(self) -> None:
+        cache.clear()
+        typeahead.clear()
+        self.addCleanup(typeahead.clear)
+        self.locale_id = self.category.locale_id
+        typeahead.build(self.locale_id)
+
+    def test_suggest(self) -> None:
+        """Test that titles, tags and queries are suggested from memory"""
+
+        with self.assertNumQueries(0):
+            results = typeahead.suggest(self.locale_id, "elec")
+
+        self.assertEqual(
+            {kind: [item["text"] for item in items] for kind, items in results.items()},
+            {
+                "query": ["election day"],
+                "tag": ["Elections"],
+                "article": ["Election Results"],
+            },
+        )
+        self.assertEqual(results["article"][0]["id"], self.article.id)
+        self.assertEqual(results["article"][0]["url"], self.article.short_link)
+        self.assertEqual(
+            typeahead.suggest(self.locale_id, " "), typeahead.suggest(0, "")
+        )
+
+    def test_other_locales(self) -> None:
+        """Test that queries sharing no word with a locale are not suggested"""
+
+        results = typeahead.suggest(self.locale_id, "elec")
+
+        self.assertEqual([item["text"] for item in results["query"]], ["election day"])
+
+        # Nothing to suggest in a locale without articles
+        self.assertEqual(typeahead.build(0).search("elec", 5)["query"], [])
+
+    @patch("tcn.api.typeahead.threading.Thread")
+    def test_cold(self, thread) -> None:
+        """Test that a missing index is built once, in the background"""
+
+        suggestions = Typeahead()
+
+        with self.assertNumQueries(0):
+            results = suggestions.suggest(self.locale_id, "elec")
+            suggestions.suggest(self.locale_id, "elec")
+
+        self.assertEqual(results, typeahead.suggest(0, ""))
+        thread.assert_called_once()
+
+        suggestions.rebuild_in_background(self.locale_id)
+        results = suggestions.suggest(self.locale_id, "elec")
+
+        self.assertEqual(
+            [item["text"] for item in results["article"]], ["Election Results"]
+        )
+        self.assertEqual(suggestions.building, set())
+
+    def test_articles(self) -> None:
+        """Test that only the newest articles of a locale are indexed"""
+
+        index = Typeahead(articles=1).build(self.locale_id)
+
+        self.assertEqual(
+            [item["text"] for item in index.search("wea", 5)["article"]], ["Weather"]
+        )
+        self.assertEqual(
+            index.search("elec", 5), {"query": [], "tag": [], "article": []}
+        )
+
+    def test_publish(self) -> None:
+        """Test that publishing and unpublishing update a built index"""
+
+        article = create_article(self.category, "electricity")
+        article.tags.add("Elections", "Energy")
+        article.save_revision().publish()
+
+        results = typeahead.suggest(self.locale_id, "e")
+
+        self.assertEqual(
+            [item["text"] for item in results["article"]],
+            ["Electricity", "Election Results"],
+        )
+        self.assertEqual(
+            [item["text"] for item in results["tag"]], ["Elections", "Energy"]
+        )
+
+        article.unpublish()
+        results = typeahead.suggest(self.locale_id, "e")
+
+        self.assertEqual(
+            [item["text"] for item in results["article"]], ["Election Results"]
+        )
+        self.assertEqual([item["text"] for item in results["tag"]], ["Elections"])
+
+        # Published by this process, no rebuild needed
+        self.assertEqual(
+            typeahead.versions[self.locale_id], typeahead.version(self.locale_id)
+        )
+
+    @patch("tcn.api.typeahead.threading.Thread")
+    def test_max_age(self, thread) -> None:
+        """Test that old indexes are rebuilt, even if their version is current"""
+
+        suggestions = Typeahead(refresh=0, max_age=3600)
+        suggestions.build(self.locale_id)
+        suggestions.suggest(self.locale_id, "elec")
+        thread.assert_not_called()
+
+        suggestions.max_age = 0
+        suggestions.suggest(self.locale_id, "elec")
+        thread.assert_called_once()
+
+    def test_view(self) -> None:
+        """Test that the endpoint answers without authentication nor queries"""
+
+        url = reverse("typeahead")
+        self.client.get(url, {"q": "elec"})
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, {"q": "wea", "limit": "1"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["text"] for item in response.json()["results"]["article"]],
+            ["Weather"],
+        )
@@ -0,0 +1,532 @@
+"""In-memory prefix suggestions for the search box"""
+
+import heapq
+import logging
+import threading
+import time
+import unicodedata
+from bisect import bisect_left, insort
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
+from django.urls import reverse
+from django.utils import timezone, translation
+from wagtail.contrib.search_promotions.models import Query
+from wagtail.models import Locale
+
+from tcn import APP_NAME
+from tcn.apps.articles.models import Article
+from tcn.apps.tags.models import ArticleTag
+
+logger = logging.getLogger(__name__)
+
+KINDS = ["query", "tag", "article"]
+
+# Sorts after any character of a key
+HIGHEST = "\U0010ffff"
+
+# Keys and prefixes are cut, so long titles do not repeat in every key
+KEY_LENGTH = 48
+
+
+def normalize(text: str) -> str:
+    """Case and accent insensitive form of a text, with single spaces"""
+
+    text = unicodedata.normalize("NFKD", text)
+
+    return " ".join(
+        "".join(c for c in text if not unicodedata.combining(c)).casefold().split()
+    )
+
+
+def in_vocabulary(vocabulary: List[str], text: str) -> bool:
+    """Whether a word of a text starts a word of a sorted vocabulary"""
+
+    for word in normalize(text).split(" "):
+        index = bisect_left(vocabulary, word)
+
+        if word and index < len(vocabulary) and vocabulary[index].startswith(word):
+            return True
+
+    return False
+
+
+# Create your indexes here.
+class PrefixIndex:
+    """
+    Suggestions of one locale, found by binary search over sorted keys
+
+    Every suggestion is keyed by its normalized text from the start of each of
+    its words, so "election results" matches "ele" and "res". The matches of
+    a prefix are the range of keys between `prefix` and `prefix + HIGHEST`.
+    Narrow ranges are ranked whole, the best suggestions of a range wider
+    than `scan` keys, such as a single letter, are the first ones matching
+    by decreasing weight. Results are memoized until the index changes.
+    """
+
+    def __init__(self, scan: int = 1000, memo_size: int = 1024) -> None:
+        self.keys: Dict[str, List[Tuple[str, object]]] = defaultdict(list)
+        self.ranked: Dict[str, List[Tuple[float, object]]] = defaultdict(list)
+        self.items: Dict[Tuple[str, object], Dict] = {}
+        self.memo: Dict[Tuple[str, int], Dict[str, List[Dict]]] = {}
+        self.scan = scan
+        self.memo_size = memo_size
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @staticmethod
+    def words(text: str) -> List[str]:
+        """Keys of a text, one per word start"""
+
+        words = normalize(text).split(" ")
+
+        return [" ".join(words[i:])[:KEY_LENGTH] for i in range(len(words)) if words[i]]
+
+    def item(self, kind: str, text: str, weight: float, data: Dict) -> Dict:
+        return {
+            "type": kind,
+            "text": text,
+            "weight": weight,
+            "keys": self.words(text),
+            **data,
+        }
+
+    def add(self, kind: str, ref, text: str, weight: float, **data) -> None:
+        """
+        Add or replace a suggestion
+
+        Args:
+            kind (str): `query`, `tag` or `article`.
+            ref: Identifier of the suggestion within its kind.
+            text (str): Suggested text, matched by prefix.
+            weight (float): Rank among the suggestions of the same kind.
+            data: Extra fields of the suggestion.
+        """
+
+        with self.lock:
+            self.discard(kind, ref)
+            item = self.items[(kind, ref)] = self.item(kind, text, weight, data)
+
+            for key in item["keys"]:
+                insort(self.keys[kind], (key, ref))
+
+            insort(self.ranked[kind], (-weight, ref))
+            self.memo.clear()
+
+    def extend(self, kind: str, suggestions) -> None:
+        """
+        Add new suggestions, sorted once rather than inserted one by one
+
+        Args:
+            kind (str): Kind of the suggestions.
+            suggestions: `(ref, text, weight, data)` tuples, refs not indexed yet.
+        """
+
+        with self.lock:
+            keys, ranked = self.keys[kind], self.ranked[kind]
+
+            for ref, text, weight, data in suggestions:
+                item = self.items[(kind, ref)] = self.item(kind, text, weight, data)
+                keys.extend((key, ref) for key in item["keys"])
+                ranked.append((-weight, ref))
+
+            keys.sort()
+            ranked.sort()
+            self.memo.clear()
+
+    def remove(self, kind: str, ref) -> None:
+        """Remove a suggestion, if present"""
+
+        with self.lock:
+            self.discard(kind, ref)
+            self.memo.clear()
+
+    def discard(self, kind: str, ref) -> None:
+        item = self.items.pop((kind, ref), None)
+
+        if item is None:
+            return
+
+        for entries, entry in [
+            *((self.keys[kind], (key, ref)) for key in item["keys"]),
+            (self.ranked[kind], (-item["weight"], ref)),
+        ]:
+            index = bisect_left(entries, entry)
+
+            if index < len(entries) and entries[index] == entry:
+                del entries[index]
+
+    def best(self, kind: str, prefix: str, limit: int) -> List[Dict]:
+        """Suggestions of a kind with a key starting with a prefix, best first"""
+
+        keys = self.keys[kind]
+        start = bisect_left(keys, (prefix,))
+        stop = bisect_left(keys, (prefix + HIGHEST,))
+
+        if stop - start <= self.scan:
+            return heapq.nlargest(
+                limit,
+                (
+                    self.items[(kind, ref)]
+                    for ref in {ref for _, ref in keys[start:stop]}
+                ),
+                key=lambda item: item["weight"],
+            )
+
+        best = []
+
+        for _, ref in self.ranked[kind]:
+            item = self.items[(kind, ref)]
+
+            if any(key.startswith(prefix) for key in item["keys"]):
+                best.append(item)
+
+                if len(best) == limit:
+                    break
+
+        return best
+
+    def search(self, prefix: str, limit: int) -> Dict[str, List[Dict]]:
+        """
+        Best suggestions of each kind for a prefix
+
+        Returns:
+            Dict: Lists of up to `limit` suggestions, by kind.
+        """
+
+        prefix = normalize(prefix)[:KEY_LENGTH]
+        memo_key = (prefix, limit)
+
+        with self.lock:
+            if memo_key in self.memo:
+                return self.memo[memo_key]
+
+            results = {
+                kind: [
+                    {
+                        field: value
+                        for field, value in item.items()
+                        if field not in ("weight", "keys")
+                    }
+                    for item in self.best(kind, prefix, limit)
+                ]
+                for kind in KINDS
+            }
+
+            if len(self.memo) >= self.memo_size:
+                self.memo.clear()
+
+            self.memo[memo_key] = results
+
+            return results
+
+
+class Typeahead:
+    """
+    Title, tag and popular query suggestions of every locale, in memory
+
+    The index of a locale is built from the database in a background thread
+    on its first use, nothing is suggested until it is ready. It then is kept
+    up to date by the publish signals of this process. A publish also
+    bumps a version in the cache, every `refresh` seconds a process compares
+    it to its own and rebuilds outdated indexes in a background thread, which
+    also picks up new popular queries. Indexes older than `max_age` seconds
+    are rebuilt too, in case a bump never reached the cache of this process.
+    Suggestions are answered from memory.
+
+    Only the `articles` newest articles of a locale, and their tags, are
+    indexed. Articles rank newest first, tags by their number of articles and queries
+    by their hits over the last `WAGTAILSEARCH_HITS_MAX_AGE` days. Queries
+    are recorded without their locale, a locale only suggests the ones with
+    a word starting a word of its titles or tags.
+    """
+
+    key_prefix = "tcn:typeahead"
+
+    def __init__(
+        self,
+        cache_alias: str = "default",
+        limit: Optional[int] = None,
+        queries: Optional[int] = None,
+        articles: Optional[int] = None,
+        refresh: Optional[float] = None,
+        max_age: Optional[float] = None,
+    ) -> None:
+        self.cache_alias = cache_alias
+        self.limit = limit or getattr(settings, "TYPEAHEAD_LIMIT", 5)
+        self.queries = queries or getattr(settings, "TYPEAHEAD_QUERIES", 1000)
+        self.articles = articles or getattr(settings, "TYPEAHEAD_ARTICLES", 10_000)
+        self.refresh = (
+            refresh
+            if refresh is not None
+            else getattr(settings, "TYPEAHEAD_REFRESH", 60)
+        )
+        self.max_age = (
+            max_age
+            if max_age is not None
+            else getattr(settings, "TYPEAHEAD_MAX_AGE", 15 * 60)
+        )
+        self.indexes: Dict[int, PrefixIndex] = {}
+        self.tags: Dict[int, Dict[str, Set[int]]] = {}
+        self.versions: Dict[int, int] = {}
+        self.checked: Dict[int, float] = {}
+        self.built: Dict[int, float] = {}
+        self.building: Set[int] = set()
+        self.lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def key(self, locale_id: int) -> str:
+        return f"{self.key_prefix}:{locale_id}"
+
+    def version(self, locale_id: int) -> int:
+        return self.cache.get(self.key(locale_id), 0)
+
+    def bump(self, locale_id: int) -> int:
+        """Increment the shared version of a locale"""
+
+        self.cache.add(self.key(locale_id), 0, timeout=None)
+
+        try:
+            return self.cache.incr(self.key(locale_id))
+
+        except ValueError:
+            # The key was evicted between `add` and `incr`
+            self.cache.set(self.key(locale_id), 1, timeout=None)
+            return 1
+
+    def build(self, locale_id: int) -> PrefixIndex:
+        """Read the suggestions of a locale, and replace its index"""
+
+        version = self.version(locale_id)
+        index = PrefixIndex()
+        tags: Dict[str, Set[int]] = defaultdict(set)
+        language_code = (
+            Locale.objects.filter(pk=locale_id)
+            .values_list("language_code", flat=True)
+            .first()
+        )
+        articles = (
+            Article.objects.live()
+            .public()
+            .filter(locale_id=locale_id)
+            .order_by("-created_at")
+            .values_list("id", "title", "link__slug", "created_at")[: self.articles]
+        )
+
+        with translation.override(language_code):
+            suggestions = list(map(self.article, articles))
+
+        index.extend("article", suggestions)
+
+        for article_id, name in ArticleTag.objects.filter(
+            content_object_id__in=[article_id for article_id, *_ in suggestions]
+        ).values_list("content_object_id", "tag__name"):
+            tags[name].add(article_id)
+
+        index.extend(
+            "tag",
+            ((name, name, len(article_ids), {}) for name, article_ids in tags.items()),
+        )
+
+        vocabulary = sorted(
+            {
+                word
+                for text in [*(title for _, title, _, _ in suggestions), *tags]
+                for word in normalize(text).split(" ")
+            }
+        )
+        since = timezone.localdate() - timedelta(
+            days=getattr(settings, "WAGTAILSEARCH_HITS_MAX_AGE", 7)
+        )
+        queries = []
+
+        for query_string, hits in (
+            Query.get_most_popular(since)
+            .values_list("query_string", "_hits")
+            .iterator(chunk_size=self.queries)
+        ):
+            if in_vocabulary(vocabulary, query_string):
+                queries.append((query_string, query_string, hits, {}))
+
+                if len(queries) == self.queries:
+                    break
+
+        index.extend("query", queries)
+
+        with self.lock:
+            self.indexes[locale_id] = index
+            self.tags[locale_id] = tags
+            self.versions[locale_id] = version
+            self.checked[locale_id] = self.built[locale_id] = time.monotonic()
+
+        return index
+
+    def build_later(self, locale_id: int) -> None:
+        """Build the index of a locale in a background thread, once at a time"""
+
+        with self.lock:
+            if locale_id in self.building:
+                return
+
+            self.building.add(locale_id)
+
+        threading.Thread(
+            target=self.rebuild_in_background, args=[locale_id], daemon=True
+        ).start()
+
+    def rebuild_in_background(self, locale_id: int) -> None:
+        try:
+            self.build(locale_id)
+
+        except Exception as e:
+            logger.error("Failed to rebuild suggestions: %s", e, exc_info=True)
+
+        finally:
+            self.building.discard(locale_id)
+            connections.close_all()
+
+    def index(self, locale_id: int) -> Optional[PrefixIndex]:
+        """Index of a locale, built or rebuilt in the background if needed"""
+
+        index = self.indexes.get(locale_id)
+
+        if index is None:
+            self.build_later(locale_id)
+            return None
+
+        now = time.monotonic()
+
+        if now - self.checked.get(locale_id, 0) >= self.refresh:
+            self.checked[locale_id] = now
+
+            outdated = now - self.built.get(
+                locale_id, 0
+            ) >= self.max_age or self.version(locale_id) != self.versions.get(locale_id)
+
+            if outdated:
+                self.build_later(locale_id)
+
+        return index
+
+    def suggest(
+        self, locale_id: int, prefix: str, limit: Optional[int] = None
+    ) -> Dict[str, List[Dict]]:
+        """
+        Suggestions of each kind starting like a prefix
+
+        Args:
+            locale_id (int): Locale of the suggested articles and tags.
+            prefix (str): Text typed so far.
+            limit (int | None): Suggestions per kind.
+        """
+
+        if not normalize(prefix):
+            return {kind: [] for kind in KINDS}
+
+        index = self.index(locale_id)
+
+        # Still building
+        if index is None:
+            return {kind: [] for kind in KINDS}
+
+        return index.search(prefix, limit or self.limit)
+
+    @staticmethod
+    def article(values: Tuple) -> Tuple:
+        """Suggestion of an article, from its id, title, link slug and date"""
+
+        article_id, title, slug, created_at = values
+        url = reverse(f"{APP_NAME}:redirect", args=[slug]) if slug else None
+
+        return article_id, title, created_at.timestamp(), {"id": article_id, "url": url}
+
+    def update(self, article: Article) -> None:
+        """Add, replace or remove an article and its tags after a change"""
+
+        version = self.bump(article.locale_id)
+
+        if article.locale_id not in self.indexes:
+            return
+
+        values = (
+            Article.objects.live()
+            .public()
+            .filter(pk=article.pk)
+            .values_list("id", "title", "link__slug", "created_at")
+            .first()
+        )
+        names = set(
+            ArticleTag.objects.filter(content_object_id=article.pk).values_list(
+                "tag__name", flat=True
+            )
+            if values
+            else []
+        )
+
+        suggestion = None
+
+        if values:
+            with translation.override(article.locale.language_code):
+                suggestion = self.article(values)
+
+        # Read above, the index and its tags change together
+        with self.lock:
+            index = self.indexes.get(article.locale_id)
+
+            if index is None:
+                return
+
+            tags = self.tags[article.locale_id]
+
+            if suggestion:
+                article_id, title, weight, data = suggestion
+                index.add("article", article_id, title, weight, **data)
+
+            else:
+                index.remove("article", article.pk)
+
+            for name in set(tags) | names:
+                article_ids = tags[name]
+
+                if (article.pk in article_ids) == (name in names):
+                    continue
+
+                if name in names:
+                    article_ids.add(article.pk)
+
+                else:
+                    article_ids.discard(article.pk)
+
+                if article_ids:
+                    index.add("tag", name, name, len(article_ids))
+
+                else:
+                    del tags[name]
+                    index.remove("tag", name)
+
+            # Changes of other processes are picked up by the next rebuild
+            if self.versions.get(article.locale_id) == version - 1:
+                self.versions[article.locale_id] = version
+
+    def clear(self) -> None:
+        """Forget every index"""
+
+        with self.lock:
+            self.indexes.clear()
+            self.tags.clear()
+            self.versions.clear()
+            self.checked.clear()
+            self.built.clear()
+            self.building.clear()
+
+
+typeahead = Typeahead()
@@ -8,7 +8,7 @@ from wagtail.contrib.redirects.api import RedirectsAPIViewSet
 from wagtail.documents.api.v2.views import DocumentsAPIViewSet
 from wagtail.images.api.v2.views import ImagesAPIViewSet
 
-from tcn.api.views import ArticleViewSet, CategoryViewSet
+from tcn.api.views import ArticleViewSet, CategoryViewSet, TypeaheadView
 from tcn.api.viewsets import ArticleViewSet as DRFArticleViewSet
 from tcn.api.viewsets import UserViewSet
 
@@ -29,6 +29,7 @@ api_router.register_endpoint("categories", CategoryViewSet)
 api_router.register_endpoint("articles", ArticleViewSet)
 
 urlpatterns = [
+    path("typeahead/", TypeaheadView.as_view(), name="typeahead"),
     path("", include(router.urls)),
     path("", api_router.urls),
 ]
@@ -1,8 +1,13 @@
 """API views"""
 
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from wagtail.api.v2.views import PagesAPIViewSet
 
+from tcn.api.pagination import ArticleKeysetPagination
+from tcn.api.typeahead import typeahead
 from tcn.apps.articles.models import Article
 from tcn.apps.categories.models import Category
 
@@ -24,3 +29,43 @@ class ArticleViewSet(PagesAPIViewSet):
     name = "articles"
     permission_classes = [IsAuthenticated]
     ordering_fields = ["created_at", "updated_at"]
+    pagination_class = ArticleKeysetPagination
+    known_query_parameters = PagesAPIViewSet.known_query_parameters.union(
+        ArticleKeysetPagination.query_parameters
+    )
+
+
+class TypeaheadView(APIView):
+    """
+    Suggestions for a search box, by prefix
+
+    ## Query Parameters
+
+    - **q:** Text typed so far (e.g., `?q=elec`).
+    - **limit:** Suggestions of each type, at most 20.
+
+    Titles and tags of the articles of the active language and popular search
+    queries are answered from memory, without authentication nor database.
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    max_limit = 20
+
+    def get(self, request: Request) -> Response:
+        query = request.query_params.get("q", "")
+
+        try:
+            limit = min(int(request.query_params["limit"]), self.max_limit)
+
+        except (KeyError, ValueError):
+            limit = None
+
+        return Response(
+            {
+                "q": query,
+                "results": typeahead.suggest(
+                    request.locale.id, query, limit if limit and limit > 0 else None
+                ),
+            }
+        )
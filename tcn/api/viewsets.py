@@ -1,7 +1,5 @@
 """API endpoints for tcn.apps.users"""
 
-from django.conf import settings
-from django.utils.translation import get_language_from_request
 from django.utils.translation import gettext_lazy as _
 from djoser.views import UserViewSet as BaseUVS
 from rest_framework import status
@@ -10,8 +8,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import ReadOnlyModelViewSet
-from wagtail.models import Locale
 
+from tcn.api.pagination import ArticleCursorPagination
 from tcn.api.serializers import ArticleSerializer
 from tcn.apps.articles.models import Article
 
@@ -158,19 +156,12 @@ class ArticleViewSet(ReadOnlyModelViewSet):
     permission_classes = [IsAuthenticated]
     search_fields = ["title"]
     ordering_fields = ["created_at", "updated_at", "title"]
+    pagination_class = ArticleCursorPagination
 
     def get_queryset(self):
         """Filter queryset by language"""
 
-        lang = get_language_from_request(self.request, check_path=True)
-
-        try:
-            locale = Locale.objects.get(language_code=lang)
-
-        except Locale.DoesNotExist:
-            locale = Locale.objects.get(language_code=settings.LANGUAGE_CODE)
-
-        return super().get_queryset().filter(locale=locale)
+        return super().get_queryset().filter(locale=self.request.locale)
 
     @action(detail=True, methods=["post"], permission_classes=[IsAuthenticated])
     def save(self, request: Request, slug: str, *args, **kwargs) -> Response:
@@ -9,3 +9,10 @@ class ArticlesConfig(AppConfig):
 
     name = "tcn.apps.articles"
     default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self) -> None:
+        """Register signal receivers"""
+
+        from tcn.apps.articles.signals import register_article_signal_receivers
+
+        register_article_signal_receivers()
@@ -0,0 +1,116 @@
+"""Cached article counts, so paginated pages need no `COUNT(*)`"""
+
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Count, Q, QuerySet
+from wagtail.models import Page
+
+from tcn.apps.articles.models import Article
+
+Scope = Tuple
+
+
+# Create your counters here.
+class ArticleCounter:
+    """
+    Number of live articles per locale, category and owner
+
+    Counts are read from the cache, and counted once on a miss. Publishing,
+    unpublishing or moving an article counts its scopes again in a single
+    aggregate query, deleting it forgets them until the next read. Wagtail
+    does not tell a first publication from a new revision, so the counts
+    of the scopes are stored rather than incremented. Counts expire after
+    `timeout` seconds, so a missed signal is only wrong for that long.
+
+    Scopes:
+        (`locale`, locale_id): Live public articles of a locale.
+        (`category`, category_id): Live children of a category.
+        (`owner`, owner_id, locale_id): Live public articles of an owner.
+    """
+
+    key_prefix = "tcn:counts"
+
+    def __init__(
+        self, cache_alias: str = "default", timeout: Optional[int] = None
+    ) -> None:
+        self.cache_alias = cache_alias
+        self.timeout = timeout or getattr(settings, "ARTICLE_COUNTS_TIMEOUT", 300)
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def key(self, scope: Scope) -> str:
+        return ":".join([self.key_prefix, *map(str, scope)])
+
+    def count(self, queryset: QuerySet, *scope) -> int:
+        """
+        Cached count of a queryset
+
+        Args:
+            queryset (QuerySet): Articles of the scope, counted on a miss.
+            scope: Scope of the queryset, see the class documentation.
+        """
+
+        return self.cache.get_or_set(
+            self.key(scope), queryset.count, timeout=self.timeout
+        )
+
+    def scopes(self, article: Article) -> List[Scope]:
+        scopes = [("locale", article.locale_id)]
+
+        if article.owner_id:
+            scopes.append(("owner", article.owner_id, article.locale_id))
+
+        return scopes
+
+    def refresh(self, article: Article) -> Dict[str, int]:
+        """Count the scopes of an article again"""
+
+        public = ~Article.objects.private_q()
+        parent_path = article.path[: -Page.steplen]
+        counts = (
+            Article.objects.live()
+            .filter(locale_id=article.locale_id)
+            .aggregate(
+                locale=Count("pk", filter=public),
+                owner=Count("pk", filter=public & Q(owner_id=article.owner_id)),
+                category=Count(
+                    "pk",
+                    filter=Q(path__startswith=parent_path, depth=article.depth),
+                ),
+            )
+        )
+
+        values = {self.key(scope): counts[scope[0]] for scope in self.scopes(article)}
+        parent_id = self.parent_id(article)
+
+        if parent_id:
+            values[self.key(("category", parent_id))] = counts["category"]
+
+        self.cache.set_many(values, timeout=self.timeout)
+
+        return counts
+
+    def forget(self, article: Article, parent_id: Optional[int] = None) -> None:
+        """Drop the counts of the scopes of an article"""
+
+        keys = [self.key(scope) for scope in self.scopes(article)]
+        parent_id = parent_id or self.parent_id(article)
+
+        if parent_id:
+            keys.append(self.key(("category", parent_id)))
+
+        self.cache.delete_many(keys)
+
+    def parent_id(self, article: Article) -> Optional[int]:
+        return (
+            Page.objects.filter(path=article.path[: -Page.steplen])
+            .values_list("id", flat=True)
+            .first()
+        )
+
+
+article_counter = ArticleCounter()
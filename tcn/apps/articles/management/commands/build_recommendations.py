@@ -0,0 +1,47 @@
+"""Build article recommendations"""
+
+from django.core.management.base import BaseCommand
+from wagtail.models import Locale
+
+from tcn.apps.articles.models import Article
+from tcn.apps.articles.recommendations import (
+    SimilarityIndex,
+    update_recommendations,
+)
+
+
+# Create your commands here.
+class Command(BaseCommand):
+    """Store the most similar articles of every live article"""
+
+    help = "Compute content similarity across articles and store recommendations"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=5000,
+            help="Number of latest articles to index per locale (default: 5000)",
+        )
+
+    def handle(self, *args, **options):
+        for locale in Locale.objects.all():
+            articles = list(
+                Article.objects.live()
+                .public()
+                .filter(locale=locale)
+                .prefetch_related("tags")
+                .order_by("-created_at")[: options["limit"]]
+            )
+
+            if not articles:
+                continue
+
+            index = SimilarityIndex(articles)
+
+            for article in articles:
+                update_recommendations(article, index)
+
+            self.stdout.write(
+                f"{locale.language_code}: {len(articles)} articles updated"
+            )
@@ -0,0 +1,96 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("articles", "0007_article_indexes"),
+    ]
+
+    # Recommendations are computed again by `build_recommendations`
+    operations = [
+        migrations.RemoveField(
+            model_name="article",
+            name="recommendations",
+        ),
+        migrations.CreateModel(
+            name="Recommendation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "rank",
+                    models.PositiveSmallIntegerField(
+                        help_text="Position in the recommendations, most similar first",
+                        verbose_name="rank",
+                    ),
+                ),
+                (
+                    "score",
+                    models.FloatField(
+                        help_text="Similarity score", verbose_name="score"
+                    ),
+                ),
+                (
+                    "article",
+                    models.ForeignKey(
+                        help_text="Recommending article",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="similar",
+                        to="articles.article",
+                        verbose_name="article",
+                    ),
+                ),
+                (
+                    "recommended",
+                    models.ForeignKey(
+                        help_text="Recommended article",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="recommended_by",
+                        to="articles.article",
+                        verbose_name="recommended",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Recommendation",
+                "verbose_name_plural": "Recommendations",
+                "ordering": ["article", "rank"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("article", "recommended"),
+                        name="unique_recommendation",
+                    ),
+                    models.UniqueConstraint(
+                        fields=("article", "rank"),
+                        name="unique_recommendation_rank",
+                    ),
+                ],
+            },
+        ),
+        # The table of the through model is the whole field, no column to add
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddField(
+                    model_name="article",
+                    name="recommendations",
+                    field=models.ManyToManyField(
+                        help_text="recommendations",
+                        through="articles.Recommendation",
+                        through_fields=("article", "recommended"),
+                        to="articles.article",
+                        verbose_name="Similar articles",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -1,6 +1,10 @@
 """Article model"""
 
+from typing import List, Optional
+
 from django.db import models
+from django.db.models import JSONField, OuterRef, Prefetch, Subquery, Value
+from django.db.models.functions import JSONObject, Length, Substr
 from django.urls import reverse_lazy
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -10,7 +14,8 @@ from wagtail.admin.panels import FieldPanel
 from wagtail.api import APIField
 from wagtail.fields import StreamField
 from wagtail.images import get_image_model
-from wagtail.models import Page
+from wagtail.models import Page, PageManager
+from wagtail.query import PageQuerySet
 from wagtail.search import index
 
 from tcn import APP_NAME
@@ -19,6 +24,92 @@ from tcn.cms.blocks import MediaBlock
 
 Image = get_image_model()
 
+# Renditions used by the article card templates
+CARD_RENDITIONS = ["fill-1920x1080", "fill-1080x1080"]
+
+# Fields of the parent category read along with the articles, enough to link it
+PARENT_FIELDS = [
+    "id",
+    "path",
+    "depth",
+    "title",
+    "slug",
+    "url_path",
+    "locale_id",
+    "content_type_id",
+]
+
+
+class ArticleQuerySet(PageQuerySet):
+    """Article querysets"""
+
+    def descendant_of_q(self, other, inclusive=False):
+        """
+        Descendants of a page by a range of paths
+
+        Every descendant path starts with the path of `other`, followed by
+        characters of the path alphabet, so they sort between that path and
+        the same path padded with the last letter of the alphabet. Unlike the
+        `LIKE 'path%'` of `startswith`, which SQLite never serves from an
+        index, the range is an index seek on every backend.
+        """
+
+        last = Page.alphabet[-1] * (
+            Page._meta.get_field("path").max_length - len(other.path)
+        )
+        q = models.Q(path__range=(other.path, other.path + last))
+        q &= models.Q(depth__gte=other.depth)
+
+        if not inclusive:
+            q &= ~models.Q(pk=other.pk)
+
+        return q
+
+    def with_card_data(self, renditions: Optional[List[str]] = CARD_RENDITIONS):
+        """
+        Fetch everything an article card renders in a fixed number of queries
+
+        The short link is joined, the fields of the parent category are read
+        by a subquery seeking its path for `get_parent`, and the images are
+        prefetched with their renditions.
+
+        Args:
+            renditions (List | None): Image filter specs to prefetch, `None`
+                skips the images.
+        """
+
+        parents = Page.objects.filter(
+            path=Substr(OuterRef("path"), 1, Length(OuterRef("path")) - Page.steplen)
+        ).order_by()
+        queryset = self.select_related("link").annotate(
+            card_parent=Subquery(
+                parents.values(
+                    data=JSONObject(**{field: field for field in PARENT_FIELDS})
+                )[:1]
+            )
+        )
+
+        if renditions is not None:
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "image", queryset=Image.objects.prefetch_renditions(*renditions)
+                )
+            )
+
+        return queryset
+
+    def without_card_data(self):
+        """Undo `with_card_data`, for querysets that only read ids"""
+
+        return (
+            self.select_related(None)
+            .prefetch_related(None)
+            .annotate(card_parent=Value(None, output_field=JSONField()))
+        )
+
+
+ArticleManager = PageManager.from_queryset(ArticleQuerySet)
+
 
 # Create your models here.
 class Article(DateTimeMixin, Page):
@@ -61,11 +152,15 @@ class Article(DateTimeMixin, Page):
     )
     recommendations = models.ManyToManyField(
         "self",
-        symmetrical=True,
+        symmetrical=False,
+        through="Recommendation",
+        through_fields=("article", "recommended"),
         help_text=_("recommendations"),
         verbose_name=_("Similar articles"),
     )
 
+    objects = ArticleManager()
+
     context_object_name = "article"
     template = "tcn/articles/id.html"
     page_description = _("News Articles")
@@ -109,15 +204,65 @@ class Article(DateTimeMixin, Page):
 
         verbose_name = _("News article")
         verbose_name_plural = _("News articles")
+        indexes = [
+            # Newest first listings and their keyset pages
+            models.Index(
+                fields=["-created_at", "-page_ptr"], name="articles_created_idx"
+            ),
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(is_breaking=True),
+                name="articles_breaking_idx",
+            ),
+        ]
 
     def get_context(self, request, *args, **kwargs):
         return {
             **super().get_context(request, *args, **kwargs),
-            "recommendations": self.get_siblings(inclusive=False)
-            .specific()
-            .order_by("?")[:6],
+            "recommendations": self.get_recommendations(),
         }
 
+    def get_recommendations(self, size: int = 6):
+        """Precomputed similar articles, most similar first, or the latest ones"""
+
+        recommendations = (
+            self.recommendations.live()
+            .public()
+            .with_card_data()
+            .order_by("recommended_by__rank")[:size]
+        )
+
+        if recommendations:
+            return recommendations
+
+        return (
+            Article.objects.sibling_of(self, inclusive=False)
+            .live()
+            .public()
+            .with_card_data()
+            .order_by("-created_at")[:size]
+        )
+
+    def get_parent(self, update: bool = False) -> Optional[Page]:
+        """Parent category, from the fields read by `with_card_data` if any"""
+
+        parent = getattr(self, "card_parent", None)
+
+        if update or parent is None:
+            return super().get_parent(update=update)
+
+        if isinstance(parent, dict):
+            fields = [
+                field.attname
+                for field in Page._meta.concrete_fields
+                if field.attname in parent
+            ]
+            parent = self.card_parent = Page.from_db(
+                self._state.db, fields, [parent[field] for field in fields]
+            )
+
+        return parent
+
     @cached_property
     def short_link(self) -> str:
         """Returns article's short link
@@ -130,3 +275,48 @@ class Article(DateTimeMixin, Page):
             return reverse_lazy(f"{APP_NAME}:redirect", args=[self.link.slug])
 
         return self.url
+
+
+class Recommendation(models.Model):
+    """Similar article of an article, ranked by similarity"""
+
+    article = models.ForeignKey(
+        Article,
+        on_delete=models.CASCADE,
+        related_name="similar",
+        verbose_name=_("article"),
+        help_text=_("Recommending article"),
+    )
+    recommended = models.ForeignKey(
+        Article,
+        on_delete=models.CASCADE,
+        related_name="recommended_by",
+        verbose_name=_("recommended"),
+        help_text=_("Recommended article"),
+    )
+    rank = models.PositiveSmallIntegerField(
+        verbose_name=_("rank"),
+        help_text=_("Position in the recommendations, most similar first"),
+    )
+    score = models.FloatField(
+        verbose_name=_("score"),
+        help_text=_("Similarity score"),
+    )
+
+    class Meta:
+        """Meta data"""
+
+        ordering = ["article", "rank"]
+        verbose_name = _("Recommendation")
+        verbose_name_plural = _("Recommendations")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["article", "recommended"], name="unique_recommendation"
+            ),
+            models.UniqueConstraint(
+                fields=["article", "rank"], name="unique_recommendation_rank"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.article} -> {self.recommended}"
@@ -0,0 +1,272 @@
+"""Content based article recommendations"""
+
+import logging
+import math
+import re
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import QuerySet
+
+from tcn.apps.articles.models import Article, Recommendation
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"\w{3,}", re.UNICODE)
+
+# Weights of the signals besides text similarity
+TAG_WEIGHT = 0.3
+COUNTRY_WEIGHT = 0.1
+CATEGORY_WEIGHT = 0.2
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words of three or more characters, in any script"""
+
+    return [token.lower() for token in TOKEN_RE.findall(text) if not token.isdigit()]
+
+
+def article_text(article: Article) -> str:
+    """Title, headline and StreamField text of an article"""
+
+    content = article.content.stream_block.get_searchable_content(article.content)
+
+    return " ".join([article.title, article.headline, *map(str, content)])
+
+
+# Create your recommendation engines here.
+class SimilarityIndex:
+    """
+    TF-IDF index over a set of articles
+
+    Documents are sparse, L2-normalized TF-IDF vectors kept in an inverted
+    index, so scoring an article only visits the articles that share at least
+    one term with it. Shared tags, country and category are added on top of
+    the cosine similarity.
+    """
+
+    def __init__(self, articles: Iterable[Article], max_df: float = 0.5) -> None:
+        terms = {}
+        self.tags = {}
+        self.countries = {}
+        self.by_tag = defaultdict(list)
+        self.by_parent = defaultdict(list)
+
+        for article in articles:
+            terms[article.id] = Counter(tokenize(article_text(article)))
+            self.tags[article.id] = {tag.id for tag in article.tags.all()}
+            self.countries[article.id] = (
+                article.country.code if article.country else None
+            )
+
+            for tag in self.tags[article.id]:
+                self.by_tag[tag].append(article.id)
+
+            self.by_parent[article.path[: -Article.steplen]].append(article.id)
+
+        df = Counter(term for counts in terms.values() for term in counts)
+        total = len(terms)
+
+        # Terms present in most documents carry no signal and blow up postings
+        self.idf = {
+            term: math.log((1 + total) / (1 + count)) + 1
+            for term, count in df.items()
+            if total < 10 or count <= max_df * total
+        }
+        self.vectors = {
+            article_id: self.vectorize(counts) for article_id, counts in terms.items()
+        }
+        self.postings = defaultdict(list)
+
+        for article_id, vector in self.vectors.items():
+            for term, weight in vector.items():
+                self.postings[term].append((article_id, weight))
+
+    def vectorize(self, counts: Counter) -> Dict[str, float]:
+        """Normalized TF-IDF vector of term counts"""
+
+        vector = {
+            term: (1 + math.log(count)) * self.idf[term]
+            for term, count in counts.items()
+            if term in self.idf
+        }
+        norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1
+
+        return {term: weight / norm for term, weight in vector.items()}
+
+    def neighbours(self, article: Article, size: Optional[int] = None) -> List[int]:
+        """Ids of the most similar articles in the index, see `similar`"""
+
+        return [other for other, _ in self.similar(article, size)]
+
+    def similar(
+        self, article: Article, size: Optional[int] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Most similar articles in the index, and their scores
+
+        Args:
+            article (Article): An article, indexed or not.
+            size (int | None): Number of neighbours.
+
+        Returns:
+            List: Article ids and scores, most similar first.
+        """
+
+        size = size or getattr(settings, "RECOMMENDATIONS_SIZE", 6)
+        vector = self.vectors.get(article.id) or self.vectorize(
+            Counter(tokenize(article_text(article)))
+        )
+        tags = {tag.id for tag in article.tags.all()}
+        country = article.country.code if article.country else None
+        scores = defaultdict(float)
+
+        for term, weight in vector.items():
+            for other, other_weight in self.postings.get(term, []):
+                scores[other] += weight * other_weight
+
+        shared = Counter(other for tag in tags for other in self.by_tag.get(tag, []))
+
+        for other, count in shared.items():
+            # Jaccard similarity of the tag sets
+            union = len(tags) + len(self.tags[other]) - count
+            scores[other] += TAG_WEIGHT * count / union
+
+        for other in self.by_parent.get(article.path[: -Article.steplen], []):
+            scores[other] += CATEGORY_WEIGHT
+
+        if country:
+            for other in scores:
+                if self.countries.get(other) == country:
+                    scores[other] += COUNTRY_WEIGHT
+
+        scores.pop(article.id, None)
+
+        return [
+            (other, score)
+            for other, score in sorted(
+                scores.items(), key=lambda item: item[1], reverse=True
+            )[:size]
+            if score > 0
+        ]
+
+
+def candidates(article: Article, limit: int = 1000) -> QuerySet[Article]:
+    """Latest live articles in the locale of an article"""
+
+    return (
+        Article.objects.live()
+        .public()
+        .filter(locale_id=article.locale_id)
+        .exclude(id=article.id)
+        .prefetch_related("tags")
+        .order_by("-created_at")[:limit]
+    )
+
+
+def update_recommendations(
+    article: Article, index: Optional[SimilarityIndex] = None
+) -> List[int]:
+    """
+    Store the nearest neighbours of an article in `Article.recommendations`
+
+    Only the recommendations of the article itself are replaced, articles
+    that recommend it keep theirs.
+
+    Args:
+        article (Article): Article to update.
+        index (SimilarityIndex | None): Index to search, by default one is
+            built from the latest articles of the same locale.
+
+    Returns:
+        List: Ids of the recommended articles, most similar first.
+    """
+
+    index = index or SimilarityIndex(candidates(article))
+    similar = index.similar(article)
+
+    with transaction.atomic():
+        Recommendation.objects.filter(article=article).delete()
+        Recommendation.objects.bulk_create(
+            [
+                Recommendation(
+                    article=article, recommended_id=other, rank=rank, score=score
+                )
+                for rank, (other, score) in enumerate(similar)
+            ]
+        )
+
+    return [other for other, _ in similar]
+
+
+class RecommendationQueue:
+    """
+    Worker that stores the recommendations of published articles
+
+    Articles are handed over once the transaction that published them
+    commits, and their similarity index is built in a worker thread, so
+    publishing never waits for it. With no workers the recommendations are
+    stored inline instead.
+    """
+
+    def __init__(self, workers: Optional[int] = None) -> None:
+        self.workers = (
+            getattr(settings, "RECOMMENDATION_WORKERS", 1)
+            if workers is None
+            else workers
+        )
+        self.lock = Lock()
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    def update(self, article_id: int) -> Optional[List[int]]:
+        """Store the recommendations of an article, if it is still live"""
+
+        article = (
+            Article.objects.live()
+            .filter(pk=article_id)
+            .prefetch_related("tags")
+            .first()
+        )
+
+        if article is None:
+            return None
+
+        return update_recommendations(article)
+
+    def update_in_background(self, article_id: int) -> Optional[List[int]]:
+        """Update from the worker, then release its database connections"""
+
+        try:
+            return self.update(article_id)
+
+        except Exception:
+            logger.exception("Could not update the recommendations of %s", article_id)
+            return None
+
+        finally:
+            connections.close_all()
+
+    def submit(self, article_id: int) -> None:
+        """Update the recommendations of an article once the transaction commits"""
+
+        transaction.on_commit(lambda: self.dispatch(article_id))
+
+    def dispatch(self, article_id: int) -> Optional[Future]:
+        if not self.workers:
+            self.update(article_id)
+            return None
+
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="recommendations"
+                )
+
+        return self.executor.submit(self.update_in_background, article_id)
+
+
+recommendation_queue = RecommendationQueue()
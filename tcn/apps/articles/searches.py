@@ -0,0 +1,136 @@
+"""Cached article search results, so later pages do not search again"""
+
+import hashlib
+import json
+import time
+from collections.abc import Sequence
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from wagtail.search.utils import normalise_query_string
+
+from tcn.apps.articles.models import ArticleQuerySet
+
+
+class SearchResults(Sequence):
+    """
+    Articles of an ordered id list, fetched a slice at a time
+
+    Paginating it with `django.core.paginator.Paginator` counts the ids and
+    only fetches the articles of the requested page.
+    """
+
+    def __init__(self, queryset: ArticleQuerySet, ids: List[int]) -> None:
+        self.queryset = queryset
+        self.ids = ids
+
+    def __repr__(self) -> str:
+        return f"<Search results of {len(self)} articles>"
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index : index + 1 or None][0]
+
+        ids = self.ids[index]
+        articles = self.queryset.in_bulk(ids)
+
+        # Articles unpublished since the search are left out
+        return [articles[pk] for pk in ids if pk in articles]
+
+
+# Create your caches here.
+class SearchResultCache:
+    """
+    Ordered ids of the results of article searches
+
+    Ids are cached per normalized query and scope, such as the locale and the
+    filters, so the pages of a search run the search once and then only fetch
+    their own articles. Publishing, unpublishing, moving or deleting an
+    article bumps a generation that is part of every key, outdated results
+    are never read again and expire after `timeout` seconds. The generation
+    is shared by every process through the cache, and starts from the clock
+    so an evicted one never revives older results. At most `size` results
+    are kept per search.
+    """
+
+    key_prefix = "tcn:searches"
+
+    def __init__(
+        self,
+        cache_alias: str = "default",
+        size: Optional[int] = None,
+        timeout: Optional[int] = None,
+    ) -> None:
+        self.cache_alias = cache_alias
+        self.size = size or getattr(settings, "SEARCH_RESULTS_SIZE", 1000)
+        self.timeout = timeout or getattr(settings, "SEARCH_RESULTS_TIMEOUT", 15 * 60)
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def key(self, *parts) -> str:
+        return ":".join([self.key_prefix, *map(str, parts)])
+
+    def generation(self) -> int:
+        return self.cache.get_or_set(self.key("generation"), time.time_ns, timeout=None)
+
+    def bump(self) -> None:
+        """Outdate every cached search"""
+
+        try:
+            self.cache.incr(self.key("generation"))
+
+        except ValueError:
+            # Missing or evicted, start over from the clock
+            self.cache.set(self.key("generation"), time.time_ns(), timeout=None)
+
+    def search(self, queryset: ArticleQuerySet, query: str) -> List[int]:
+        """Ids of the best results of a search, best first"""
+
+        # Only the ids are read, pages fetch their articles with the card data
+        queryset = queryset.without_card_data().only("pk")
+
+        return [article.pk for article in queryset.search(query)[: self.size]]
+
+    def ids(
+        self, queryset: ArticleQuerySet, query: str, scope: Optional[Dict] = None
+    ) -> List[int]:
+        """
+        Cached ids of the results of a search
+
+        Args:
+            queryset (ArticleQuerySet): Searched articles.
+            query (str): Query as typed by the reader.
+            scope (Dict | None): Everything the queryset depends on besides
+                the query, `None` to search without caching.
+        """
+
+        if scope is None:
+            return self.search(queryset, query)
+
+        digest = hashlib.sha1(
+            json.dumps(
+                [normalise_query_string(query), scope], sort_keys=True, default=str
+            ).encode()
+        ).hexdigest()
+
+        return self.cache.get_or_set(
+            self.key(self.generation(), digest),
+            lambda: self.search(queryset, query),
+            timeout=self.timeout,
+        )
+
+    def results(
+        self, queryset: ArticleQuerySet, query: str, scope: Optional[Dict] = None
+    ) -> SearchResults:
+        """Results of a search, to paginate, see `ids` for the arguments"""
+
+        return SearchResults(queryset, self.ids(queryset, query, scope))
+
+
+search_cache = SearchResultCache()
@@ -0,0 +1,57 @@
+"""Signals to keep article recommendations, counts and searches up to date"""
+
+from django.db.models.signals import post_delete
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from tcn.apps.articles.counts import article_counter
+from tcn.apps.articles.models import Article
+from tcn.apps.articles.recommendations import recommendation_queue
+from tcn.apps.articles.searches import search_cache
+
+
+def recommend_similar_articles(sender, **kwargs):
+    """Store the most similar articles of a published article, off the request"""
+
+    recommendation_queue.submit(kwargs["instance"].pk)
+
+
+def count_articles(sender, **kwargs):
+    """Count the articles of the locale, category and owner of an article again"""
+
+    article_counter.refresh(kwargs["instance"])
+
+
+def move_article_count(sender, **kwargs):
+    """Count the articles of the previous and new categories of a moved article"""
+
+    article = kwargs["instance"]
+
+    if kwargs["parent_page_before"] != kwargs["parent_page_after"]:
+        article_counter.forget(article, parent_id=kwargs["parent_page_before"].id)
+
+    article_counter.refresh(article)
+
+
+def forget_article_count(sender, **kwargs):
+    """Count the articles of a deleted article scopes on their next read"""
+
+    article_counter.forget(kwargs["instance"])
+
+
+def outdate_searches(sender, **kwargs):
+    """Search again once an article is published, unpublished, moved or deleted"""
+
+    search_cache.bump()
+
+
+def register_article_signal_receivers():
+    """Register `recommend_similar_articles`, article count and search signals"""
+
+    page_published.connect(recommend_similar_articles, sender=Article)
+    page_published.connect(count_articles, sender=Article)
+    page_unpublished.connect(count_articles, sender=Article)
+    post_page_move.connect(move_article_count, sender=Article)
+    post_delete.connect(forget_article_count, sender=Article)
+
+    for signal in [page_published, page_unpublished, post_page_move, post_delete]:
+        signal.connect(outdate_searches, sender=Article)
@@ -1 +1,47 @@
 """Tests for tcn.apps.articles"""
+
+from wagtail.images import get_image_model
+from wagtail.images.tests.utils import get_test_image_file
+
+from tcn.apps.articles.models import Article
+from tcn.apps.categories.models import Category, CategoryIndex
+from tcn.apps.home.models import Home
+
+Image = get_image_model()
+
+
+# Create your test utilities here.
+def create_category(slug: str = "world", **kwargs) -> Category:
+    """Create a category under the category index of the default home page"""
+
+    home = Home.objects.first()
+    index = home.get_children().type(CategoryIndex).first()
+
+    if index is None:
+        index = home.add_child(instance=CategoryIndex(title="News", slug="news"))
+
+    return index.specific.add_child(
+        instance=Category(title=slug.title(), slug=slug, **kwargs)
+    )
+
+
+def create_article(category: Category, slug: str, **kwargs) -> Article:
+    """Create and publish an article in a category"""
+
+    image = Image.objects.first() or Image.objects.create(
+        title="Image", file=get_test_image_file()
+    )
+    article = category.add_child(
+        instance=Article(
+            title=kwargs.pop("title", slug.replace("-", " ").title()),
+            slug=slug,
+            image=image,
+            headline=kwargs.pop("headline", "Headline"),
+            content=kwargs.pop("content", []),
+            **kwargs,
+        )
+    )
+    article.save_revision().publish()
+    article.refresh_from_db()
+
+    return article
@@ -0,0 +1,95 @@
+"""Tests for tcn.apps.articles.counts"""
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tcn.apps.articles.counts import article_counter
+from tcn.apps.articles.models import Article
+from tcn.apps.articles.tests import create_article, create_category
+
+
+# Create your tests here.
+class ArticleCounterTests(TestCase):
+    """Article counter tests"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup data"""
+
+        cls.category = create_category()
+        cls.other = create_category("sports")
+        cls.articles = [create_article(cls.category, f"count-{i}") for i in range(3)]
+
+    def setUp(self) -> None:
+        cache.clear()
+
+        # `public()` looks up the view restrictions as it is built
+        self.public = Article.objects.live().public()
+
+    def category_count(self, category) -> int:
+        return article_counter.count(
+            Article.objects.child_of(category).live(), "category", category.id
+        )
+
+    def locale_count(self) -> int:
+        return article_counter.count(
+            self.public.filter(locale_id=self.category.locale_id),
+            "locale",
+            self.category.locale_id,
+        )
+
+    def test_count(self) -> None:
+        """Test that counts are only queried on a miss"""
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.category_count(self.category), 3)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.category_count(self.category), 3)
+
+    def test_publish_unpublish(self) -> None:
+        """Test that publishing and unpublishing count the scopes again"""
+
+        article = create_article(self.category, "count-3")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.category_count(self.category), 4)
+            self.assertEqual(self.locale_count(), 4)
+
+        article.unpublish()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.category_count(self.category), 3)
+            self.assertEqual(self.locale_count(), 3)
+
+    def test_move_delete(self) -> None:
+        """Test that moving and deleting update the counts of both categories"""
+
+        self.assertEqual(self.category_count(self.other), 0)
+
+        article = self.articles[0]
+        article.move(self.other, pos="last-child")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.category_count(self.other), 1)
+
+        self.assertEqual(self.category_count(self.category), 2)
+
+        Article.objects.get(id=article.id).delete()
+
+        self.assertEqual(self.category_count(self.other), 0)
+        self.assertEqual(self.locale_count(), 2)
+
+    def test_category_page(self) -> None:
+        """Test that category pages do not count their articles"""
+
+        self.client.get(self.category.get_url())
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.category.get_url())
+
+        self.assertFalse(
+            [query for query in queries if "COUNT(" in query["sql"].upper()]
+        )
@@ -1,8 +1,75 @@
 """Tests for tcn.apps.articles.models"""
 
-from django.test import TestCase
+from django.db import connection
+from django.template.loader import render_to_string
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from tcn.apps.articles.models import Article
+from tcn.apps.articles.tests import create_article, create_category
+
+CARD_TEMPLATES = [
+    "tcn/components/article.html",
+    "tcn/components/article-1.html",
+    "tcn/components/article-2.html",
+    "tcn/components/article-li.html",
+]
 
 
 # Create your tests here.
 class ArticleTests(TestCase):
     """Article model tests"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup data"""
+
+        cls.category = create_category()
+        cls.articles = [create_article(cls.category, f"card-{i}") for i in range(6)]
+
+    def render_cards(self, size: int) -> int:
+        """Number of queries to render every card of `size` articles"""
+
+        request = RequestFactory().get("/")
+
+        with CaptureQueriesContext(connection) as queries:
+            articles = Article.objects.live().with_card_data().order_by("-created_at")
+
+            for article in articles[:size]:
+                for template in CARD_TEMPLATES:
+                    render_to_string(template, {"article": article}, request=request)
+
+        return len(queries)
+
+    def test_with_card_data(self) -> None:
+        """Test that cards render in a fixed number of queries"""
+
+        # Generate the renditions and warm the site root paths
+        self.render_cards(1)
+
+        self.assertEqual(self.render_cards(2), self.render_cards(6))
+
+    def test_with_card_data_parent(self) -> None:
+        """Test that parents and links are attached"""
+
+        articles = list(Article.objects.with_card_data(renditions=None))
+
+        with self.assertNumQueries(0):
+            for article in articles:
+                self.assertEqual(article.get_parent().id, self.category.id)
+                self.assertTrue(article.short_link)
+
+    def test_category_page(self) -> None:
+        """Test that category pages render in a fixed number of queries"""
+
+        url = self.category.get_url()
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+
+        create_article(self.category, "card-6")
+        create_article(self.category, "card-7")
+
+        with self.assertNumQueries(len(queries)):
+            self.client.get(url)
@@ -0,0 +1,101 @@
+"""Tests for tcn.apps.paginators"""
+
+import base64
+import json
+
+from django.core.paginator import InvalidPage
+from django.test import TestCase
+
+from tcn.apps.articles.models import Article
+from tcn.apps.articles.tests import create_article, create_category
+from tcn.apps.paginators import CursorPaginator
+
+
+# Create your tests here.
+class CursorPaginatorTests(TestCase):
+    """Keyset paginator tests"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup data"""
+
+        category = create_category()
+        articles = [create_article(category, f"page-{i}") for i in range(5)]
+
+        # Ties on the date are broken by the primary key
+        Article.objects.filter(id__in=[a.id for a in articles[1:3]]).update(
+            created_at=articles[1].created_at
+        )
+        cls.titles = list(
+            Article.objects.order_by("-created_at", "-pk").values_list(
+                "title", flat=True
+            )
+        )
+
+    def setUp(self) -> None:
+        self.paginator = CursorPaginator(Article.objects.all(), 2)
+
+    def titles_of(self, page):
+        return [article.title for article in page]
+
+    def test_forward(self) -> None:
+        """Test walking every page, then back, without counting"""
+
+        titles, pages = [], []
+
+        with self.assertNumQueries(3):
+            page = self.paginator.page()
+
+            while True:
+                pages.append(page)
+                titles += self.titles_of(page)
+
+                if not page.has_next():
+                    break
+
+                page = self.paginator.page(page.next_page_number())
+
+        self.assertEqual(titles, self.titles)
+        self.assertFalse(pages[0].has_previous())
+
+        previous = self.paginator.page(pages[-1].previous_page_number())
+
+        self.assertEqual(self.titles_of(previous), self.titles_of(pages[-2]))
+
+        first = self.paginator.page(pages[1].previous_page_number())
+
+        self.assertEqual(self.titles_of(first), self.titles[:2])
+        self.assertFalse(first.has_previous())
+
+    def test_last(self) -> None:
+        """Test that the last page is read in reverse"""
+
+        page = self.paginator.page("last")
+
+        self.assertEqual(self.titles_of(page), self.titles[-2:])
+        self.assertFalse(page.has_next())
+        self.assertEqual(
+            self.titles_of(self.paginator.page(page.previous_page_number())),
+            self.titles[1:3],
+        )
+
+    def test_invalid_cursor(self) -> None:
+        """Test that tampered cursors are rejected"""
+
+        crafted = [
+            ["a", "x", {"a": 1}],
+            ["a", "2025-13-01T00:00:00+00:00", 1],
+            ["a", 1, 1],
+            ["a", "2025-01-01T00:00:00+00:00", {"a": 1}],
+            ["a", "2025-01-01T00:00:00+00:00", "1"],
+            ["a", "2025-01-01T00:00:00+00:00", True],
+            ["x", "2025-01-01T00:00:00+00:00", 1],
+            {"a": 1},
+        ]
+
+        for cursor in ["nope", "WyJ4IiwxXQ", "last!"] + [
+            base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+            for data in crafted
+        ]:
+            with self.assertRaises(InvalidPage):
+                self.paginator.page(cursor)
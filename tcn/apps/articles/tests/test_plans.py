@@ -0,0 +1,109 @@
+"""Query plans of the hot article, link and user queries"""
+
+import re
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase
+
+from tcn.apps.articles.models import Article
+from tcn.apps.articles.tests import create_article, create_category
+from tcn.apps.links.models import DailyViewers, Link
+
+User = get_user_model()
+
+# Tables read from start to end, an index scan in order stops at the limit
+FULL_SCANS = {
+    "sqlite": re.compile(r"\bSCAN (\w+)\b(?! USING)"),
+    "postgresql": re.compile(r"\bSeq Scan on (\w+)"),
+}
+
+
+# Create your tests here.
+class QueryPlanTests(TestCase):
+    """
+    EXPLAIN the hot queries, none may read a whole table
+
+    The tables of the tests are tiny, PostgreSQL is told to avoid sequential
+    scans so it only picks one when no index fits.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup data"""
+
+        cls.category = create_category()
+        cls.article = create_article(cls.category, "plan", is_breaking=True)
+        cls.home = cls.category.get_parent().get_parent()
+        cls.user = User.objects.create_user(
+            username="planner", email="planner@tests.com", slug="planner"
+        )
+
+    def setUp(self) -> None:
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assertIndexed(self, queryset) -> None:
+        """Fail if the plan of a queryset reads a whole table"""
+
+        if connection.vendor not in FULL_SCANS:
+            self.skipTest(f"No query plan parser for {connection.vendor}")
+
+        plan = queryset.explain()
+
+        self.assertFalse(
+            FULL_SCANS[connection.vendor].findall(plan), f"Full scan in\n{plan}"
+        )
+
+    def test_articles(self) -> None:
+        """Test the listings of articles"""
+
+        articles = Article.objects.live().public()
+        locale = self.article.locale_id
+        created_at, pk = self.article.created_at, self.article.pk
+
+        for queryset in [
+            articles.filter(locale=locale).order_by("-created_at", "-pk")[:26],
+            articles.filter(locale=locale)
+            .filter(Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk))
+            .order_by("-created_at", "-pk")[:26],
+            articles.filter(owner=self.user, locale=locale).order_by("-created_at")[
+                :26
+            ],
+            articles.filter(locale=locale, is_breaking=True).order_by("-created_at")[
+                :25
+            ],
+            Article.objects.child_of(self.category).live().order_by("-created_at")[:26],
+            articles.descendant_of(self.home).order_by("-created_at")[:9],
+        ]:
+            with self.subTest(sql=str(queryset.query)):
+                self.assertIndexed(queryset)
+
+    def test_links(self) -> None:
+        """Test the short links and their views"""
+
+        for queryset in [
+            Link.objects.filter(slug=self.article.link.slug),
+            Link.objects.filter(article__live=True, view_count__gt=0).values_list(
+                "article__locale", "article", "view_count", "article__created_at"
+            ),
+            DailyViewers.objects.filter(
+                locale=self.article.locale_id, date__gte=date(2026, 1, 1)
+            ),
+        ]:
+            with self.subTest(sql=str(queryset.query)):
+                self.assertIndexed(queryset)
+
+    def test_users(self) -> None:
+        """Test the author pages and the bookmarks"""
+
+        for queryset in [
+            User.objects.filter(slug=self.user.slug),
+            Article.objects.live().filter(id__in=self.user.bookmarked_articles.all()),
+            Article.objects.live().filter(owner__in=self.user.following.all()),
+        ]:
+            with self.subTest(sql=str(queryset.query)):
+                self.assertIndexed(queryset)
@@ -0,0 +1,122 @@
+"""Tests for tcn.apps.articles.recommendations"""
+
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from tcn.apps.articles.models import Recommendation
+from tcn.apps.articles.recommendations import (
+    SimilarityIndex,
+    recommendation_queue,
+    tokenize,
+    update_recommendations,
+)
+from tcn.apps.articles.tests import create_article, create_category
+
+
+def paragraph(text: str):
+    return [{"type": "paragraph", "value": f"<p>{text}</p>"}]
+
+
+# Create your tests here.
+@patch.object(recommendation_queue, "workers", 0)
+class RecommendationTests(TestCase):
+    """Recommendation tests"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup data"""
+
+        world, sports = create_category(), create_category("sports")
+
+        with (
+            patch.object(recommendation_queue, "workers", 0),
+            cls.captureOnCommitCallbacks(execute=True),
+        ):
+            cls.create_articles(world, sports)
+
+    @classmethod
+    def create_articles(cls, world, sports) -> None:
+        cls.election = create_article(
+            world,
+            "election",
+            title="Election results announced",
+            content=paragraph("Voters elected a new parliament in the election."),
+        )
+        cls.parliament = create_article(
+            sports,
+            "parliament",
+            title="New parliament meets",
+            content=paragraph("The elected parliament held its first session."),
+        )
+        cls.football = create_article(
+            sports,
+            "football",
+            title="Football final",
+            content=paragraph("The football final ended with a late goal."),
+        )
+
+    def test_tokenize(self) -> None:
+        """Test tokenizer"""
+
+        self.assertEqual(
+            tokenize("The 2025 Election, الانتخابات!"),
+            ["the", "election", "الانتخابات"],
+        )
+
+    def test_neighbours(self) -> None:
+        """Test that text similarity outweighs the category"""
+
+        index = SimilarityIndex([self.election, self.parliament, self.football])
+
+        self.assertEqual(index.neighbours(self.election)[0], self.parliament.id)
+        self.assertEqual(index.neighbours(self.football)[0], self.parliament.id)
+
+    def test_publish_stores_recommendations(self) -> None:
+        """Test that publishing an article stores its neighbours, once committed"""
+
+        self.assertIn(self.parliament, self.election.recommendations.all())
+        self.assertIn(self.parliament, self.election.get_recommendations())
+
+        Recommendation.objects.filter(article=self.football).delete()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.football.save_revision().publish()
+            self.assertFalse(self.football.recommendations.exists())
+
+        self.assertTrue(self.football.recommendations.exists())
+
+    def test_ranks(self) -> None:
+        """Test that recommendations are ranked, and only belong to their article"""
+
+        recommended = update_recommendations(self.election)
+        others = {
+            article.id: list(article.recommendations.values_list("id", flat=True))
+            for article in [self.parliament, self.football]
+        }
+
+        self.assertEqual(
+            [article.id for article in self.election.get_recommendations()],
+            recommended,
+        )
+        self.assertEqual(
+            list(
+                Recommendation.objects.filter(article=self.election).values_list(
+                    "recommended_id", "rank"
+                )
+            ),
+            [(article_id, rank) for rank, article_id in enumerate(recommended)],
+        )
+
+        # Updating an article leaves the articles that recommend it alone
+        update_recommendations(self.election, SimilarityIndex([]))
+
+        self.assertEqual(list(self.election.recommendations.all()), [])
+        self.assertEqual(
+            {
+                article.id: list(article.recommendations.values_list("id", flat=True))
+                for article in [self.parliament, self.football]
+            },
+            others,
+        )
+        self.assertIn(self.election.id, others[self.parliament.id])
@@ -0,0 +1,108 @@
+"""Tests for tcn.apps.articles.searches"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.test import TestCase
+from django.urls import reverse_lazy
+
+from tcn import APP_NAME
+from tcn.apps.articles.models import Article
+from tcn.apps.articles.searches import search_cache
+from tcn.apps.articles.tests import create_article, create_category
+from tcn.cms.search.hits import search_hits
+
+
+# Create your tests here.
+class SearchResultCacheTests(TestCase):
+    """Search result cache tests"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup data"""
+
+        cls.category = create_category()
+        cls.articles = [
+            create_article(cls.category, f"election-{i}", is_breaking=i % 2 == 0)
+            for i in range(5)
+        ]
+        create_article(cls.category, "weather")
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.queryset = Article.objects.live().public().with_card_data()
+        self.scope = {"locale": self.category.locale_id}
+
+    def test_pages(self) -> None:
+        """Test that pages of a cached search only fetch their articles"""
+
+        results = search_cache.results(self.queryset, "election", self.scope)
+
+        self.assertCountEqual(results.ids, [article.id for article in self.articles])
+
+        with patch.object(search_cache, "search") as search:
+            results = search_cache.results(self.queryset, " Election ", self.scope)
+            search.assert_not_called()
+
+        paginator = Paginator(results, 2)
+
+        self.assertEqual(paginator.count, 5)
+
+        # Articles with their links and parents, images and renditions
+        with self.assertNumQueries(3):
+            page = paginator.page(2)
+            self.assertEqual([article.id for article in page], results.ids[2:4])
+            self.assertIsNotNone(page[0].get_parent())
+
+    def test_generation(self) -> None:
+        """Test that publishing outdates cached searches"""
+
+        results = search_cache.results(self.queryset, "election", self.scope)
+        self.assertEqual(len(results), 5)
+
+        create_article(self.category, "election-day")
+        results = search_cache.results(self.queryset, "election", self.scope)
+
+        self.assertEqual(len(results), 6)
+
+        # Other scopes, and uncached searches, search again
+        with patch.object(search_cache, "search", return_value=[]) as search:
+            search_cache.results(self.queryset, "election", {"locale": 0})
+            search_cache.results(self.queryset, "election")
+
+        self.assertEqual(search.call_count, 2)
+
+        # An evicted generation does not revive older results
+        cache.delete(search_cache.key("generation"))
+
+        with patch.object(search_cache, "search", return_value=[]) as search:
+            search_cache.results(self.queryset, "election", self.scope)
+
+        search.assert_called_once()
+
+    @patch.object(search_hits, "interval", 3600)
+    @patch("tcn.ui.views.SearchView.paginate_by", 2)
+    def test_search_view(self) -> None:
+        """Test that later pages of the search view do not search again"""
+
+        self.addCleanup(search_hits.take)
+        url = reverse_lazy(f"{APP_NAME}:search")
+        params = {"search": "election", "is_breaking": "true"}
+        response = self.client.get(url, params)
+        ids = [article.id for article in response.context["search_results"]]
+
+        self.assertEqual(response.context["paginator"].count, 3)
+
+        with patch.object(search_cache, "search") as search:
+            response = self.client.get(url, {**params, "page": "last"})
+            search.assert_not_called()
+
+        ids += [article.id for article in response.context["search_results"]]
+
+        self.assertCountEqual(
+            ids, [article.id for article in self.articles if article.is_breaking]
+        )
+        self.assertContains(
+            response, "?search=election&amp;is_breaking=true&amp;page=1"
+        )
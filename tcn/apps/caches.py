@@ -0,0 +1,43 @@
+"""Cache helpers"""
+
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.memcached import BaseMemcachedCache
+from django.core.cache.backends.redis import RedisCache
+from django.core.management.base import CommandError
+
+
+# Create your helpers here.
+def is_local(cache_alias: str = "default") -> bool:
+    """Whether a cache lives in the memory of this process"""
+
+    return isinstance(caches[cache_alias], LocMemCache)
+
+
+def is_shared(cache_alias: str = "default") -> bool:
+    """
+    Whether a cache is seen by every process, with atomic increments
+
+    The database and file caches are shared too, but increment by reading
+    then writing a value, so concurrent increments are lost.
+    """
+
+    return isinstance(caches[cache_alias], (RedisCache, BaseMemcachedCache))
+
+
+def require_shared(cache_alias: str = "default") -> None:
+    """
+    Refuse to run a command without a shared cache
+
+    On a cache local to its process, a command would read and write entries
+    no other process sees, and that are gone once it exits.
+
+    Raises:
+        CommandError: If the cache is not shared.
+    """
+
+    if not is_shared(cache_alias):
+        raise CommandError(
+            f"The {cache_alias!r} cache is not shared by every process, "
+            "configure Redis with REDIS_URL first"
+        )
@@ -8,7 +8,10 @@ from wagtail.fields import RichTextField
 from wagtail.models import Page
 from wagtail.search import index
 
+from tcn.apps.articles.counts import article_counter
+from tcn.apps.articles.models import Article
 from tcn.apps.mixins import ChildPaginatorMixin, DateTimeMixin
+from tcn.apps.paginators import CursorPaginator
 
 
 # Create your models here.
@@ -54,6 +57,8 @@ class Category(DateTimeMixin, ChildPaginatorMixin, Page):
         help_text=_("Wether to display the name of the owner of news article"),
     )
 
+    # Children are ordered by `created_at`, paginated by keyset
+    paginator_class = CursorPaginator
     show_in_menus = True
     context_object_name = "category"
     template = "tcn/categories/id.html"
@@ -88,4 +93,14 @@ class Category(DateTimeMixin, ChildPaginatorMixin, Page):
     def get_ordered_children(self):
         """Order the children of category"""
 
-        return self.get_children().order_by("-article__created_at")
+        return (
+            Article.objects.child_of(self)
+            .live()
+            .with_card_data()
+            .order_by("-created_at")
+        )
+
+    def get_paginate_count(self, queryset):
+        """Cached number of live articles of the category"""
+
+        return article_counter.count(queryset, "category", self.id)
@@ -9,3 +9,10 @@ class FeedsConfig(AppConfig):
 
     name = "tcn.apps.feeds"
     default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self) -> None:
+        """Register signal receivers"""
+
+        from tcn.apps.feeds.signals import register_feed_signal_receivers
+
+        register_feed_signal_receivers()
@@ -1,13 +1,14 @@
 """Base classes for reuse"""
 
-from django.conf import settings
 from django.contrib.syndication.views import Feed
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
 from django.utils.feedgenerator import Atom1Feed
-from django.utils.translation import get_language
+from django.utils.http import parse_http_date_safe
 from django.utils.translation import gettext_lazy as _
-from wagtail.models import Locale
 
 from tcn.apps.articles.models import Article
+from tcn.apps.feeds.caches import feed_cache
 
 
 # Create your views here.
@@ -19,21 +20,42 @@ class BaseArticleFeed(Feed):
     author_email = "feed@certain.news"
     description = _("Latest new from the World")
 
-    def items(self):
-        """Feed items"""
+    def __call__(self, request, *args, **kwargs):
+        """Serve the pre-rendered feed, or `304 Not Modified`"""
+
+        name = self.__class__.__name__
+        entry = feed_cache.get(name, request)
+
+        if entry is None:
+            entry = feed_cache.set(
+                name, request, super().__call__(request, *args, **kwargs)
+            )
+
+        response = HttpResponse(entry["content"], content_type=entry["content_type"])
+        response.headers["ETag"] = entry["etag"]
 
-        lang = get_language()
+        if entry["last_modified"]:
+            response.headers["Last-Modified"] = entry["last_modified"]
 
-        try:
-            locale = Locale.objects.get(language_code=lang)
+        return get_conditional_response(
+            request,
+            etag=entry["etag"],
+            last_modified=parse_http_date_safe(entry["last_modified"] or ""),
+            response=response,
+        )
+
+    def get_object(self, request, *args, **kwargs):
+        """Locale of the feed"""
 
-        except Locale.DoesNotExist:
-            locale = Locale.objects.get(language_code=settings.LANGUAGE_CODE)
+        return request.locale
+
+    def items(self, locale):
+        """Feed items"""
 
         return (
             Article.objects.live()
             .public()
-            .prefetch_related("link")
+            .with_card_data(renditions=None)
             .filter(locale=locale)
         )
 
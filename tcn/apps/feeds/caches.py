@@ -0,0 +1,85 @@
+"""Pre-rendered feeds"""
+
+import time
+from hashlib import md5
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpRequest, HttpResponse
+from django.utils.http import quote_etag
+
+
+# Create your feed caches here.
+class FeedCache:
+    """
+    Rendered feed documents, per feed, locale, host and scheme
+
+    Entries of a locale share a version, publishing or unpublishing an article
+    bumps it so only the feeds of that locale are rendered again, on their
+    next poll. Versions are shared by every process through the cache, and
+    feeds are rendered again after `timeout` seconds regardless.
+    """
+
+    key_prefix = "tcn:feeds"
+
+    def __init__(
+        self, cache_alias: str = "default", timeout: Optional[int] = None
+    ) -> None:
+        self.cache_alias = cache_alias
+        self.timeout = timeout or getattr(settings, "FEEDS_TIMEOUT", 15 * 60)
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def version(self, locale_id: int) -> int:
+        """Current version of the feeds of a locale"""
+
+        return self.cache.get_or_set(
+            f"{self.key_prefix}:{locale_id}:version", time.time_ns, timeout=None
+        )
+
+    def key(self, name: str, request: HttpRequest) -> str:
+        scheme = "https" if request.is_secure() else "http"
+
+        return f"{self.key_prefix}:{request.locale.id}:{name}:{scheme}:{request.get_host()}"
+
+    def get(self, name: str, request: HttpRequest) -> Optional[Dict]:
+        """Return the rendered feed for a request, if any"""
+
+        return self.cache.get(
+            self.key(name, request), version=self.version(request.locale.id)
+        )
+
+    def set(self, name: str, request: HttpRequest, response: HttpResponse) -> Dict:
+        """Store a rendered feed along with its validators"""
+
+        entry = {
+            "content": response.content,
+            "content_type": response["Content-Type"],
+            "etag": quote_etag(md5(response.content).hexdigest()),
+            "last_modified": response.get("Last-Modified"),
+        }
+        self.cache.set(
+            self.key(name, request),
+            entry,
+            timeout=self.timeout,
+            version=self.version(request.locale.id),
+        )
+
+        return entry
+
+    def invalidate(self, locale_id: int) -> None:
+        """Render the feeds of a locale again on their next poll"""
+
+        try:
+            self.cache.incr(f"{self.key_prefix}:{locale_id}:version")
+
+        except ValueError:
+            self.cache.set(
+                f"{self.key_prefix}:{locale_id}:version", time.time_ns(), timeout=None
+            )
+
+
+feed_cache = FeedCache()
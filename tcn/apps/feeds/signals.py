@@ -0,0 +1,19 @@
+"""Signals to render feeds again"""
+
+from wagtail.signals import page_published, page_unpublished
+
+from tcn.apps.articles.models import Article
+from tcn.apps.feeds.caches import feed_cache
+
+
+def invalidate_feeds(sender, **kwargs):
+    """Render the feeds of the locale of an article again"""
+
+    feed_cache.invalidate(kwargs["instance"].locale_id)
+
+
+def register_feed_signal_receivers():
+    """Register signals to keep the rendered feeds fresh"""
+
+    page_published.connect(invalidate_feeds, sender=Article)
+    page_unpublished.connect(invalidate_feeds, sender=Article)
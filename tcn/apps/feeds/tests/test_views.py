@@ -1,10 +1,12 @@
 """Tests for tcn.apps.feeds.views"""
 
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse_lazy
 from rest_framework import status
 
 from tcn import APP_NAME
+from tcn.apps.articles.tests import create_article, create_category
 
 
 # Create your tests here.
@@ -24,3 +26,56 @@ class FeedViewTests(TestCase):
                 status.HTTP_200_OK,
                 f"Feed `{pattern}` failed with status code: {response.status_code}.",
             )
+
+
+class FeedCacheTests(TestCase):
+    """Pre-rendered feed tests"""
+
+    url = reverse_lazy(f"{APP_NAME}:rss-latest")
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup data"""
+
+        cls.category = create_category()
+        create_article(cls.category, "first-feed-item")
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_cached(self) -> None:
+        """Test that polls are served from the rendered feed"""
+
+        response = self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(self.url)
+
+        self.assertEqual(cached.content, response.content)
+        self.assertEqual(cached["ETag"], response["ETag"])
+        self.assertEqual(cached["Last-Modified"], response["Last-Modified"])
+
+    def test_not_modified(self) -> None:
+        """Test conditional requests"""
+
+        response = self.client.get(self.url)
+
+        for headers in [
+            {"if_none_match": response["ETag"]},
+            {"if_modified_since": response["Last-Modified"]},
+        ]:
+            with self.subTest(headers=headers):
+                self.assertEqual(
+                    self.client.get(self.url, headers=headers).status_code,
+                    status.HTTP_304_NOT_MODIFIED,
+                )
+
+    def test_publish(self) -> None:
+        """Test that publishing an article renders the feed again"""
+
+        response = self.client.get(self.url)
+        create_article(self.category, "second-feed-item", title="Second feed item")
+        updated = self.client.get(self.url, headers={"if_none_match": response["ETag"]})
+
+        self.assertEqual(updated.status_code, status.HTTP_200_OK)
+        self.assertIn(b"Second feed item", updated.content)
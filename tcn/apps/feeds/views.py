@@ -9,8 +9,8 @@ class LatestNewsFeed(BaseArticleFeed):
 
     link = "/feeds/rss/"
 
-    def items(self):
-        return super().items().order_by("-created_at")[:25]
+    def items(self, locale):
+        return super().items(locale).order_by("-created_at")[:25]
 
 
 class ArticlesAtomFeed(BaseArticleAtomFeed, LatestNewsFeed):
@@ -24,8 +24,10 @@ class BreakingNewsFeed(BaseArticleFeed):
 
     link = "/feeds/breaking/rss/"
 
-    def items(self):
-        return super().items().filter(is_breaking=True).order_by("-created_at")[:25]
+    def items(self, locale):
+        return (
+            super().items(locale).filter(is_breaking=True).order_by("-created_at")[:25]
+        )
 
 
 class BreakingNewsAtomFeed(BaseArticleAtomFeed, BreakingNewsFeed):
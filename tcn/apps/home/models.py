@@ -12,6 +12,8 @@ from wagtail.search import index
 
 from tcn.apps.articles.models import Article
 from tcn.apps.categories.models import Category
+from tcn.apps.links.trending import trending
+from tcn.apps.sampling import category_sampler
 from tcn.cms.blocks import FooterStreamBlock, MediaBlock
 
 
@@ -38,25 +40,35 @@ class Home(Page):
         verbose_name = _("Home page")
         verbose_name_plural = _("Home pages")
 
+    def get_trending_news(self, articles):
+        """Trending articles of the locale, from the precomputed board"""
+
+        # Cold board, fall back to the all-time most viewed articles
+        ids = trending.top(self.locale_id) or trending.fallback(
+            self.locale_id, articles
+        )
+        articles = articles.in_bulk(ids)
+
+        return [articles[article_id] for article_id in ids if article_id in articles]
+
     def get_context(self, request, *args, **kwargs):
         """Add extra context"""
 
         context = super().get_context(request, *args, **kwargs)
-        articles = (
-            Article.objects.descendant_of(self).live().public().prefetch_related("link")
-        )
+        articles = Article.objects.descendant_of(self).live().public().with_card_data()
 
         return {
             **context,
-            "trending_news": articles.order_by("link__view_count")[:10],
+            "trending_news": self.get_trending_news(articles),
             "latest_news": articles.order_by("-created_at")[:9],
             "breaking_news": articles.filter(is_breaking=True).order_by("-created_at")[
                 :9
             ],
-            "categories": Category.objects.descendant_of(self)
-            .live()
-            .public()
-            .order_by("?")[:5],
+            "categories": category_sampler.sample(
+                Category.objects.descendant_of(self).live().public(),
+                5,
+                key=str(self.id),
+            ),
         }
 
 
@@ -1,8 +1,114 @@
 """Tests for tcn.apps.home.models"""
 
-from django.test import TestCase
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from tcn.apps.articles.models import Article
+from tcn.apps.articles.tests import create_article, create_category
+from tcn.apps.categories.models import Category
+from tcn.apps.home.models import Home
+from tcn.apps.links.models import Link
+from tcn.apps.links.trending import trending
+from tcn.apps.sampling import category_sampler, sample_by_id
 
 
 # Create your tests here.
 class HomeTests(TestCase):
     """Home model tests"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup data"""
+
+        cls.category = category = create_category()
+        cls.articles = [create_article(category, f"home-{i}") for i in range(3)]
+        cls.home = Home.objects.first()
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_trending_news(self) -> None:
+        """Test that trending news are read from the board"""
+
+        first, second, third = self.articles
+        trending.add(
+            [
+                (self.home.locale_id, second.id, 5),
+                (self.home.locale_id, third.id, 2),
+            ]
+        )
+
+        context = self.home.get_context(RequestFactory().get("/"))
+
+        self.assertEqual(list(context["trending_news"]), [second, third])
+
+    def test_trending_fallback(self) -> None:
+        """Test that a cold board shows the most viewed articles, cached"""
+
+        first, second, third = self.articles
+        Link.objects.filter(article=third).update(view_count=5)
+        Link.objects.filter(article=first).update(view_count=2)
+        articles = Article.objects.descendant_of(self.home).live()
+
+        self.assertEqual(self.home.get_trending_news(articles)[:2], [third, first])
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.home.get_trending_news(articles)[:2], [third, first])
+
+    def test_breaking_news(self) -> None:
+        """Test that breaking news are not limited to the latest news"""
+
+        breaking = create_article(self.category, "breaking", is_breaking=True)
+        Article.objects.filter(pk=breaking.pk).update(created_at="2000-01-01T00:00Z")
+
+        for i in range(9):
+            create_article(self.category, f"latest-{i}")
+
+        context = self.home.get_context(RequestFactory().get("/"))
+
+        self.assertNotIn(breaking, context["latest_news"])
+        self.assertEqual(list(context["breaking_news"]), [breaking])
+
+    def test_categories(self) -> None:
+        """Test that categories are sampled from cached ids"""
+
+        request = RequestFactory().get("/")
+        context = self.home.get_context(request)
+
+        self.assertEqual(context["categories"], [self.category])
+
+        with self.assertNumQueries(1):
+            category_sampler.sample(
+                Category.objects.descendant_of(self.home), 5, key=str(self.home.id)
+            )
+
+        # Publishing a category refreshes the cached ids
+        sports = create_category("sports")
+        sports.save_revision().publish()
+        context = self.home.get_context(request)
+
+        self.assertCountEqual(context["categories"], [self.category, sports])
+
+    def test_sample_by_id(self) -> None:
+        """Test sampling by random primary keys"""
+
+        sample = sample_by_id(Article.objects.all(), 2)
+
+        self.assertEqual(len(set(sample)), 2)
+        self.assertTrue(set(sample) <= set(self.articles))
+        self.assertEqual(sample_by_id(Article.objects.none()), [])
+
+        # Every seek lands past the gap on the last row, the others fill up
+        gappy = Article.objects.filter(
+            pk__in=[self.articles[0].pk, self.articles[-1].pk]
+        )
+
+        with patch(
+            "tcn.apps.sampling.random.randint", return_value=self.articles[-1].pk
+        ):
+            self.assertCountEqual(
+                sample_by_id(gappy, 2), [self.articles[0], self.articles[-1]]
+            )
+            self.assertEqual(len(sample_by_id(Article.objects.all(), 5)), 3)
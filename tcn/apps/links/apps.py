@@ -11,8 +11,9 @@ class LinksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
 
     def ready(self) -> None:
-        """Register signal receivers"""
+        """Register signal receivers and checks"""
 
+        from tcn.apps.links import checks  # noqa: F401
         from tcn.apps.links.signals import register_link_signal_receivers
 
         register_link_signal_receivers()
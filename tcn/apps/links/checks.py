@@ -0,0 +1,24 @@
+"""System checks for tcn.apps.links"""
+
+from django.core.checks import Error, Tags, register
+
+from tcn.apps.caches import is_local, is_shared
+from tcn.apps.links.counters import view_counter
+
+
+# Create your checks here.
+@register(Tags.caches)
+def check_view_counter_cache(app_configs, **kwargs):
+    """The view buffer loses hits on caches without atomic increments"""
+
+    if is_local(view_counter.cache_alias) or is_shared(view_counter.cache_alias):
+        return []
+
+    return [
+        Error(
+            f"The {view_counter.cache_alias!r} cache buffering link views "
+            "does not increment atomically",
+            hint="Use Redis with REDIS_URL, or a local memory cache.",
+            id="links.E001",
+        )
+    ]
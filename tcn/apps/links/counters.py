@@ -0,0 +1,334 @@
+"""Write-behind view counter for shortened links"""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from tcn.apps.links.models import DailyViewers, Link
+from tcn.apps.links.sketches import HyperLogLog
+from tcn.apps.links.trending import trending
+
+logger = logging.getLogger(__name__)
+
+
+# Create your counters here.
+class ViewCounter:
+    """
+    Buffer link views in the cache and write them to the database in batches.
+
+    Every hit increments a pending counter for the link in the cache. The first
+    pending hit of a link is appended to a journal, so a flush only has to
+    visit links that were actually viewed. A flush groups links by their
+    pending count and applies them with one `UPDATE ... SET view_count =
+    view_count + n` per group. Viewers of authenticated requests are journaled
+    too, and added to the HyperLogLog sketches of the link and of its daily
+    bucket, in a fixed number of queries per flush. Flushed counts also feed
+    the trending boards.
+
+    A flush takes the pending counts and the journal out of the buffer before
+    writing them, and puts them back if the write fails, so views are never
+    counted twice, at worst lost if the process dies in between.
+
+    The first hit after a flush schedules the next one `interval` seconds
+    later in a background thread, `threshold` hits flush right away, and the
+    `flush_link_views` management command flushes on demand. The buffer lives
+    in the cache, it is only seen by other processes and survives restarts on
+    Redis. It needs atomic increments, the `links.E001` check rejects caches
+    without them, such as the database cache.
+    """
+
+    key_prefix = "tcn:links:views"
+
+    def __init__(
+        self,
+        cache_alias: str = "default",
+        interval: Optional[float] = None,
+        threshold: Optional[int] = None,
+    ) -> None:
+        self.cache_alias = cache_alias
+        self.interval = (
+            interval
+            if interval is not None
+            else getattr(settings, "LINK_VIEWS_FLUSH_INTERVAL", 30)
+        )
+        self.threshold = (
+            threshold
+            if threshold is not None
+            else getattr(settings, "LINK_VIEWS_FLUSH_THRESHOLD", 1000)
+        )
+        self.hits = 0
+        self.timer: Optional[threading.Timer] = None
+        self.lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def key(self, *parts) -> str:
+        return ":".join([self.key_prefix, *map(str, parts)])
+
+    def incr(self, key: str, delta: int = 1) -> int:
+        """Atomically increment a cache key, creating it if needed"""
+
+        self.cache.add(key, 0, timeout=None)
+
+        try:
+            return self.cache.incr(key, delta)
+
+        except ValueError:
+            # The key was evicted between `add` and `incr`
+            self.cache.set(key, delta, timeout=None)
+            return delta
+
+    def journal(self, link_id: int, user_id: Optional[int] = None) -> None:
+        """Append an entry to the journal of pending links"""
+
+        index = self.incr(self.key("journal", "length"))
+        self.cache.set(self.key("journal", index), (link_id, user_id), timeout=None)
+
+    def hit(self, link_id: int, user_id: Optional[int] = None) -> None:
+        """
+        Record a view of a link, without touching the database
+
+        Args:
+            link_id (int): Viewed link id.
+            user_id (int | None): Id of the viewer, if authenticated.
+        """
+
+        if self.incr(self.key("pending", link_id)) == 1:
+            self.journal(link_id)
+
+        if user_id is not None and self.cache.add(
+            self.key("viewer", link_id, user_id), 1, timeout=self.interval * 2
+        ):
+            self.journal(link_id, user_id)
+
+        with self.lock:
+            self.hits += 1
+            full = self.hits >= self.threshold
+
+            if full and self.timer is not None:
+                self.timer.cancel()
+
+            if full or self.timer is None:
+                self.hits = 0
+                self.timer = threading.Timer(
+                    0 if full else self.interval, self.flush_in_background
+                )
+                self.timer.daemon = True
+                self.timer.start()
+
+    def cancel(self) -> None:
+        """Cancel the scheduled flush, hits stay pending"""
+
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+    def read_journal(self) -> Tuple[int, Set[int], Set[Tuple[int, int]]]:
+        """
+        Read the unflushed part of the journal
+
+        Returns:
+            Tuple: The new journal cursor, pending link ids and viewers.
+        """
+
+        cursor = self.cache.get(self.key("journal", "cursor"), 0)
+        length = self.cache.get(self.key("journal", "length"), 0)
+        keys = [self.key("journal", index) for index in range(cursor + 1, length + 1)]
+        entries = self.cache.get_many(keys)
+
+        link_ids, viewers = set(), set()
+
+        for index, key in enumerate(keys, start=cursor + 1):
+            if key not in entries:
+                # A writer allocated this slot but has not filled it yet,
+                # skip it only if it was already missing on the last flush.
+                stalled = self.cache.get(self.key("journal", "stalled"))
+
+                if stalled != index:
+                    self.cache.set(self.key("journal", "stalled"), index, None)
+                    return index - 1, link_ids, viewers
+
+                continue
+
+            link_id, user_id = entries[key]
+
+            if user_id is None:
+                link_ids.add(link_id)
+
+            else:
+                viewers.add((link_id, user_id))
+
+        return length, link_ids, viewers
+
+    def lag(self) -> Dict[str, int]:
+        """
+        Report how far the database is behind the buffered counters
+
+        Returns:
+            Dict: Number of pending links, views and viewers.
+        """
+
+        _, link_ids, viewers = self.read_journal()
+        counts = self.cache.get_many([self.key("pending", i) for i in link_ids])
+
+        return {
+            "links": len([count for count in counts.values() if count]),
+            "views": sum(counts.values()),
+            "viewers": len(viewers),
+        }
+
+    def record_viewers(self, viewers: Set[Tuple[int, int]]) -> None:
+        """
+        Add viewers to the sketch of their link and of its bucket for today
+
+        Args:
+            viewers (Set): Pairs of link id and user id.
+        """
+
+        users = defaultdict(set)
+
+        for link_id, user_id in viewers:
+            users[link_id].add(user_id)
+
+        today = timezone.localdate()
+        links = list(
+            Link.objects.select_for_update()
+            .filter(id__in=users)
+            .annotate(locale_id=F("article__locale"))
+        )
+
+        DailyViewers.objects.bulk_create(
+            [
+                DailyViewers(link_id=link.id, locale_id=link.locale_id, date=today)
+                for link in links
+            ],
+            ignore_conflicts=True,
+        )
+        buckets = list(
+            DailyViewers.objects.select_for_update().filter(
+                link_id__in=users, date=today
+            )
+        )
+
+        for link in links:
+            sketch = HyperLogLog.from_bytes(link.viewers).update(users[link.id])
+            link.viewers = sketch.to_bytes()
+
+        for bucket in buckets:
+            sketch = HyperLogLog.from_bytes(bucket.viewers).update(
+                users[bucket.link_id]
+            )
+            bucket.viewers = sketch.to_bytes()
+
+        Link.objects.bulk_update(links, ["viewers"])
+        DailyViewers.objects.bulk_update(buckets, ["viewers"])
+
+    def flush(self) -> int:
+        """
+        Write pending views to the database
+
+        Returns:
+            int: Number of views written.
+        """
+
+        lock_key = self.key("flush", "lock")
+
+        if not self.cache.add(lock_key, 1, timeout=max(self.interval, 60)):
+            return 0
+
+        try:
+            cursor, link_ids, viewers = self.read_journal()
+            counts = self.cache.get_many([self.key("pending", i) for i in link_ids])
+
+            groups = defaultdict(list)
+
+            for link_id in link_ids:
+                count = counts.get(self.key("pending", link_id))
+
+                if count:
+                    groups[count].append(link_id)
+
+            self.take(cursor, groups)
+
+            try:
+                with transaction.atomic():
+                    for count, ids in groups.items():
+                        Link.objects.filter(id__in=ids).update(
+                            view_count=F("view_count") + count
+                        )
+
+                    if viewers:
+                        self.record_viewers(viewers)
+
+            except Exception:
+                self.restore(groups, viewers)
+                raise
+
+            trending.add_links(
+                {link_id: count for count, ids in groups.items() for link_id in ids}
+            )
+
+            return sum(count * len(ids) for count, ids in groups.items())
+
+        except Exception as e:
+            logger.error("Failed to flush link views: %s", e, exc_info=True)
+
+            return 0
+
+        finally:
+            self.cache.delete(lock_key)
+
+    def take(self, cursor: int, groups: Dict[int, list]) -> None:
+        """Remove the counts about to be written, and the journal up to `cursor`"""
+
+        # Hits received meanwhile stay pending and are journaled again
+        for count, ids in groups.items():
+            for link_id in ids:
+                if self.cache.decr(self.key("pending", link_id), count) > 0:
+                    self.journal(link_id)
+
+        self.cache.delete_many(
+            [
+                self.key("journal", index)
+                for index in range(
+                    self.cache.get(self.key("journal", "cursor"), 0) + 1, cursor + 1
+                )
+            ]
+        )
+        self.cache.set(self.key("journal", "cursor"), cursor, timeout=None)
+
+    def restore(self, groups: Dict[int, list], viewers: Set[Tuple[int, int]]) -> None:
+        """Put back the counts and viewers of a failed write"""
+
+        for count, ids in groups.items():
+            for link_id in ids:
+                self.incr(self.key("pending", link_id), count)
+                self.journal(link_id)
+
+        for link_id, user_id in viewers:
+            self.journal(link_id, user_id)
+
+    def flush_in_background(self) -> None:
+        """Flush from a worker thread, then release its database connections"""
+
+        with self.lock:
+            self.timer = None
+
+        try:
+            self.flush()
+
+        finally:
+            connections.close_all()
+
+
+view_counter = ViewCounter()
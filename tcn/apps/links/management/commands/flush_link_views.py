@@ -0,0 +1,36 @@
+"""Flush buffered link views to the database"""
+
+from django.core.management.base import BaseCommand
+
+from tcn.apps.caches import require_shared
+from tcn.apps.links.counters import view_counter
+
+
+# Create your commands here.
+class Command(BaseCommand):
+    """Force a flush of the write-behind link view counter"""
+
+    help = "Write buffered link views to the database and report the lag"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how far behind the counter is",
+        )
+
+    def handle(self, *args, **options):
+        require_shared(view_counter.cache_alias)
+
+        lag = view_counter.lag()
+
+        self.stdout.write(
+            "Pending: {views} views on {links} links, {viewers} viewers".format(**lag)
+        )
+
+        if options["dry_run"]:
+            return
+
+        written = view_counter.flush()
+
+        self.stdout.write(self.style.SUCCESS(f"Flushed {written} views"))
@@ -0,0 +1,33 @@
+"""Update the trending article boards"""
+
+from django.core.management.base import BaseCommand
+
+from tcn.apps.caches import require_shared
+from tcn.apps.links.counters import view_counter
+from tcn.apps.links.trending import trending
+
+
+# Create your commands here.
+class Command(BaseCommand):
+    """Fold buffered views into the trending boards"""
+
+    help = "Flush buffered link views into the trending boards, or rebuild them"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Seed the boards from total view counts, e.g. on a cold cache",
+        )
+
+    def handle(self, *args, **options):
+        require_shared(view_counter.cache_alias)
+        require_shared(trending.cache_alias)
+
+        if options["rebuild"]:
+            scored = trending.rebuild()
+            self.stdout.write(self.style.SUCCESS(f"Scored {scored} articles"))
+
+        written = view_counter.flush()
+
+        self.stdout.write(self.style.SUCCESS(f"Added {written} views"))
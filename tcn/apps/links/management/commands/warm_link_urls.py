@@ -0,0 +1,50 @@
+"""Pre-warm the cache of shortened link urls"""
+
+from django.core.management.base import BaseCommand
+
+from tcn.apps.caches import require_shared
+from tcn.apps.links.models import Link
+from tcn.apps.links.resolvers import link_resolver
+
+
+# Create your commands here.
+class Command(BaseCommand):
+    """Load the urls of the most viewed links into the cache"""
+
+    help = "Cache the target urls of the top N most viewed links"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=1000,
+            help="Number of links to cache (default: 1000)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of links to cache per round trip (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        require_shared(link_resolver.cache_alias)
+
+        queryset = (
+            Link.objects.filter(article__live=True)
+            .select_related("article")
+            .order_by("-view_count")[: options["top"]]
+        )
+
+        links, cached = [], 0
+
+        for link in queryset.iterator(chunk_size=options["batch_size"]):
+            links.append(link)
+
+            if len(links) == options["batch_size"]:
+                cached += link_resolver.set_many(links)
+                links = []
+
+        cached += link_resolver.set_many(links)
+
+        self.stdout.write(self.style.SUCCESS(f"Cached {cached} link urls"))
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("links", "0003_link_view_count"),
+        ("wagtailcore", "0095_groupsitepermission"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="link",
+            name="viewers",
+            field=models.BinaryField(
+                default=bytes, help_text="viewers", verbose_name="Unique viewers sketch"
+            ),
+        ),
+        migrations.CreateModel(
+            name="DailyViewers",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(help_text="date", verbose_name="Date")),
+                (
+                    "viewers",
+                    models.BinaryField(
+                        default=bytes,
+                        help_text="viewers",
+                        verbose_name="Unique viewers sketch",
+                    ),
+                ),
+                (
+                    "link",
+                    models.ForeignKey(
+                        help_text="link",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_viewers",
+                        to="links.link",
+                        verbose_name="Link",
+                    ),
+                ),
+                (
+                    "locale",
+                    models.ForeignKey(
+                        help_text="locale",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="wagtailcore.locale",
+                        verbose_name="Locale",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Daily viewers",
+                "verbose_name_plural": "Daily viewers",
+                "indexes": [
+                    models.Index(
+                        fields=["locale", "date"], name="links_daily_locale__586f69_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("link", "date"), name="unique_link_daily_viewers"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:45
+
+from hashlib import blake2b
+from itertools import groupby
+
+from django.db import migrations
+
+# HyperLogLog encoding of tcn.apps.links.sketches when this migration was
+# written, copied so later changes to the module do not change the backfill
+PRECISION = 11
+SIZE = 1 << PRECISION
+SPARSE = 0
+DENSE = 1
+
+
+def sketch(values) -> bytes:
+    """Serialized sketch of the distinct values"""
+
+    registers = bytearray(SIZE)
+
+    for value in values:
+        hashed = int.from_bytes(
+            blake2b(str(value).encode(), digest_size=8).digest(), "big"
+        )
+        index = hashed >> (64 - PRECISION)
+        rest = hashed & ((1 << (64 - PRECISION)) - 1)
+        rank = (64 - PRECISION) - rest.bit_length() + 1
+        registers[index] = max(registers[index], rank)
+
+    pairs = [(index, rank) for index, rank in enumerate(registers) if rank]
+
+    if len(pairs) * 3 < SIZE:
+        return bytes([PRECISION, SPARSE]) + b"".join(
+            index.to_bytes(2, "big") + bytes([rank]) for index, rank in pairs
+        )
+
+    return bytes([PRECISION, DENSE]) + bytes(registers)
+
+
+def backfill_viewers(apps, schema_editor):
+    """Build a viewers sketch for every link from the rows of `Link.views`"""
+
+    Link = apps.get_model("links", "Link")
+    Views = Link.views.through
+
+    rows = Views.objects.order_by("link_id").values_list("link_id", "user_id")
+    batch = []
+
+    for link_id, group in groupby(rows.iterator(chunk_size=2000), lambda r: r[0]):
+        viewers = sketch(user_id for _, user_id in group)
+        batch.append(Link(id=link_id, viewers=viewers))
+
+        if len(batch) == 500:
+            Link.objects.bulk_update(batch, ["viewers"])
+            batch = []
+
+    Link.objects.bulk_update(batch, ["viewers"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("links", "0004_link_viewers_dailyviewers"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_viewers, migrations.RunPython.noop),
+    ]
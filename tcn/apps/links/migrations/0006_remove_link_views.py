@@ -0,0 +1,16 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:41
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("links", "0005_backfill_link_viewers"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="link",
+            name="views",
+        ),
+    ]
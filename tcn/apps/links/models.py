@@ -2,18 +2,16 @@
 
 from secrets import token_urlsafe
 
-from django.contrib.auth import get_user_model
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from tcn.apps.links.sketches import HyperLogLog
+
 
 def create_slug() -> str:
     return token_urlsafe(8)
 
 
-User = get_user_model()
-
-
 # Create your models here.
 class Link(models.Model):
     """Shortened links"""
@@ -33,11 +31,10 @@ class Link(models.Model):
         help_text=_("slug"),
         verbose_name=_("Link url"),
     )
-    views = models.ManyToManyField(
-        User,
-        related_name="views",
-        help_text=_("views"),
-        verbose_name=_("Article views"),
+    viewers = models.BinaryField(
+        default=bytes,
+        help_text=_("viewers"),
+        verbose_name=_("Unique viewers sketch"),
     )
     view_count = models.PositiveIntegerField(
         default=0,
@@ -50,6 +47,85 @@ class Link(models.Model):
 
         verbose_name = _("Link")
         verbose_name_plural = _("Links")
+        indexes = [
+            models.Index(fields=["-view_count"], name="links_view_count_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.article.title
+
+    @property
+    def unique_views(self) -> int:
+        """Estimated number of distinct authenticated viewers"""
+
+        return HyperLogLog.from_bytes(self.viewers).count()
+
+
+class DailyViewersQuerySet(models.QuerySet):
+    """Daily viewers queryset"""
+
+    def sketch(self) -> HyperLogLog:
+        """Merge the sketches of all buckets in the queryset"""
+
+        sketch = HyperLogLog()
+
+        for viewers in self.values_list("viewers", flat=True):
+            sketch.merge(HyperLogLog.from_bytes(viewers))
+
+        return sketch
+
+    def unique_views(self) -> int:
+        """Estimated number of distinct viewers across the buckets"""
+
+        return self.sketch().count()
+
+
+class DailyViewers(models.Model):
+    """Unique viewers of a link in a day, mergeable by day and locale"""
+
+    link = models.ForeignKey(
+        Link,
+        on_delete=models.CASCADE,
+        related_name="daily_viewers",
+        help_text=_("link"),
+        verbose_name=_("Link"),
+    )
+    locale = models.ForeignKey(
+        "wagtailcore.Locale",
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text=_("locale"),
+        verbose_name=_("Locale"),
+    )
+    date = models.DateField(
+        help_text=_("date"),
+        verbose_name=_("Date"),
+    )
+    viewers = models.BinaryField(
+        default=bytes,
+        help_text=_("viewers"),
+        verbose_name=_("Unique viewers sketch"),
+    )
+
+    objects = DailyViewersQuerySet.as_manager()
+
+    class Meta:
+        """Meta data"""
+
+        verbose_name = _("Daily viewers")
+        verbose_name_plural = _("Daily viewers")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["link", "date"], name="unique_link_daily_viewers"
+            )
+        ]
+        indexes = [models.Index(fields=["locale", "date"])]
+
+    def __str__(self) -> str:
+        return f"{self.link} ({self.date})"
+
+    @property
+    def unique_views(self) -> int:
+        """Estimated number of distinct viewers in the day"""
+
+        return HyperLogLog.from_bytes(self.viewers).count()
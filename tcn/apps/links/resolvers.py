@@ -0,0 +1,108 @@
+"""Cached resolution of shortened links"""
+
+import time
+from typing import Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from tcn.apps.links.models import Link
+
+
+# Create your resolvers here.
+class LinkResolver:
+    """
+    Read-through cache of `slug -> (link id, article url)`
+
+    Entries are stored under a version that is shared by all of them, so a
+    change that affects many URLs at once (moving or unpublishing a category)
+    is handled by bumping the version instead of deleting keys one by one.
+    A bump only reaches the processes sharing the cache, entries expire after
+    `timeout` seconds regardless.
+    """
+
+    key_prefix = "tcn:links:urls"
+
+    def __init__(self, cache_alias: str = "default", timeout: Optional[int] = None):
+        self.cache_alias = cache_alias
+        self.timeout = timeout or getattr(settings, "LINK_URLS_TIMEOUT", 15 * 60)
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    @property
+    def version(self) -> int:
+        """Current version of the cached entries"""
+
+        # Start from the clock, so an evicted version never revives stale entries
+        return self.cache.get_or_set(
+            f"{self.key_prefix}:version", time.time_ns, timeout=None
+        )
+
+    def key(self, slug: str) -> str:
+        return f"{self.key_prefix}:{slug}"
+
+    def entry(self, link: Link) -> Tuple[int, str]:
+        return link.id, link.article.get_url()
+
+    def get(self, slug: str) -> Optional[Tuple[int, str]]:
+        """Return the cached entry of a slug, if any"""
+
+        return self.cache.get(self.key(slug), version=self.version)
+
+    def set(self, link: Link) -> Tuple[int, str]:
+        """Cache the target url of a link"""
+
+        entry = self.entry(link)
+        self.cache.set(
+            self.key(link.slug), entry, timeout=self.timeout, version=self.version
+        )
+
+        return entry
+
+    def set_many(self, links: Iterable[Link]) -> int:
+        """Cache the target urls of many links at once"""
+
+        entries = {self.key(link.slug): self.entry(link) for link in links}
+        self.cache.set_many(entries, timeout=self.timeout, version=self.version)
+
+        return len(entries)
+
+    def resolve(self, slug: str) -> Tuple[int, str]:
+        """
+        Resolve a slug to its link id and article url
+
+        Args:
+            slug (str): Link slug.
+
+        Raises:
+            Link.DoesNotExist: If there is no link with this slug.
+
+        Returns:
+            Tuple: Link id and article url.
+        """
+
+        entry = self.get(slug)
+
+        if entry is None:
+            entry = self.set(Link.objects.select_related("article").get(slug=slug))
+
+        return entry
+
+    def invalidate(self, slug: str) -> None:
+        """Remove a single slug from the cache"""
+
+        self.cache.delete(self.key(slug), version=self.version)
+
+    def clear(self) -> None:
+        """Invalidate every cached slug"""
+
+        try:
+            self.cache.incr(f"{self.key_prefix}:version")
+
+        except ValueError:
+            self.cache.set(f"{self.key_prefix}:version", time.time_ns(), timeout=None)
+
+
+link_resolver = LinkResolver()
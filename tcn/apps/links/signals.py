@@ -1,27 +1,72 @@
 """Signals to create page shortened links"""
 
-from wagtail.signals import copy_for_translation_done, page_published
+from django.db.models.signals import post_delete
+from wagtail.signals import (
+    copy_for_translation_done,
+    page_published,
+    page_slug_changed,
+    page_unpublished,
+    post_page_move,
+)
 
 from tcn.apps.articles.models import Article
+from tcn.apps.categories.models import Category
 from tcn.apps.links.models import Link
+from tcn.apps.links.resolvers import link_resolver
+from tcn.apps.links.trending import trending
 
 
 def create_article_link(sender, **kwargs):
     """Create a new link for an article"""
 
     article = kwargs["instance"]
-    _ = Link.objects.get_or_create(article=article)
+    link, _ = Link.objects.get_or_create(article=article)
+    link.article = article
+
+    # Publishing may change the slug of the article, refresh its url
+    link_resolver.set(link)
 
 
 def create_trans_article_link(sender, **kwargs):
     """Create a new link for translated article"""
 
     article = kwargs["target_obj"]
-    _ = Link.objects.get_or_create(article=article)
+    link, _ = Link.objects.get_or_create(article=article)
+    link.article = article
+    link_resolver.set(link)
+
+
+def invalidate_article_link(sender, **kwargs):
+    """Remove an unpublished article from the cache and trending board"""
+
+    article = kwargs["instance"]
+    trending.discard(article.locale_id, article.id)
+
+    link = Link.objects.filter(article=article).first()
+
+    if link:
+        link_resolver.invalidate(link.slug)
+
+
+def invalidate_page_links(sender, **kwargs):
+    """Remove every cached url when a page that may contain articles changes"""
+
+    link_resolver.clear()
+
+
+def invalidate_deleted_link(sender, **kwargs):
+    """Remove the cached url of a deleted link"""
+
+    link_resolver.invalidate(kwargs["instance"].slug)
 
 
 def register_link_signal_receivers():
-    """Register `create_article_link` and `create_trans_article_link` signals"""
+    """Register signals to create links and keep their cached urls fresh"""
 
     page_published.connect(create_article_link, sender=Article)
     copy_for_translation_done.connect(create_trans_article_link, sender=Article)
+    page_unpublished.connect(invalidate_article_link, sender=Article)
+    page_unpublished.connect(invalidate_page_links, sender=Category)
+    page_slug_changed.connect(invalidate_page_links, sender=Category)
+    post_page_move.connect(invalidate_page_links)
+    post_delete.connect(invalidate_deleted_link, sender=Link)
@@ -0,0 +1,163 @@
+"""Tests for tcn.apps.links.counters"""
+
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse_lazy
+
+from tcn import APP_NAME
+from tcn.apps.articles.tests import create_article, create_category
+from tcn.apps.links.checks import check_view_counter_cache
+from tcn.apps.links.counters import ViewCounter
+from tcn.apps.links.models import DailyViewers, Link
+
+User = get_user_model()
+
+# Local to the test process, whatever REDIS_URL says
+LOCAL_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+DATABASE_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "tcn_cache",
+    }
+}
+
+
+# Create your tests here.
+@override_settings(CACHES=LOCAL_CACHES)
+class ViewCounterTests(TestCase):
+    """ViewCounter tests"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup data"""
+
+        category = create_category()
+        cls.link = Link.objects.get(article=create_article(category, "first"))
+        cls.other = Link.objects.get(article=create_article(category, "second"))
+        cls.user = User.objects.create_user(username="reader", slug="reader")
+
+    def setUp(self) -> None:
+        """Use a counter that never flushes on its own"""
+
+        cache.clear()
+        self.counter = ViewCounter(interval=3600, threshold=10_000)
+        self.addCleanup(self.counter.cancel)
+
+    def test_hit_does_not_write(self) -> None:
+        """Test that hits are buffered"""
+
+        with self.assertNumQueries(0):
+            for _ in range(3):
+                self.counter.hit(self.link.id, self.user.id)
+
+        self.link.refresh_from_db()
+
+        self.assertEqual(self.link.view_count, 0)
+        self.assertEqual(self.counter.lag(), {"links": 1, "views": 3, "viewers": 1})
+
+    def test_flush(self) -> None:
+        """Test that a flush writes all pending views"""
+
+        for _ in range(3):
+            self.counter.hit(self.link.id, self.user.id)
+
+        self.counter.hit(self.other.id)
+
+        self.assertEqual(self.counter.flush(), 4)
+        self.assertEqual(self.counter.lag(), {"links": 0, "views": 0, "viewers": 0})
+
+        self.link.refresh_from_db()
+        self.other.refresh_from_db()
+
+        self.assertEqual(self.link.view_count, 3)
+        self.assertEqual(self.other.view_count, 1)
+        self.assertEqual(self.link.unique_views, 1)
+        self.assertEqual(
+            DailyViewers.objects.filter(locale=self.link.article.locale).unique_views(),
+            1,
+        )
+
+        # New hits after a flush are journaled again
+        self.counter.hit(self.link.id)
+        self.assertEqual(self.counter.flush(), 1)
+
+        self.link.refresh_from_db()
+        self.assertEqual(self.link.view_count, 4)
+
+    def test_failed_flush(self) -> None:
+        """Test that views are written once, whichever step of a flush fails"""
+
+        for _ in range(3):
+            self.counter.hit(self.link.id, self.user.id)
+
+        # The database write fails, views are put back
+        with (
+            patch.object(self.counter, "record_viewers", side_effect=Exception),
+            self.assertLogs("tcn.apps.links.counters", "ERROR"),
+        ):
+            self.assertEqual(self.counter.flush(), 0)
+
+        self.assertEqual(self.counter.lag(), {"links": 1, "views": 3, "viewers": 1})
+
+        # Written, then trending fails, views are not written again
+        with (
+            patch("tcn.apps.links.counters.trending.add_links", side_effect=Exception),
+            self.assertLogs("tcn.apps.links.counters", "ERROR"),
+        ):
+            self.counter.flush()
+
+        self.assertEqual(self.counter.lag(), {"links": 0, "views": 0, "viewers": 0})
+        self.assertEqual(self.counter.flush(), 0)
+
+        self.link.refresh_from_db()
+        self.assertEqual(self.link.view_count, 3)
+        self.assertEqual(self.link.unique_views, 1)
+
+    def test_redirect(self) -> None:
+        """Test that the redirect view only buffers the view"""
+
+        with patch("tcn.ui.views.view_counter", self.counter):
+            response = self.client.get(
+                reverse_lazy(f"{APP_NAME}:redirect", args=[self.link.slug])
+            )
+
+        self.assertEqual(response.status_code, 302)
+
+        self.link.refresh_from_db()
+        self.assertEqual(self.link.view_count, 0)
+
+        self.assertEqual(self.counter.flush(), 1)
+
+        self.link.refresh_from_db()
+        self.assertEqual(self.link.view_count, 1)
+
+    def test_command(self) -> None:
+        """Test that the command flushes the views buffered by other processes"""
+
+        with self.assertRaises(CommandError):
+            call_command("flush_link_views", stdout=StringIO())
+
+        # Buffered in the same cache as the counter of the command
+        self.counter.hit(self.link.id)
+
+        with patch("tcn.apps.caches.is_shared", return_value=True):
+            call_command("flush_link_views", stdout=StringIO())
+
+        self.link.refresh_from_db()
+        self.assertEqual(self.link.view_count, 1)
+
+    def test_check(self) -> None:
+        """Test that caches without atomic increments are rejected"""
+
+        self.assertEqual(check_view_counter_cache(None), [])
+
+        with override_settings(CACHES=DATABASE_CACHES):
+            self.assertEqual(
+                [error.id for error in check_view_counter_cache(None)],
+                ["links.E001"],
+            )
@@ -0,0 +1,92 @@
+"""Tests for tcn.apps.links.resolvers"""
+
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse_lazy
+
+from tcn import APP_NAME
+from tcn.apps.articles.tests import create_article, create_category
+from tcn.apps.links.counters import ViewCounter
+from tcn.apps.links.models import Link
+from tcn.apps.links.resolvers import link_resolver
+from tcn.apps.links.tests.test_counters import LOCAL_CACHES
+
+
+# Create your tests here.
+class LinkResolverTests(TestCase):
+    """LinkResolver tests"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup data"""
+
+        cls.article = create_article(create_category(), "resolved")
+        cls.link = Link.objects.get(article=cls.article)
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_resolve(self) -> None:
+        """Test read-through resolution"""
+
+        self.assertIsNone(link_resolver.get(self.link.slug))
+        self.assertEqual(
+            link_resolver.resolve(self.link.slug),
+            (self.link.id, self.article.get_url()),
+        )
+
+        with self.assertNumQueries(0):
+            link_resolver.resolve(self.link.slug)
+
+        with self.assertRaises(Link.DoesNotExist):
+            link_resolver.resolve("missing")
+
+    def test_clear(self) -> None:
+        """Test versioned invalidation"""
+
+        link_resolver.resolve(self.link.slug)
+        link_resolver.clear()
+
+        self.assertIsNone(link_resolver.get(self.link.slug))
+
+        # Processes that missed the bump resolve again once entries expire
+        with patch.object(link_resolver.cache, "set") as set_entry:
+            link_resolver.resolve(self.link.slug)
+
+        self.assertEqual(set_entry.call_args.kwargs["timeout"], link_resolver.timeout)
+        self.assertIsNotNone(link_resolver.timeout)
+
+    @override_settings(CACHES=LOCAL_CACHES)
+    def test_warm_redirect(self) -> None:
+        """Test that a warm redirect does not touch the database"""
+
+        link_resolver.set_many(Link.objects.select_related("article"))
+        counter = ViewCounter(interval=3600)
+        self.addCleanup(counter.cancel)
+
+        with patch("tcn.ui.views.view_counter", counter), self.assertNumQueries(0):
+            response = self.client.get(
+                reverse_lazy(f"{APP_NAME}:redirect", args=[self.link.slug])
+            )
+
+        self.assertRedirects(
+            response, self.article.get_url(), fetch_redirect_response=False
+        )
+        self.assertEqual(counter.lag()["views"], 1)
+
+    def test_local_cache(self) -> None:
+        """Test that a cache local to the command is not warmed"""
+
+        with self.assertRaises(CommandError):
+            call_command("warm_link_urls", stdout=StringIO())
+
+    def test_missing_link(self) -> None:
+        """Test redirect of an unknown slug"""
+
+        response = self.client.get(reverse_lazy(f"{APP_NAME}:redirect", args=["nope"]))
+
+        self.assertEqual(response.status_code, 404)
@@ -1,8 +1,42 @@
 """Tests for tcn.apps.links.signals"""
 
+from django.core.cache import cache
 from django.test import TestCase
 
+from tcn.apps.articles.tests import create_article, create_category
+from tcn.apps.links.models import Link
+from tcn.apps.links.resolvers import link_resolver
+
 
 # Create your tests here.
 class SignalTests(TestCase):
     """Signal tests"""
+
+    def setUp(self) -> None:
+        cache.clear()
+
+        self.category = create_category()
+        self.article = create_article(self.category, "signals")
+        self.link = Link.objects.get(article=self.article)
+
+    def test_publish_fills_cache(self) -> None:
+        """Test that publishing an article caches its link"""
+
+        self.assertEqual(
+            link_resolver.get(self.link.slug), (self.link.id, self.article.get_url())
+        )
+
+    def test_unpublish_clears_cache(self) -> None:
+        """Test that unpublishing an article removes its cached link"""
+
+        self.article.unpublish()
+
+        self.assertIsNone(link_resolver.get(self.link.slug))
+
+    def test_move_clears_cache(self) -> None:
+        """Test that moving a page invalidates cached links"""
+
+        other = create_category("sports")
+        self.article.move(other, pos="last-child")
+
+        self.assertIsNone(link_resolver.get(self.link.slug))
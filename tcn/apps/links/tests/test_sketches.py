@@ -0,0 +1,62 @@
+"""Tests for tcn.apps.links.sketches"""
+
+from importlib import import_module
+
+from django.test import SimpleTestCase
+
+from tcn.apps.links.sketches import HyperLogLog
+
+
+# Create your tests here.
+class HyperLogLogTests(SimpleTestCase):
+    """HyperLogLog tests"""
+
+    def test_count(self) -> None:
+        """Test estimates at small and large cardinalities"""
+
+        for size in [0, 1, 10, 1_000, 50_000]:
+            sketch = HyperLogLog().update(range(size))
+
+            self.assertAlmostEqual(sketch.count(), size, delta=max(1, size * 0.05))
+
+    def test_duplicates(self) -> None:
+        """Test that repeated values are counted once"""
+
+        sketch = HyperLogLog().update([1, 2, 3] * 100)
+
+        self.assertEqual(sketch.count(), 3)
+
+    def test_merge(self) -> None:
+        """Test that merged sketches count the union"""
+
+        first = HyperLogLog().update(range(0, 6_000))
+        second = HyperLogLog().update(range(4_000, 10_000))
+
+        self.assertAlmostEqual(first.merge(second).count(), 10_000, delta=500)
+
+    def test_serialization(self) -> None:
+        """Test sparse and dense round trips"""
+
+        sparse = HyperLogLog().update(range(10))
+        dense = HyperLogLog().update(range(10_000))
+
+        self.assertEqual(len(sparse.to_bytes()), 2 + 10 * 3)
+        self.assertEqual(len(dense.to_bytes()), 2 + 2048)
+
+        for sketch in [sparse, dense]:
+            self.assertEqual(
+                HyperLogLog.from_bytes(sketch.to_bytes()).registers, sketch.registers
+            )
+
+        self.assertEqual(HyperLogLog.from_bytes(b"").count(), 0)
+
+    def test_backfill_encoding(self) -> None:
+        """Test that the sketches of the viewers backfill read back the same"""
+
+        backfill = import_module("tcn.apps.links.migrations.0005_backfill_link_viewers")
+
+        for size in [10, 10_000]:
+            self.assertEqual(
+                backfill.sketch(range(size)),
+                HyperLogLog().update(range(size)).to_bytes(),
+            )
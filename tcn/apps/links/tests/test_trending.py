@@ -0,0 +1,58 @@
+"""Tests for tcn.apps.links.trending"""
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from tcn.apps.links.trending import TrendingBoard
+
+
+# Create your tests here.
+class TrendingBoardTests(SimpleTestCase):
+    """TrendingBoard tests"""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.board = TrendingBoard(size=2, half_life=3600)
+
+    def test_top(self) -> None:
+        """Test ranking within a locale"""
+
+        self.board.add([(1, 10, 5), (1, 11, 3), (1, 12, 9), (2, 20, 1)], now=0)
+
+        self.assertEqual(self.board.top(1), [12, 10])
+        self.assertEqual(self.board.top(2), [20])
+        self.assertEqual(self.board.top(3), [])
+
+    def test_decay(self) -> None:
+        """Test that recent hits outweigh older ones"""
+
+        self.board.add([(1, 10, 10)], now=0)
+        self.board.add([(1, 11, 6)], now=3600)
+
+        # 10 views an hour ago are worth 5 now
+        self.assertEqual(self.board.top(1), [11, 10])
+
+    def test_renormalize(self) -> None:
+        """Test that moving the landmark keeps the ranking"""
+
+        self.board.add([(1, 10, 10)], now=0)
+        self.board.add([(1, 11, 6)], now=3600 * 40)
+
+        self.assertEqual(self.board.top(1), [11, 10])
+        self.assertEqual(cache.get(self.board.key(1))["landmark"], 3600 * 40)
+
+    def test_capacity(self) -> None:
+        """Test that only the best candidates are kept"""
+
+        self.board.add([(1, article_id, article_id) for article_id in range(50)], now=0)
+
+        self.assertEqual(len(cache.get(self.board.key(1))["scores"]), 10)
+        self.assertEqual(self.board.top(1), [49, 48])
+
+    def test_discard(self) -> None:
+        """Test removing an article"""
+
+        self.board.add([(1, 10, 5), (1, 11, 3)], now=0)
+        self.board.discard(1, 10)
+
+        self.assertEqual(self.board.top(1), [11])
@@ -0,0 +1,197 @@
+"""Time-decayed trending articles per locale"""
+
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from tcn.apps.links.models import Link
+
+
+# Create your boards here.
+class TrendingBoard:
+    """
+    Small per-locale leaderboard of articles with exponential time decay
+
+    Scores use forward decay: a hit at time `t` adds `2 ** ((t - landmark) /
+    half_life)`, so older hits never have to be rewritten, the ranking of any
+    two articles is the same as if every score decayed continuously. The
+    landmark moves forward once the weights grow large.
+
+    Only `capacity` candidates are kept per locale, reading the top `size`
+    articles is a single cache lookup and a sort of that small list. Until a
+    locale has a board, its most viewed articles are read every
+    `fallback_timeout` seconds instead.
+    """
+
+    key_prefix = "tcn:trending"
+
+    def __init__(
+        self,
+        cache_alias: str = "default",
+        size: Optional[int] = None,
+        half_life: Optional[float] = None,
+        fallback_timeout: Optional[float] = None,
+    ) -> None:
+        self.cache_alias = cache_alias
+        self.size = size or getattr(settings, "TRENDING_SIZE", 10)
+        self.half_life = half_life or getattr(settings, "TRENDING_HALF_LIFE", 21_600)
+        self.capacity = self.size * 5
+        self.fallback_timeout = fallback_timeout or getattr(
+            settings, "TRENDING_FALLBACK_TIMEOUT", 5 * 60
+        )
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def key(self, locale_id: int) -> str:
+        return f"{self.key_prefix}:{locale_id}"
+
+    def load(self, locale_id: int, now: float) -> Dict:
+        return self.cache.get(self.key(locale_id)) or {"landmark": now, "scores": {}}
+
+    def save(self, locale_id: int, board: Dict, now: float) -> None:
+        """Renormalize, keep the best candidates and store a board"""
+
+        age = now - board["landmark"]
+
+        if age > 32 * self.half_life:
+            factor = 2 ** (-age / self.half_life)
+            board["landmark"] = now
+            board["scores"] = {
+                article_id: score * factor
+                for article_id, score in board["scores"].items()
+            }
+
+        board["scores"] = dict(
+            sorted(board["scores"].items(), key=lambda item: item[1], reverse=True)[
+                : self.capacity
+            ]
+        )
+
+        self.cache.set(self.key(locale_id), board, timeout=None)
+
+    def add(
+        self,
+        hits: Iterable[Tuple[int, int, int]],
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        Add hits to the boards
+
+        Args:
+            hits (Iterable): `(locale id, article id, count)` tuples.
+            now (float | None): Time of the hits, defaults to the current time.
+        """
+
+        now = time.time() if now is None else now
+        boards = {}
+
+        for locale_id, article_id, count in hits:
+            if locale_id not in boards:
+                boards[locale_id] = self.load(locale_id, now)
+
+            board = boards[locale_id]
+            weight = 2 ** ((now - board["landmark"]) / self.half_life)
+            board["scores"][article_id] = (
+                board["scores"].get(article_id, 0) + count * weight
+            )
+
+        for locale_id, board in boards.items():
+            self.save(locale_id, board, now)
+
+    def add_links(self, counts: Dict[int, int], now: Optional[float] = None) -> None:
+        """Add hits counted per link id"""
+
+        links = Link.objects.filter(id__in=counts).values_list(
+            "id", "article__locale", "article"
+        )
+
+        self.add(
+            [
+                (locale_id, article_id, counts[link_id])
+                for link_id, locale_id, article_id in links
+            ],
+            now=now,
+        )
+
+    def top(self, locale_id: int, size: Optional[int] = None) -> List[int]:
+        """
+        Trending article ids of a locale, best first
+
+        Args:
+            locale_id (int): Locale id.
+            size (int | None): Number of articles, defaults to `size`.
+
+        Returns:
+            List: Article ids.
+        """
+
+        board = self.cache.get(self.key(locale_id))
+
+        if not board:
+            return []
+
+        scores = sorted(board["scores"].items(), key=lambda item: item[1], reverse=True)
+
+        return [article_id for article_id, _ in scores[: size or self.size]]
+
+    def fallback(self, locale_id: int, articles) -> List[int]:
+        """
+        All-time most viewed article ids of a locale, for a cold board
+
+        Args:
+            locale_id (int): Locale id.
+            articles (QuerySet): Articles of the locale.
+
+        Returns:
+            List: Article ids, cached for `fallback_timeout` seconds.
+        """
+
+        return self.cache.get_or_set(
+            f"{self.key(locale_id)}:fallback",
+            lambda: list(
+                articles.order_by("-link__view_count").values_list("id", flat=True)[
+                    : self.size
+                ]
+            ),
+            timeout=self.fallback_timeout,
+        )
+
+    def discard(self, locale_id: int, article_id: int) -> None:
+        """Remove an article from a board"""
+
+        board = self.cache.get(self.key(locale_id))
+
+        if board and board["scores"].pop(article_id, None) is not None:
+            self.cache.set(self.key(locale_id), board, timeout=None)
+
+    def rebuild(self, now: Optional[float] = None) -> int:
+        """
+        Seed the boards from total view counts, decayed by publication date
+
+        Returns:
+            int: Number of articles scored.
+        """
+
+        now = time.time() if now is None else now
+        links = Link.objects.filter(article__live=True, view_count__gt=0).values_list(
+            "article__locale", "article", "view_count", "article__created_at"
+        )
+
+        boards = {}
+
+        for locale_id, article_id, view_count, created_at in links.iterator():
+            board = boards.setdefault(locale_id, {"landmark": now, "scores": {}})
+            age = now - created_at.timestamp()
+            board["scores"][article_id] = view_count * 2 ** (-age / self.half_life)
+
+        for locale_id, board in boards.items():
+            self.save(locale_id, board, now)
+
+        return sum(len(board["scores"]) for board in boards.values())
+
+
+trending = TrendingBoard()
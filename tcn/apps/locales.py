@@ -0,0 +1,132 @@
+"""Process-wide resolution of language codes to Wagtail locales"""
+
+import time
+from threading import Lock
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpRequest
+from django.utils.functional import SimpleLazyObject
+from django.utils.translation import get_language_from_request
+from wagtail.models import Locale
+
+
+# Create your locale maps here.
+class LocaleMap:
+    """
+    Map of language codes to locales, loaded once per process
+
+    Locales change very rarely, so the whole table is read in one query on
+    first use and kept until a locale is saved or deleted. Saving or deleting
+    one bumps a version shared through the cache, every process compares it
+    with the version of its map at most every `max_age` seconds.
+    """
+
+    key = "tcn:locales:version"
+
+    def __init__(
+        self, cache_alias: str = "default", max_age: Optional[int] = None
+    ) -> None:
+        self.lock = Lock()
+        self.cache_alias = cache_alias
+        self.max_age = max_age
+        self.locales: Optional[Dict[str, Locale]] = None
+        self.version: Optional[int] = None
+        self.checked = 0.0
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def stale(self) -> bool:
+        max_age = self.max_age or getattr(settings, "LOCALES_MAX_AGE", 30)
+
+        return self.locales is None or time.monotonic() - self.checked >= max_age
+
+    def load(self) -> Dict[str, Locale]:
+        """Locales by language code, read from the database on first use"""
+
+        locales = self.locales
+
+        if self.stale():
+            with self.lock:
+                if self.stale():
+                    # Read before the table, a change meanwhile reloads it again
+                    version = self.cache.get_or_set(
+                        self.key, time.time_ns, timeout=None
+                    )
+
+                    if self.locales is None or version != self.version:
+                        self.locales = {
+                            locale.language_code: locale
+                            for locale in Locale.objects.all()
+                        }
+                        self.version = version
+
+                    self.checked = time.monotonic()
+
+                locales = self.locales
+
+        return locales
+
+    def get(self, language_code: Optional[str]) -> Locale:
+        """
+        Locale of a language, or of `LANGUAGE_CODE` if it has none
+
+        Args:
+            language_code (str | None): Language code.
+
+        Raises:
+            Locale.DoesNotExist: If neither locale exists.
+
+        Returns:
+            Locale: The locale.
+        """
+
+        locales = self.load()
+
+        try:
+            return locales.get(language_code) or locales[settings.LANGUAGE_CODE]
+
+        except KeyError:
+            raise Locale.DoesNotExist(
+                f"No locale for `{language_code}` nor `{settings.LANGUAGE_CODE}`"
+            )
+
+    def clear(self) -> None:
+        """Forget the loaded locales, in every process"""
+
+        try:
+            self.cache.incr(self.key)
+
+        except ValueError:
+            self.cache.set(self.key, time.time_ns(), timeout=None)
+
+        self.locales = None
+
+
+locales = LocaleMap()
+
+
+def get_request_locale(request: HttpRequest) -> Locale:
+    """Locale of the active language of a request"""
+
+    return locales.get(get_language_from_request(request, check_path=True))
+
+
+class LocaleResolutionMiddleware:
+    """
+    Add the locale of the active language as `request.locale`
+
+    Must come after `django.middleware.locale.LocaleMiddleware`. The locale is
+    resolved lazily, requests that never read it do not load the map.
+    """
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest):
+        request.locale = SimpleLazyObject(lambda: get_request_locale(request))
+
+        return self.get_response(request)
@@ -46,17 +46,20 @@ class PaginatorMixin:
     ):
         """Paginate the queryset, if needed."""
 
+        count = self.get_paginate_count(queryset)
         paginator = self.get_paginator(
             queryset,
             page_size,
             orphans=self.get_paginate_orphans(),
             allow_empty_first_page=self.get_allow_empty(),
+            **({"count": count} if count is not None else {}),
         )
         page_kwarg = self.page_kwarg
         page = kwargs.get(page_kwarg) or request.GET.get(page_kwarg) or 1
 
         try:
-            page_number = int(page)
+            # Keyset paginators take opaque cursors
+            page_number = page if getattr(paginator, "keyset", False) else int(page)
 
         except ValueError:
             if page == "last":
@@ -84,6 +87,14 @@ class PaginatorMixin:
 
         return self.paginate_by
 
+    def get_paginate_count(self, queryset):
+        """
+        Get the number of items known beforehand, or ``None`` to let the
+        paginator count them.
+        """
+
+        return None
+
     def get_paginator(
         self, queryset, per_page, orphans, allow_empty_first_page=True, **kwargs
     ):
@@ -0,0 +1,239 @@
+"""Keyset pagination, without `OFFSET` nor `COUNT(*)`"""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from math import ceil
+from typing import Any, List, Optional, Tuple
+
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.db.models import Q, QuerySet
+from django.utils.translation import gettext_lazy as _
+
+AFTER = "a"
+BEFORE = "b"
+
+
+class CursorPage(Sequence):
+    """
+    A page of a `CursorPaginator`
+
+    Mirrors `django.core.paginator.Page`, page numbers are the opaque cursors
+    of the neighbour pages, so templates link to them the same way.
+    """
+
+    cursor = True
+
+    def __init__(
+        self,
+        object_list: List,
+        paginator: "CursorPaginator",
+        next_cursor: Optional[str] = None,
+        previous_cursor: Optional[str] = None,
+    ) -> None:
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self) -> str:
+        return f"<Cursor page of {len(self)} objects>"
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+    def next_page_number(self) -> str:
+        if self.next_cursor is None:
+            raise EmptyPage(_("That page contains no results"))
+
+        return self.next_cursor
+
+    def previous_page_number(self) -> str:
+        if self.previous_cursor is None:
+            raise EmptyPage(_("That page number is less than 1"))
+
+        return self.previous_cursor
+
+
+# Create your paginators here.
+class CursorPaginator:
+    """
+    Paginate a queryset on `(created_at, pk)`, newest first
+
+    Every page is an index range scan from the position of a cursor, so deep
+    pages cost the same as the first one and no count is needed. The first
+    page is requested with no cursor or `1`, the last one with `last`.
+
+    A `count` known beforehand, from `ArticleCounter` for instance, provides
+    `count` and `num_pages` without querying.
+    """
+
+    keyset = True
+
+    def __init__(
+        self,
+        object_list: QuerySet,
+        per_page: int,
+        orphans: int = 0,
+        allow_empty_first_page: bool = True,
+        ordering: Tuple[str, str] = ("created_at", "pk"),
+        count: Optional[int] = None,
+    ) -> None:
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.orphans = int(orphans)
+        self.allow_empty_first_page = allow_empty_first_page
+        self.ordering = ordering
+        self.count = count
+
+    @property
+    def num_pages(self) -> Optional[int]:
+        """Number of pages, if the count is known"""
+
+        if self.count is None:
+            return None
+
+        if self.count == 0 and not self.allow_empty_first_page:
+            return 0
+
+        return ceil(max(1, self.count - self.orphans) / self.per_page)
+
+    def encode(self, obj: Any, direction: str) -> str:
+        """Opaque cursor pointing after or before an object"""
+
+        value, pk = (getattr(obj, field) for field in self.ordering)
+        data = json.dumps([direction, value.isoformat(), pk], separators=(",", ":"))
+
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> Tuple[str, datetime, int]:
+        """
+        Direction, ordering value and primary key of a cursor
+
+        Raises:
+            PageNotAnInteger: The cursor was not made by `encode`.
+        """
+
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            direction, value, pk = json.loads(base64.urlsafe_b64decode(padded))
+            value = datetime.fromisoformat(value)
+
+        except (binascii.Error, TypeError, ValueError):
+            raise PageNotAnInteger(_("Invalid cursor"))
+
+        # Anything else would reach the database query
+        if (
+            direction not in (AFTER, BEFORE)
+            or not isinstance(pk, int)
+            or isinstance(pk, bool)
+        ):
+            raise PageNotAnInteger(_("Invalid cursor"))
+
+        return direction, value, pk
+
+    def rows(self, direction: str, value: Any = None, pk: Any = None) -> List:
+        """The objects of a page and the next one, in reading order"""
+
+        field, key = self.ordering
+        queryset = self.object_list
+
+        if direction == AFTER:
+            if value is not None:
+                queryset = queryset.filter(
+                    Q(**{f"{field}__lt": value}) | Q(**{field: value, f"{key}__lt": pk})
+                )
+
+            return list(queryset.order_by(f"-{field}", f"-{key}")[: self.per_page + 1])
+
+        if value is not None:
+            queryset = queryset.filter(
+                Q(**{f"{field}__gt": value}) | Q(**{field: value, f"{key}__gt": pk})
+            )
+
+        return list(queryset.order_by(field, key)[: self.per_page + 1])
+
+    def validate_number(self, number: Any) -> Optional[str]:
+        if number in (None, "", 1, "1"):
+            return None
+
+        return str(number)
+
+    def page(self, number: Any = None) -> CursorPage:
+        """
+        Return a page
+
+        Args:
+            number: Cursor of the page, `None` or `1` for the first page or
+                `last` for the last one.
+
+        Raises:
+            InvalidPage: The cursor is not valid, or the page is empty.
+        """
+
+        cursor = self.validate_number(number)
+
+        if cursor == "last":
+            rows = self.rows(BEFORE)
+            objects = rows[: self.per_page][::-1]
+            page = CursorPage(objects, self)
+
+            if len(rows) > self.per_page:
+                page.previous_cursor = self.encode(objects[0], BEFORE)
+
+        elif cursor is None:
+            rows = self.rows(AFTER)
+            objects = rows[: self.per_page]
+            page = CursorPage(objects, self)
+
+            if len(rows) > self.per_page:
+                page.next_cursor = self.encode(objects[-1], AFTER)
+
+        else:
+            direction, value, pk = self.decode(cursor)
+            rows = self.rows(direction, value, pk)
+
+            if direction == BEFORE and len(rows) <= self.per_page:
+                # Back at the start, a full first page rather than a short one
+                return self.page()
+
+            if direction == AFTER:
+                objects = rows[: self.per_page]
+                more = len(rows) > self.per_page
+                page = CursorPage(objects, self)
+
+                if objects:
+                    page.previous_cursor = self.encode(objects[0], BEFORE)
+
+                if more:
+                    page.next_cursor = self.encode(objects[-1], AFTER)
+
+            else:
+                objects = rows[: self.per_page][::-1]
+                page = CursorPage(
+                    objects,
+                    self,
+                    next_cursor=self.encode(objects[-1], AFTER),
+                    previous_cursor=self.encode(objects[0], BEFORE),
+                )
+
+        first = cursor in (None, "last")
+
+        if not page.object_list and (not first or not self.allow_empty_first_page):
+            raise EmptyPage(_("That page contains no results"))
+
+        return page
@@ -0,0 +1,144 @@
+"""Random sampling of querysets without `ORDER BY RANDOM()`"""
+
+import random
+import time
+from typing import List, Optional
+
+from django.core.cache import caches
+from django.db.models import QuerySet
+
+
+def sample_by_id(queryset: QuerySet, size: int = 1) -> List:
+    """
+    Sample rows by seeking random primary keys
+
+    Every pick is an index seek to the first row at or after a random key
+    between the smallest and largest one, instead of sorting the whole table.
+    Rows that follow large gaps in the keys are picked more often, so this
+    suits dense tables like images better than filtered page trees. Picks
+    that keep landing on the same rows are topped up with the rows following
+    one more random key, wrapping around, so `size` rows are returned as long
+    as the queryset has them.
+
+    Args:
+        queryset (QuerySet): Rows to sample from.
+        size (int): Number of rows, fewer are returned if the queryset is small.
+
+    Returns:
+        List: Distinct rows in random order.
+    """
+
+    # Two seeks, some backends scan the table for `MIN()` and `MAX()` together
+    pks = queryset.order_by("pk").values_list("pk", flat=True)
+    low, high = pks.first(), pks.last()
+
+    if low is None:
+        return []
+
+    rows = {}
+
+    for _ in range(size * 3):
+        if len(rows) == size:
+            break
+
+        pk = random.randint(low, high)
+        row = queryset.filter(pk__gte=pk).order_by("pk").first()
+
+        if row is not None:
+            rows.setdefault(row.pk, row)
+
+    if len(rows) < size:
+        pk = random.randint(low, high)
+        remaining = queryset.exclude(pk__in=list(rows)).order_by("pk")
+
+        for part in [remaining.filter(pk__gte=pk), remaining.filter(pk__lt=pk)]:
+            for row in part[: size - len(rows)]:
+                rows[row.pk] = row
+
+            if len(rows) == size:
+                break
+
+    sample = list(rows.values())
+    random.shuffle(sample)
+
+    return sample
+
+
+# Create your samplers here.
+class IdSampler:
+    """
+    Sample a queryset from a cached list of its primary keys
+
+    The ids of each sampled queryset are cached under a caller provided key,
+    a sample is then a `random.sample` of that list and a single `pk IN (...)`
+    lookup. All keys share a version, so `clear` refreshes every list at once
+    when pages are published, unpublished, moved or deleted.
+    """
+
+    key_prefix = "tcn:sample"
+
+    def __init__(
+        self, name: str, cache_alias: str = "default", timeout: Optional[int] = None
+    ) -> None:
+        self.name = name
+        self.cache_alias = cache_alias
+        self.timeout = timeout
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    @property
+    def version(self) -> int:
+        """Current version of the cached id lists"""
+
+        return self.cache.get_or_set(
+            f"{self.key_prefix}:{self.name}:version", time.time_ns, timeout=None
+        )
+
+    def key(self, key: str) -> str:
+        return f"{self.key_prefix}:{self.name}:{key}"
+
+    def ids(self, queryset: QuerySet, key: str) -> List[int]:
+        """Cached primary keys of a queryset"""
+
+        return self.cache.get_or_set(
+            self.key(key),
+            lambda: list(queryset.order_by().values_list("pk", flat=True)),
+            timeout=self.timeout,
+            version=self.version,
+        )
+
+    def sample(self, queryset: QuerySet, size: int, key: str) -> List:
+        """
+        Random rows of a queryset
+
+        Args:
+            queryset (QuerySet): Rows to sample from.
+            size (int): Number of rows, fewer are returned if the queryset is small.
+            key (str): Cache key of the queryset ids.
+
+        Returns:
+            List: Distinct rows in random order.
+        """
+
+        ids = self.ids(queryset, key)
+        ids = random.sample(ids, min(size, len(ids)))
+        rows = queryset.in_bulk(ids)
+
+        # Rows removed since the ids were cached are skipped
+        return [rows[pk] for pk in ids if pk in rows]
+
+    def clear(self) -> None:
+        """Invalidate every cached id list"""
+
+        try:
+            self.cache.incr(f"{self.key_prefix}:{self.name}:version")
+
+        except ValueError:
+            self.cache.set(
+                f"{self.key_prefix}:{self.name}:version", time.time_ns(), timeout=None
+            )
+
+
+category_sampler = IdSampler("categories")
@@ -1,10 +1,13 @@
-"""Signals to invalidate index pages"""
+"""Signals to invalidate index pages and cached lookups"""
 
-from django.db.models.signals import pre_delete
+from django.db.models.signals import post_delete, post_save, pre_delete
 from wagtail.contrib.frontend_cache.utils import PurgeBatch
-from wagtail.signals import page_published
+from wagtail.models import Locale
+from wagtail.signals import page_published, page_unpublished, post_page_move
 
 from tcn.apps.categories.models import Category
+from tcn.apps.locales import locales
+from tcn.apps.sampling import category_sampler
 
 
 def invalidate_index(sender, **kwargs):
@@ -15,6 +18,18 @@ def invalidate_index(sender, **kwargs):
     batch.purge()
 
 
+def refresh_category_sample(sender, **kwargs):
+    """Refresh the cached category ids sampled on home pages"""
+
+    category_sampler.clear()
+
+
+def clear_locales(sender, **kwargs):
+    """Reload the locale map after a locale changes"""
+
+    locales.clear()
+
+
 def register_signal_receivers(sender):
     """Register signal receivers"""
 
@@ -24,3 +39,11 @@ def register_signal_receivers(sender):
 
 def register_category_signal_receivers():
     register_signal_receivers(Category)
+
+    for signal in [page_published, page_unpublished, post_page_move, post_delete]:
+        signal.connect(refresh_category_sample, sender=Category)
+
+
+def register_locale_signal_receivers():
+    post_save.connect(clear_locales, sender=Locale)
+    post_delete.connect(clear_locales, sender=Locale)
@@ -0,0 +1,410 @@
+"""Message broker shared by the channel layers of many processes"""
+
+import asyncio
+import hmac
+import json
+import logging
+import os
+import stat
+import struct
+import time
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from django.utils.crypto import salted_hmac
+
+logger = logging.getLogger(__name__)
+
+HEADER = struct.Struct("!I")
+DEFAULT_ADDRESS = "unix:///tmp/tcn-channels/broker.sock"
+
+# Largest frame accepted from a peer
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+# Frames waiting in the socket buffer of a slow process before it misses messages
+WRITE_BUFFER_LIMIT = 16 * 1024 * 1024
+
+# Operations a process may send once it said hello
+OPS = {"send", "group_add", "group_discard", "group_send", "forget", "receive", "flush"}
+
+
+class ProtocolError(ValueError):
+    """A peer sent a frame that is not part of the broker protocol"""
+
+
+def encode_frame(frame: Dict[str, Any]) -> bytes:
+    """Length prefixed JSON frame"""
+
+    data = json.dumps(frame, separators=(",", ":")).encode()
+
+    return HEADER.pack(len(data)) + data
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Dict[str, Any]:
+    """
+    Read a frame, raises `asyncio.IncompleteReadError` once the peer is gone
+
+    Raises:
+        ProtocolError: The frame is too large, or not a JSON object.
+    """
+
+    (size,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+
+    if size > MAX_FRAME_SIZE:
+        raise ProtocolError(f"Frame of {size} bytes")
+
+    try:
+        frame = json.loads(await reader.readexactly(size))
+
+    except ValueError:
+        raise ProtocolError("Frame is not JSON")
+
+    if not isinstance(frame, dict):
+        raise ProtocolError("Frame is not an object")
+
+    return frame
+
+
+def default_secret() -> str:
+    """Shared secret of the broker and its layers, derived from `SECRET_KEY`"""
+
+    return salted_hmac("tcn.channels.broker", "hello").hexdigest()
+
+
+def private_socket_directory(path: str) -> None:
+    """
+    Create the directory of a Unix socket, readable by this user only
+
+    Raises:
+        PermissionError: The directory exists, and others own or can open it.
+    """
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.stat(directory)
+
+    if info.st_uid != os.getuid() or stat.S_IMODE(info.st_mode) & 0o077:
+        raise PermissionError(
+            f"The broker socket directory `{directory}` must be private to its user"
+        )
+
+
+def parse_address(address: str) -> Tuple[str, Any]:
+    """
+    Split a broker address
+
+    Args:
+        address (str): `unix:///path/to/socket` or `tcp://host:port`.
+
+    Returns:
+        Tuple: Transport and its arguments.
+    """
+
+    if address.startswith("unix://"):
+        return "unix", address[len("unix://") :]
+
+    if address.startswith("tcp://"):
+        host, _, port = address[len("tcp://") :].rpartition(":")
+        return "tcp", (host.strip("[]") or "127.0.0.1", int(port))
+
+    raise ValueError(f"Unsupported broker address `{address}`")
+
+
+async def open_connection(address: str):
+    """Open a stream to a broker"""
+
+    transport, target = parse_address(address)
+
+    if transport == "unix":
+        return await asyncio.open_unix_connection(target)
+
+    return await asyncio.open_connection(*target)
+
+
+def owner(channel: str) -> Optional[str]:
+    """Process prefix of a process-specific channel name"""
+
+    return channel[: channel.find("!") + 1] if "!" in channel else None
+
+
+# Create your brokers here.
+class Broker:
+    """
+    Group membership and message routing for `BrokerChannelLayer`
+
+    Every layer registers the prefix of its process-specific channels, a
+    group send is written once per process holding members of the group,
+    with the list of its local channels, and the layer fans it out in memory.
+    Channels without a process prefix are queued here, up to `capacity`
+    messages each, until a layer pulls them.
+
+    Group memberships expire after `group_expiry` seconds and are dropped as
+    soon as the process owning the channel disconnects.
+
+    A connection must start with a hello frame carrying the shared `secret`,
+    it is closed on any other frame, and on frames that are not part of the
+    protocol. Unix sockets are only open to the user of the broker.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100,
+        group_expiry: int = 86400,
+        secret: Optional[str] = None,
+    ) -> None:
+        self.capacity = capacity
+        self.group_expiry = group_expiry
+        self.secret = secret or default_secret()
+        self.groups: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self.memberships: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
+        self.processes: Dict[str, asyncio.StreamWriter] = {}
+        self.queues: Dict[str, Deque[Tuple[float, Dict]]] = defaultdict(deque)
+        self.waiters: Dict[str, Deque[Tuple[asyncio.StreamWriter, int]]] = defaultdict(
+            deque
+        )
+        self.dropped = 0
+
+    async def serve(self, address: str) -> asyncio.AbstractServer:
+        """Start listening on an address"""
+
+        transport, target = parse_address(address)
+
+        if transport == "unix":
+            private_socket_directory(target)
+            server = await asyncio.start_unix_server(self.handle, target)
+            os.chmod(target, 0o600)
+
+            return server
+
+        return await asyncio.start_server(self.handle, *target)
+
+    def hello(self, frame: Dict, writer: asyncio.StreamWriter) -> str:
+        """Authenticate a connection, and register the prefix of its process"""
+
+        prefix, secret = frame.get("prefix"), frame.get("secret")
+
+        if frame.get("op") != "hello" or not isinstance(secret, str):
+            raise ProtocolError("Expected a hello frame")
+
+        if not hmac.compare_digest(secret.encode(), self.secret.encode()):
+            raise ProtocolError("Wrong secret")
+
+        if not isinstance(prefix, str) or not prefix.endswith("!"):
+            raise ProtocolError("Invalid process prefix")
+
+        self.processes[prefix] = writer
+
+        return prefix
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve the frames of a connection"""
+
+        prefix = None
+
+        try:
+            prefix = self.hello(await read_frame(reader), writer)
+
+            while True:
+                frame = await read_frame(reader)
+                op = frame.get("op")
+
+                if not isinstance(op, str) or op not in OPS:
+                    raise ProtocolError(f"Unknown operation {op!r}")
+
+                try:
+                    result = getattr(self, f"op_{op}")(frame, writer)
+
+                except (KeyError, TypeError, AttributeError) as e:
+                    raise ProtocolError(f"Invalid {op} frame: {e!r}")
+
+                if "id" in frame and result is not NotImplemented:
+                    writer.write(
+                        encode_frame(
+                            {"op": "reply", "id": frame["id"], **(result or {})}
+                        )
+                    )
+
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            # Peer gone or broker shutting down, nothing left to answer
+            pass
+
+        except ProtocolError as e:
+            logger.warning("Closing a channel broker connection: %s", e)
+
+        except Exception:
+            logger.exception("Closing a channel broker connection")
+
+        finally:
+            if prefix and self.processes.get(prefix) is writer:
+                self.forget_process(prefix)
+
+            writer.close()
+
+    def forget_process(self, prefix: str) -> None:
+        """Drop a disconnected process and the memberships of its channels"""
+
+        del self.processes[prefix]
+
+        for group, channel in self.memberships.pop(prefix, set()):
+            self.groups[group].pop(channel, None)
+
+            if not self.groups[group]:
+                del self.groups[group]
+
+    def op_send(self, frame: Dict, writer: asyncio.StreamWriter) -> Dict:
+        channel = frame["channel"]
+
+        if self.deliver([channel], frame["message"], frame.get("capacity")):
+            return {}
+
+        return {"error": "full"}
+
+    def op_group_add(self, frame: Dict, writer: asyncio.StreamWriter) -> Dict:
+        group, channel = frame["group"], frame["channel"]
+        self.groups[group][channel] = time.time()
+
+        if owner(channel):
+            self.memberships[owner(channel)].add((group, channel))
+
+        return {}
+
+    def op_group_discard(self, frame: Dict, writer: asyncio.StreamWriter) -> Dict:
+        group, channel = frame["group"], frame["channel"]
+        self.discard(group, channel)
+
+        return {}
+
+    def op_group_send(self, frame: Dict, writer: asyncio.StreamWriter) -> Dict:
+        group = frame["group"]
+        deadline = time.time() - self.group_expiry
+        members = self.groups.get(group, {})
+
+        for channel in [channel for channel, at in members.items() if at < deadline]:
+            self.discard(group, channel)
+
+        self.deliver(list(members), frame["message"])
+
+        return {"channels": len(members)}
+
+    def op_forget(self, frame: Dict, writer: asyncio.StreamWriter) -> Dict:
+        """Drop every membership of a channel that stopped receiving"""
+
+        channel = frame["channel"]
+
+        for group, member in list(self.memberships.get(owner(channel), ())):
+            if member == channel:
+                self.discard(group, channel)
+
+        return {}
+
+    def op_receive(self, frame: Dict, writer: asyncio.StreamWriter):
+        """Pull a message of a channel without a process prefix"""
+
+        channel = frame["channel"]
+        queue = self.queues.get(channel)
+        deadline = time.time() - frame.get("expiry", 60)
+
+        while queue:
+            at, message = queue.popleft()
+
+            if at >= deadline:
+                return {"message": message}
+
+        self.waiters[channel].append((writer, frame["id"]))
+
+        # Answered once a message arrives
+        return NotImplemented
+
+    def op_flush(self, frame: Dict, writer: asyncio.StreamWriter) -> Dict:
+        self.groups.clear()
+        self.memberships.clear()
+        self.queues.clear()
+
+        return {}
+
+    def discard(self, group: str, channel: str) -> None:
+        members = self.groups.get(group)
+
+        if members is not None:
+            members.pop(channel, None)
+
+            if not members:
+                del self.groups[group]
+
+        if owner(channel):
+            self.memberships[owner(channel)].discard((group, channel))
+
+    def deliver(
+        self, channels: List[str], message: Dict, capacity: Optional[int] = None
+    ) -> bool:
+        """
+        Route a message to channels, once per process
+
+        Returns:
+            bool: Whether every channel could take the message.
+        """
+
+        local: Dict[str, List[str]] = defaultdict(list)
+        delivered = True
+
+        for channel in channels:
+            prefix = owner(channel)
+
+            if prefix:
+                local[prefix].append(channel)
+                continue
+
+            waiters = self.waiters.get(channel)
+
+            while waiters:
+                writer, request_id = waiters.popleft()
+
+                if not writer.is_closing():
+                    writer.write(
+                        encode_frame(
+                            {"op": "reply", "id": request_id, "message": message}
+                        )
+                    )
+                    break
+
+            else:
+                queue = self.queues[channel]
+
+                if len(queue) >= (capacity or self.capacity):
+                    self.dropped += 1
+                    delivered = False
+
+                else:
+                    queue.append((time.time(), message))
+
+        for prefix, targets in local.items():
+            writer = self.processes.get(prefix)
+
+            if writer is None or writer.is_closing():
+                continue
+
+            if writer.transport.get_write_buffer_size() > WRITE_BUFFER_LIMIT:
+                # The process stopped reading, it misses messages instead of
+                # growing the broker memory
+                self.dropped += len(targets)
+                delivered = False
+                continue
+
+            writer.write(
+                encode_frame({"op": "deliver", "channels": targets, "message": message})
+            )
+
+        return delivered
+
+
+async def run_broker(address: str, **kwargs) -> None:
+    """Run a broker until cancelled"""
+
+    broker = Broker(**kwargs)
+    server = await broker.serve(address)
+    logger.info("Channel broker listening on %s", address)
+
+    async with server:
+        await server.serve_forever()
@@ -1,42 +1,192 @@
 """Consumers"""
 
-from typing import Any, Dict
+import asyncio
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs
 
+from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from django.conf import settings
+from django.core.cache import cache
+
+from tcn.channels import metrics
+from tcn.channels.replay import encode_message, live_replay
+
+# Fields of the breaking news staff can broadcast from their socket
+INBOUND_FIELDS = ("url", "title", "created_at")
+
+# Close code of readers that fell behind, they reconnect and resume
+TRY_AGAIN_LATER = 1013
+
+
+def is_live_language(language_code: str) -> bool:
+    """Whether a language has a live feed, one of `LANGUAGES`"""
+
+    return any(code == language_code for code, _ in settings.LANGUAGES)
 
 
 # Create your consumers here.
 class LiveFeedConsumer(AsyncJsonWebsocketConsumer):
-    """Live breaking news feed"""
+    """
+    Live breaking news feed
+
+    Readers get the recent breaking news on connect, or only the ones they
+    missed when they pass the `last_event_id` they saw before reconnecting.
+
+    Messages wait in a bounded queue per connection and are sent as lists,
+    bursts arriving within `LIVE_FEED_COALESCE_DELAY` share a frame. Readers
+    that fall `LIVE_FEED_QUEUE_SIZE` messages behind are disconnected.
+    """
 
     groups = []
     language: str
+    last_event_id: Optional[int] = None
+    queue: asyncio.Queue
+    writer: Optional[asyncio.Task] = None
+    subscribed = False
 
     async def connect(self) -> None:
         self.language = self.scope["url_route"]["kwargs"]["language_code"]
+
+        if not is_live_language(self.language):
+            await self.close()
+            return
+
         self.groups = [f"{self.language}-live"]
+        self.queue = asyncio.Queue(
+            maxsize=getattr(settings, "LIVE_FEED_QUEUE_SIZE", 100)
+        )
 
         await self.channel_layer.group_add(self.groups[0], self.channel_name)
+        await self.accept()
+        metrics.subscribers.inc(language=self.language, transport="websocket")
+        self.subscribed = True
+
+        self.writer = asyncio.ensure_future(self.write())
+        query = parse_qs(self.scope.get("query_string", b"").decode())
+
+        try:
+            self.last_event_id = int(query["last_event_id"][0])
 
-        return await self.accept()
+        except (KeyError, ValueError):
+            self.last_event_id = None
+
+        # Joined the group first, so nothing sent meanwhile is lost
+        await self.enqueue(
+            await database_sync_to_async(live_replay.since)(
+                self.language, self.last_event_id
+            )
+        )
 
     async def disconnect(self, close_code) -> None:
-        await self.channel_layer.group_discard(self.groups[0], self.channel_name)
+        if self.writer is not None:
+            self.writer.cancel()
+            self.writer = None
+
+        if self.subscribed:
+            metrics.subscribers.dec(language=self.language, transport="websocket")
+
+        if self.groups:
+            await self.channel_layer.group_discard(self.groups[0], self.channel_name)
+
+    async def receive(self, text_data=None, bytes_data=None, **kwargs) -> None:
+        # Readers only listen, their messages are not even decoded
+        if not self.is_staff():
+            return
+
+        await super().receive(text_data=text_data, bytes_data=bytes_data, **kwargs)
 
     async def receive_json(
         self, content: Dict[str, Any], **kwargs: Dict[str, Any]
     ) -> None:
-        """Send received breaking news"""
+        """Send breaking news received from staff"""
+
+        article = content.get("article") if isinstance(content, dict) else None
+
+        if not isinstance(article, dict) or not await self.allow_inbound():
+            return
 
         await self.channel_layer.group_send(
             self.groups[0],
             {
                 "type": "broadcast",
-                "article": content["article"],
+                "messages": [
+                    encode_message(
+                        {
+                            key: str(article[key])
+                            for key in INBOUND_FIELDS
+                            if key in article
+                        }
+                    )
+                ],
             },
         )
 
+    def is_staff(self) -> bool:
+        user = self.scope.get("user")
+
+        return bool(user and user.is_authenticated and user.is_staff)
+
+    async def allow_inbound(self) -> bool:
+        """Allow `LIVE_FEED_INBOUND_RATE` broadcasts per user and minute"""
+
+        key = f"tcn:live:inbound:{self.scope['user'].pk}"
+        await cache.aadd(key, 0, timeout=60)
+
+        try:
+            count = await cache.aincr(key)
+
+        except ValueError:
+            # The window expired in between
+            await cache.aset(key, 1, timeout=60)
+            count = 1
+
+        return count <= getattr(settings, "LIVE_FEED_INBOUND_RATE", 10)
+
     async def broadcast(self, event: Dict[str, Any]):
         """Broadcast breaking news"""
 
-        await self.send_json(event["article"])
+        await self.enqueue(event["messages"])
+
+    async def enqueue(self, messages: List[Dict[str, Any]]) -> None:
+        """Queue messages for the reader, disconnect it once it falls behind"""
+
+        if self.writer is None:
+            return
+
+        for message in messages:
+            # Already replayed on connect
+            if "id" in message:
+                if message["id"] <= (self.last_event_id or 0):
+                    continue
+
+                self.last_event_id = message["id"]
+
+            try:
+                self.queue.put_nowait(message)
+
+            except asyncio.QueueFull:
+                metrics.dropped.inc(language=self.language, transport="websocket")
+                self.writer.cancel()
+                self.writer = None
+                await self.close(code=TRY_AGAIN_LATER)
+                return
+
+    async def write(self) -> None:
+        """Send queued messages, one frame per burst"""
+
+        delay = getattr(settings, "LIVE_FEED_COALESCE_DELAY", 0.05)
+
+        while True:
+            messages = [await self.queue.get()]
+
+            if delay:
+                await asyncio.sleep(delay)
+
+            while not self.queue.empty():
+                messages.append(self.queue.get_nowait())
+
+            # Messages are encoded once when published, frames only join them
+            await self.send(
+                text_data="[" + ",".join(message["data"] for message in messages) + "]"
+            )
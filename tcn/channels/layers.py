@@ -0,0 +1,299 @@
+"""Channel layer shared across processes and hosts through a broker"""
+
+import asyncio
+import logging
+import threading
+import uuid
+from collections import defaultdict
+from itertools import count
+from typing import Any, Dict, Optional, Set, Tuple
+
+from channels.exceptions import ChannelFull
+from channels.layers import BaseChannelLayer
+
+from tcn.channels.broker import (
+    DEFAULT_ADDRESS,
+    ProtocolError,
+    default_secret,
+    encode_frame,
+    open_connection,
+    read_frame,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Create your channel layers here.
+class BrokerChannelLayer(BaseChannelLayer):
+    """
+    Channel layer backed by a `Broker`, over a Unix socket or TCP
+
+    Each process keeps a single broker connection, owned by a background
+    event loop, so the layer can be used from any loop, including the short
+    lived ones of `async_to_sync`. Messages for the process-specific channels
+    of the consumers arrive once per group send and are fanned out to bounded
+    in-memory queues, a consumer that falls `capacity` messages behind misses
+    the next ones. The connection opens with the `secret` shared with the
+    broker.
+    """
+
+    extensions = ["groups", "flush"]
+
+    def __init__(
+        self,
+        address: str = DEFAULT_ADDRESS,
+        expiry: int = 60,
+        group_expiry: int = 86400,
+        capacity: int = 100,
+        channel_capacity: Optional[Dict] = None,
+        timeout: float = 5,
+        secret: Optional[str] = None,
+    ) -> None:
+        super().__init__(expiry=expiry, capacity=capacity)
+        self.address = address
+        self.secret = secret or default_secret()
+        self.group_expiry = group_expiry
+        self.timeout = timeout
+        self.channel_capacity = self.compile_capacities(channel_capacity or {})
+        self.prefix = f"specific.{uuid.uuid4().hex}!"
+        self.ids = count()
+        self.lock = threading.Lock()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.connecting: Optional[asyncio.Future] = None
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.receivers: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = {}
+        self.groups: Dict[str, Set[str]] = defaultdict(set)
+        self.dropped = 0
+
+    # Broker connection, on the background loop
+
+    def io_loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop of the broker connection, started on first use"""
+
+        with self.lock:
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self.loop.run_forever, name="channel-layer", daemon=True
+                ).start()
+
+        return self.loop
+
+    async def connect(self) -> asyncio.StreamWriter:
+        if self.writer is not None and not self.writer.is_closing():
+            return self.writer
+
+        if self.connecting is None:
+            self.connecting = asyncio.ensure_future(self.open())
+
+        try:
+            return await asyncio.shield(self.connecting)
+
+        finally:
+            if self.connecting is not None and self.connecting.done():
+                self.connecting = None
+
+    async def open(self) -> asyncio.StreamWriter:
+        reader, writer = await open_connection(self.address)
+        writer.write(
+            encode_frame({"op": "hello", "prefix": self.prefix, "secret": self.secret})
+        )
+
+        # Restore the memberships of this process after a broker restart
+        for group, channels in list(self.groups.items()):
+            for channel in list(channels):
+                writer.write(
+                    encode_frame(
+                        {"op": "group_add", "group": group, "channel": channel}
+                    )
+                )
+
+        self.writer = writer
+        asyncio.ensure_future(self.listen(reader, writer))
+
+        return writer
+
+    async def listen(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Read replies and deliveries until the broker goes away"""
+
+        try:
+            while True:
+                frame = await read_frame(reader)
+
+                if frame["op"] == "deliver":
+                    self.dispatch(frame["channels"], frame["message"])
+
+                elif frame["op"] == "reply" and "id" in frame:
+                    future = self.pending.pop(frame["id"], None)
+
+                    if future is not None and not future.done():
+                        future.set_result(frame)
+
+        except (asyncio.IncompleteReadError, ConnectionError, ProtocolError):
+            if not writer.is_closing():
+                logger.warning("Lost the connection to the channel broker")
+
+        finally:
+            writer.close()
+
+            if self.writer is writer:
+                self.writer = None
+
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Channel broker went away"))
+
+            self.pending.clear()
+
+    async def exchange(self, frame: Dict[str, Any], reply: bool) -> Optional[Dict]:
+        writer = await self.connect()
+
+        if not reply:
+            writer.write(encode_frame(frame))
+            return None
+
+        frame["id"] = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[frame["id"]] = future
+        writer.write(encode_frame(frame))
+
+        return await future
+
+    async def request(
+        self, frame: Dict[str, Any], reply: bool = True, timeout: Optional[float] = -1
+    ) -> Optional[Dict]:
+        """Send a frame from any event loop, and wait for its reply"""
+
+        future = asyncio.run_coroutine_threadsafe(
+            self.exchange(frame, reply), self.io_loop()
+        )
+
+        return await asyncio.wait_for(
+            asyncio.wrap_future(future), self.timeout if timeout == -1 else timeout
+        )
+
+    def dispatch(self, channels, message: Dict) -> None:
+        """Hand a delivered message to the queues of local channels"""
+
+        targets = defaultdict(list)
+
+        for channel in channels:
+            receiver = self.receivers.get(channel)
+
+            if receiver is not None:
+                targets[receiver[0]].append(receiver[1])
+
+        # One wake up per consumer loop, not per channel
+        for loop, queues in targets.items():
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self.put, queues, message)
+
+    def put(self, queues, message: Dict) -> None:
+        for queue in queues:
+            try:
+                queue.put_nowait(message)
+
+            except asyncio.QueueFull:
+                self.dropped += 1
+
+    # Channel layer API
+
+    async def new_channel(self, prefix: str = "specific.") -> str:
+        channel = f"{self.prefix}{uuid.uuid4().hex}"
+        self.receiver(channel)
+
+        return channel
+
+    def receiver(self, channel: str) -> asyncio.Queue:
+        if channel not in self.receivers:
+            self.receivers[channel] = (
+                asyncio.get_running_loop(),
+                asyncio.Queue(maxsize=self.get_capacity(channel)),
+            )
+
+        return self.receivers[channel][1]
+
+    async def send(self, channel: str, message: Dict) -> None:
+        assert isinstance(message, dict), "message is not a dict"
+        self.require_valid_channel_name(channel)
+
+        reply = await self.request(
+            {
+                "op": "send",
+                "channel": channel,
+                "message": message,
+                "capacity": self.get_capacity(channel),
+            }
+        )
+
+        if reply.get("error") == "full":
+            raise ChannelFull(channel)
+
+    async def receive(self, channel: str) -> Dict:
+        self.require_valid_channel_name(channel)
+
+        if not channel.startswith(self.prefix):
+            reply = await self.request(
+                {"op": "receive", "channel": channel, "expiry": self.expiry},
+                timeout=None,
+            )
+
+            return reply["message"]
+
+        queue = self.receiver(channel)
+
+        try:
+            return await queue.get()
+
+        except asyncio.CancelledError:
+            # The consumer is gone, forget its channel and memberships
+            self.receivers.pop(channel, None)
+
+            for channels in self.groups.values():
+                channels.discard(channel)
+
+            asyncio.run_coroutine_threadsafe(
+                self.exchange({"op": "forget", "channel": channel}, reply=False),
+                self.io_loop(),
+            )
+            raise
+
+    async def group_add(self, group: str, channel: str) -> None:
+        self.require_valid_group_name(group)
+        self.require_valid_channel_name(channel)
+
+        if channel.startswith(self.prefix):
+            self.groups[group].add(channel)
+
+        await self.request({"op": "group_add", "group": group, "channel": channel})
+
+    async def group_discard(self, group: str, channel: str) -> None:
+        self.require_valid_group_name(group)
+        self.require_valid_channel_name(channel)
+        self.groups[group].discard(channel)
+
+        if not self.groups[group]:
+            del self.groups[group]
+
+        await self.request({"op": "group_discard", "group": group, "channel": channel})
+
+    async def group_send(self, group: str, message: Dict) -> None:
+        assert isinstance(message, dict), "message is not a dict"
+        self.require_valid_group_name(group)
+
+        await self.request({"op": "group_send", "group": group, "message": message})
+
+    async def flush(self) -> None:
+        self.receivers.clear()
+        self.groups.clear()
+
+        await self.request({"op": "flush"})
+
+    async def close(self) -> None:
+        """Close the broker connection"""
+
+        if self.loop is not None and self.writer is not None:
+            self.loop.call_soon_threadsafe(self.writer.close)
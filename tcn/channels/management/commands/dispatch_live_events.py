@@ -0,0 +1,43 @@
+"""Send the pending breaking news of the live feed outbox"""
+
+from django.core.management.base import BaseCommand
+
+from tcn.apps.caches import require_shared
+from tcn.channels.outbox import live_outbox
+
+
+# Create your commands here.
+class Command(BaseCommand):
+    """Drain the live feed outbox, including the events that ran out of attempts"""
+
+    help = "Send pending breaking news to the live feed and prune sent events"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retry-failed",
+            action="store_true",
+            help="Give the events that ran out of attempts another chance",
+        )
+        parser.add_argument(
+            "--prune",
+            type=int,
+            default=7,
+            help="Delete the events sent more than this many days ago (default: 7)",
+        )
+
+    def handle(self, *args, **options):
+        # Dispatchers take turns, and buffer replays, through the cache
+        require_shared()
+
+        if options["retry_failed"]:
+            retried = live_outbox.retry_failed()
+            self.stdout.write(f"Retrying {retried} failed events")
+
+        self.stdout.write(f"Pending: {live_outbox.pending().count()} events")
+
+        sent = live_outbox.dispatch()
+        pruned = live_outbox.prune(options["prune"])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Sent {sent} events, pruned {pruned} events")
+        )
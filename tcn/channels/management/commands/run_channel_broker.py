@@ -0,0 +1,52 @@
+"""Run the broker of the live feed channel layer"""
+
+import asyncio
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from tcn.channels.broker import DEFAULT_ADDRESS, run_broker
+
+
+# Create your commands here.
+class Command(BaseCommand):
+    """Serve group membership and message routing for every daphne process"""
+
+    help = "Run the channel broker, on a Unix socket or a TCP address"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--address",
+            default=getattr(settings, "CHANNEL_BROKER_ADDRESS", None)
+            or DEFAULT_ADDRESS,
+            help="unix:///path/to/socket or tcp://host:port "
+            "(default: CHANNEL_BROKER_ADDRESS)",
+        )
+        parser.add_argument(
+            "--capacity",
+            type=int,
+            default=100,
+            help="Messages queued per channel without a consumer (default: 100)",
+        )
+        parser.add_argument(
+            "--group-expiry",
+            type=int,
+            default=86400,
+            help="Seconds before a group membership expires (default: 86400)",
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Channel broker listening on {options['address']}")
+
+        try:
+            asyncio.run(
+                run_broker(
+                    options["address"],
+                    capacity=options["capacity"],
+                    group_expiry=options["group_expiry"],
+                    secret=getattr(settings, "CHANNEL_BROKER_SECRET", None),
+                )
+            )
+
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,184 @@
+"""Live feed metrics, in the Prometheus text format"""
+
+import math
+import threading
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+LabelValues = Tuple[str, ...]
+
+
+def escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(names: Tuple[str, ...], values: LabelValues, **extra: str) -> str:
+    pairs = [*zip(names, values), *extra.items()]
+
+    if not pairs:
+        return ""
+
+    return "{" + ",".join(f'{name}="{escape(value)}"' for name, value in pairs) + "}"
+
+
+def format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# Create your metrics here.
+class Metric:
+    """Metric of the current process, with a value per set of labels"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.lock = threading.Lock()
+        self.values: Dict[LabelValues, float] = defaultdict(float)
+
+    def key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def samples(self) -> List[str]:
+        with self.lock:
+            return [
+                f"{self.name}{format_labels(self.labels, key)} {format_value(value)}"
+                for key, value in sorted(self.values.items())
+            ]
+
+    def render(self) -> str:
+        return "\n".join(
+            [
+                f"# HELP {self.name} {self.documentation}",
+                f"# TYPE {self.name} {self.kind}",
+                *self.samples(),
+            ]
+        )
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        with self.lock:
+            self.values[self.key(labels)] += amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        with self.lock:
+            self.values[self.key(labels)] += amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        with self.lock:
+            self.values[self.key(labels)] = value
+
+
+class Histogram(Metric):
+    kind = "histogram"
+    buckets = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.counts: Dict[LabelValues, List[int]] = {}
+        self.sums: Dict[LabelValues, float] = defaultdict(float)
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self.key(labels)
+
+        with self.lock:
+            counts = self.counts.setdefault(key, [0] * (len(self.buckets) + 1))
+
+            for index, bound in enumerate((*self.buckets, math.inf)):
+                if value <= bound:
+                    counts[index] += 1
+
+            self.sums[key] += value
+
+    def samples(self) -> List[str]:
+        samples = []
+
+        with self.lock:
+            for key, counts in sorted(self.counts.items()):
+                for bound, count in zip((*self.buckets, math.inf), counts):
+                    labels = format_labels(self.labels, key, le=format_value(bound))
+                    samples.append(f"{self.name}_bucket{labels} {count}")
+
+                labels = format_labels(self.labels, key)
+                samples.append(f"{self.name}_sum{labels} {self.sums[key]!r}")
+                samples.append(f"{self.name}_count{labels} {counts[-1]}")
+
+        return samples
+
+
+class Registry:
+    """Metrics exposed on the scrape endpoint of a worker"""
+
+    def __init__(self) -> None:
+        self.metrics: List[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self.metrics) + "\n"
+
+
+registry = Registry()
+
+subscribers = registry.register(
+    Gauge(
+        "tcn_live_subscribers",
+        "Live feed readers connected to this worker",
+        ("language", "transport"),
+    )
+)
+queued = registry.register(
+    Counter("tcn_live_queued_total", "Breaking news queued in the live feed outbox")
+)
+published = registry.register(
+    Counter(
+        "tcn_live_published_total",
+        "Breaking news sent to the live feed",
+        ("language",),
+    )
+)
+fanout_seconds = registry.register(
+    Histogram(
+        "tcn_live_fanout_seconds",
+        "Duration of the group sends of the live feed",
+        ("language",),
+    )
+)
+send_failures = registry.register(
+    Counter(
+        "tcn_live_send_failures_total",
+        "Group sends of the live feed that failed",
+        ("language",),
+    )
+)
+dropped = registry.register(
+    Counter(
+        "tcn_live_dropped_total",
+        "Readers disconnected after falling behind the live feed",
+        ("language", "transport"),
+    )
+)
+layer_dropped = registry.register(
+    Gauge(
+        "tcn_live_layer_dropped_messages",
+        "Messages the channel layer of this worker dropped on full reader queues",
+    )
+)
@@ -0,0 +1,93 @@
+# Generated by Django 5.2.18 on 2026-10-18 10:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("articles", "0006_alter_article_content"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LiveEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="Date created",
+                        verbose_name="Date created",
+                    ),
+                ),
+                (
+                    "available_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="Date of the next delivery attempt",
+                        verbose_name="Next attempt",
+                    ),
+                ),
+                (
+                    "sent_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="Date sent to the live feed",
+                        null=True,
+                        verbose_name="Date sent",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0,
+                        help_text="Failed delivery attempts",
+                        verbose_name="attempts",
+                    ),
+                ),
+                (
+                    "error",
+                    models.TextField(
+                        blank=True,
+                        default="",
+                        help_text="Last delivery error",
+                        verbose_name="error",
+                    ),
+                ),
+                (
+                    "article",
+                    models.ForeignKey(
+                        help_text="article",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="articles.article",
+                        verbose_name="Breaking article",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Live event",
+                "verbose_name_plural": "Live events",
+                "indexes": [
+                    models.Index(
+                        fields=["sent_at", "available_at"],
+                        name="tcn_channel_sent_at_1b799f_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,55 @@
+"""Data Models for tcn.channels"""
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+# Create your models here.
+class LiveEvent(models.Model):
+    """Breaking news waiting in the outbox of the live feed"""
+
+    article = models.ForeignKey(
+        "articles.Article",
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text=_("article"),
+        verbose_name=_("Breaking article"),
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Date created"),
+        help_text=_("Date created"),
+    )
+    available_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name=_("Next attempt"),
+        help_text=_("Date of the next delivery attempt"),
+    )
+    sent_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Date sent"),
+        help_text=_("Date sent to the live feed"),
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name=_("attempts"),
+        help_text=_("Failed delivery attempts"),
+    )
+    error = models.TextField(
+        blank=True,
+        default="",
+        verbose_name=_("error"),
+        help_text=_("Last delivery error"),
+    )
+
+    class Meta:
+        """Meta data"""
+
+        verbose_name = _("Live event")
+        verbose_name_plural = _("Live events")
+        indexes = [models.Index(fields=["sent_at", "available_at"])]
+
+    def __str__(self) -> str:
+        return f"{self.article_id} @ {self.created_at}"
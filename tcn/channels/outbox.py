@@ -0,0 +1,219 @@
+"""Durable outbox of the live breaking news feed"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+from typing import List, Optional
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from tcn.apps.articles.models import Article
+from tcn.channels import metrics
+from tcn.channels.models import LiveEvent
+from tcn.channels.replay import live_message, live_replay
+
+logger = logging.getLogger(__name__)
+
+
+# Create your outboxes here.
+class LiveOutbox:
+    """
+    Breaking news waiting to be sent to the live feed
+
+    Publishing only writes an event to the outbox, in the publish transaction.
+    Once it commits a background thread drains the outbox with one group send
+    per locale, failed sends are retried with an exponential backoff, up to
+    `max_attempts` times. Dispatchers of every process take turns through a
+    lock in the shared cache, the holder checks the outbox again once it
+    releases the lock, for the events committed while the others gave up.
+    """
+
+    lock_key = "tcn:live:outbox:lock"
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        max_attempts: Optional[int] = None,
+        retry_delay: float = 2,
+    ) -> None:
+        self.batch_size = batch_size
+        self.max_attempts = (
+            getattr(settings, "LIVE_OUTBOX_MAX_ATTEMPTS", 5)
+            if max_attempts is None
+            else max_attempts
+        )
+        self.retry_delay = retry_delay
+
+    def add(self, article: Article) -> LiveEvent:
+        """Queue an article, it is sent once the current transaction commits"""
+
+        event = LiveEvent.objects.create(article=article)
+        transaction.on_commit(self.dispatch_later)
+
+        return event
+
+    def dispatch_later(self, delay: float = 0) -> None:
+        """Drain the outbox from a background thread"""
+
+        if delay:
+            timer = threading.Timer(delay, self.dispatch_in_background)
+            timer.daemon = True
+            timer.start()
+
+        else:
+            threading.Thread(target=self.dispatch_in_background, daemon=True).start()
+
+    def dispatch_in_background(self) -> int:
+        """Drain the outbox, then release the database connections of the thread"""
+
+        try:
+            return self.dispatch()
+
+        except Exception:
+            logger.exception("Could not dispatch the live feed outbox")
+            return 0
+
+        finally:
+            connections.close_all()
+
+    def pending(self):
+        """Events ready to be sent"""
+
+        return LiveEvent.objects.filter(
+            sent_at=None,
+            attempts__lt=self.max_attempts,
+            available_at__lte=timezone.now(),
+        ).order_by("id")
+
+    def dispatch(self) -> int:
+        """
+        Send the pending events to the live feed groups of their locales
+
+        Returns:
+            int: Number of events sent.
+        """
+
+        channel_layer = get_channel_layer()
+
+        if not channel_layer:
+            return 0
+
+        sent = 0
+
+        # Only one dispatcher at a time. The others give up, so the holder
+        # looks for events committed meanwhile once it released the lock.
+        while cache.add(self.lock_key, 1, timeout=60):
+            try:
+                while True:
+                    events = list(self.pending()[: self.batch_size])
+
+                    if not events:
+                        break
+
+                    sent += self.send(channel_layer, events)
+
+                    if len(events) < self.batch_size:
+                        break
+
+            finally:
+                cache.delete(self.lock_key)
+
+            if not self.pending().exists():
+                break
+
+        return sent
+
+    def send(self, channel_layer, events: List[LiveEvent]) -> int:
+        articles = (
+            Article.objects.live()
+            .filter(id__in={event.article_id for event in events})
+            .select_related("locale")
+            .with_card_data(renditions=None)
+            .in_bulk()
+        )
+        groups = defaultdict(list)
+        skipped = []
+
+        for event in events:
+            article = articles.get(event.article_id)
+
+            # Unpublished in the meantime
+            if article is None:
+                skipped.append(event.id)
+                continue
+
+            groups[article.locale.language_code].append(event)
+
+        LiveEvent.objects.filter(id__in=skipped).update(sent_at=timezone.now())
+        sent = 0
+
+        for language_code, group_events in groups.items():
+            ids = [event.id for event in group_events]
+            group = f"{language_code}-live"
+            # Encoded once, every reader of the group shares the same text
+            messages = [
+                live_message(articles[event.article_id], event.id)
+                for event in group_events
+            ]
+
+            # Buffered first, readers connecting meanwhile skip the duplicates
+            live_replay.extend(language_code, messages)
+
+            start = time.perf_counter()
+
+            try:
+                async_to_sync(channel_layer.group_send)(
+                    group, {"type": "broadcast", "messages": messages}
+                )
+
+            except Exception as error:
+                metrics.send_failures.inc(language=language_code)
+                attempts = max(event.attempts for event in group_events) + 1
+                delay = self.retry_delay * 2 ** (attempts - 1)
+                logger.warning("Could not send breaking news to %s: %s", group, error)
+                LiveEvent.objects.filter(id__in=ids).update(
+                    attempts=F("attempts") + 1,
+                    available_at=timezone.now() + timedelta(seconds=delay),
+                    error=repr(error),
+                )
+
+                if attempts < self.max_attempts:
+                    self.dispatch_later(delay)
+
+                continue
+
+            metrics.fanout_seconds.observe(
+                time.perf_counter() - start, language=language_code
+            )
+            metrics.published.inc(len(ids), language=language_code)
+            LiveEvent.objects.filter(id__in=ids).update(sent_at=timezone.now())
+            sent += len(ids)
+
+        return sent
+
+    def retry_failed(self) -> int:
+        """Reset the attempts of the events that ran out of them"""
+
+        return LiveEvent.objects.filter(
+            sent_at=None, attempts__gte=self.max_attempts
+        ).update(attempts=0, available_at=timezone.now())
+
+    def prune(self, days: int = 7) -> int:
+        """Delete the events sent more than `days` ago"""
+
+        deleted, _ = LiveEvent.objects.filter(
+            sent_at__lt=timezone.now() - timedelta(days=days)
+        ).delete()
+
+        return deleted
+
+
+live_outbox = LiveOutbox()
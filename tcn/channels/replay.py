@@ -0,0 +1,134 @@
+"""Recent breaking news of the live feed, replayed to connecting readers"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from tcn.apps.articles.models import Article
+from tcn.channels.models import LiveEvent
+
+
+def encode_message(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Encode a live feed message once, for every reader
+
+    Returns:
+        Dict: The event id, if any, and the JSON text of the message.
+    """
+
+    message = {"data": json.dumps(payload, separators=(",", ":"))}
+
+    if "id" in payload:
+        message["id"] = payload["id"]
+
+    return message
+
+
+def live_message(article: Article, event_id: int) -> Dict[str, Any]:
+    """Message of an article on the live feed, readers format its date"""
+
+    return encode_message(
+        {
+            "id": event_id,
+            "url": str(article.short_link),
+            "title": article.title,
+            "created_at": article.created_at.isoformat(),
+        }
+    )
+
+
+# Create your replay buffers here.
+class ReplayBuffer:
+    """
+    Bounded buffer of the last live feed messages, per language
+
+    Readers connecting with the id of the last event they saw only get the
+    ones they missed, new readers get the whole buffer. A cold buffer is
+    loaded from the events already sent by the outbox, and buffers expire
+    after `timeout` seconds to be loaded again.
+    """
+
+    key_prefix = "tcn:live:replay"
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        cache_alias: str = "default",
+        timeout: Optional[int] = None,
+    ) -> None:
+        self.size = size or getattr(settings, "LIVE_REPLAY_SIZE", 50)
+        self.cache_alias = cache_alias
+        self.timeout = timeout or getattr(settings, "LIVE_REPLAY_TIMEOUT", 300)
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def key(self, language_code: str) -> str:
+        return f"{self.key_prefix}:{language_code}"
+
+    def load(self, language_code: str) -> List[Dict]:
+        """Last messages sent to a language, from the outbox"""
+
+        events = list(
+            LiveEvent.objects.filter(
+                sent_at__isnull=False, article__locale__language_code=language_code
+            ).order_by("-id")[: self.size]
+        )
+        articles = (
+            Article.objects.live()
+            .filter(id__in={event.article_id for event in events})
+            .with_card_data(renditions=None)
+            .in_bulk()
+        )
+
+        return [
+            live_message(articles[event.article_id], event.id)
+            for event in reversed(events)
+            if event.article_id in articles
+        ]
+
+    def get(self, language_code: str) -> List[Dict]:
+        """Buffered messages of a language, oldest first"""
+
+        return self.cache.get_or_set(
+            self.key(language_code),
+            lambda: self.load(language_code),
+            timeout=self.timeout,
+        )
+
+    def extend(self, language_code: str, new_messages: List[Dict]) -> None:
+        """
+        Buffer new messages, dropping the oldest ones
+
+        Only the outbox dispatcher, which runs one at a time, writes here.
+        """
+
+        messages = {message["id"]: message for message in self.get(language_code)}
+        messages.update((message["id"], message) for message in new_messages)
+
+        self.cache.set(
+            self.key(language_code),
+            [messages[event_id] for event_id in sorted(messages)][-self.size :],
+            timeout=self.timeout,
+        )
+
+    def since(
+        self, language_code: str, last_event_id: Optional[int] = None
+    ) -> List[Dict]:
+        """Buffered messages after an event, or all of them, oldest first"""
+
+        messages = self.get(language_code)
+
+        if last_event_id is None:
+            return messages
+
+        return [message for message in messages if message["id"] > last_event_id]
+
+    def clear(self, language_code: str) -> None:
+        self.cache.delete(self.key(language_code))
+
+
+live_replay = ReplayBuffer()
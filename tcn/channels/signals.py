@@ -1,39 +1,35 @@
 """Signals to send breaking news to live feed"""
 
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
-from django.utils.timesince import timesince
-from wagtail.signals import page_published
+from wagtail.signals import page_published, page_unpublished
 
 from tcn.apps.articles.models import Article
+from tcn.channels import metrics
+from tcn.channels.outbox import live_outbox
+from tcn.channels.replay import live_replay
 
 
 # Create your signals here.
 def send_to_live_feed(sender, **kwargs):
-    """Send breaking news to live feed"""
+    """Queue breaking news for the live feed"""
+
+    article: Article = kwargs["instance"]
+
+    if article.is_breaking:
+        live_outbox.add(article)
+        metrics.queued.inc()
 
-    channel_layer = get_channel_layer()
 
-    if not channel_layer:
-        return
+def clear_live_replay(sender, **kwargs):
+    """Stop replaying unpublished articles"""
 
     article: Article = kwargs["instance"]
 
     if article.is_breaking:
-        async_to_sync(channel_layer.group_send)(
-            f"{article.locale.language_code}-live",
-            {
-                "type": "broadcast",
-                "article": {
-                    "url": str(article.short_link),
-                    "title": article.title,
-                    "created_at": timesince(article.created_at),
-                },
-            },
-        )
+        live_replay.clear(article.locale.language_code)
 
 
 def register_live_feed():
-    """Register the signal"""
+    """Register the signals"""
 
     page_published.connect(send_to_live_feed, sender=Article)
+    page_unpublished.connect(clear_live_replay, sender=Article)
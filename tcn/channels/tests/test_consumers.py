@@ -0,0 +1,121 @@
+"""Tests for tcn.channels.consumers"""
+
+from unittest.mock import patch
+
+from channels.layers import InMemoryChannelLayer
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from tcn.channels.consumers import TRY_AGAIN_LATER, LiveFeedConsumer
+from tcn.channels.replay import encode_message
+
+User = get_user_model()
+
+
+# Create your tests here.
+@override_settings(
+    LIVE_FEED_QUEUE_SIZE=3, LIVE_FEED_COALESCE_DELAY=0, LIVE_FEED_INBOUND_RATE=1
+)
+class LiveFeedConsumerTests(TestCase):
+    """Live feed consumer tests"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup data"""
+
+        cls.editor = User.objects.create_user(
+            username="editor",
+            email="editor@tests.com",
+            password="editor.tests.1234",
+            slug="editor",
+            is_staff=True,
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.layer = InMemoryChannelLayer()
+        patcher = patch("channels.consumer.get_channel_layer", return_value=self.layer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def connect(self, user=None) -> WebsocketCommunicator:
+        communicator = WebsocketCommunicator(
+            LiveFeedConsumer.as_asgi(), "/wss/en/live/"
+        )
+        communicator.scope["url_route"] = {"kwargs": {"language_code": "en"}}
+        communicator.scope["user"] = user or AnonymousUser()
+        connected, _ = await communicator.connect()
+
+        self.assertTrue(connected)
+
+        return communicator
+
+    async def broadcast(self, *ids: int) -> None:
+        await self.layer.group_send(
+            "en-live",
+            {
+                "type": "broadcast",
+                "messages": [encode_message({"id": i, "title": f"{i}"}) for i in ids],
+            },
+        )
+
+    async def test_language(self) -> None:
+        """Test that only configured languages have a live feed"""
+
+        communicator = WebsocketCommunicator(
+            LiveFeedConsumer.as_asgi(), "/wss/xx/live/"
+        )
+        communicator.scope["url_route"] = {"kwargs": {"language_code": "xx"}}
+        connected, _ = await communicator.connect()
+
+        self.assertFalse(connected)
+        self.assertFalse(self.layer.groups)
+
+    async def test_coalescing(self) -> None:
+        """Test that bursts are sent in a single frame"""
+
+        communicator = await self.connect()
+        await self.broadcast(1, 2, 3)
+
+        self.assertEqual(
+            [article["id"] for article in await communicator.receive_json_from()],
+            [1, 2, 3],
+        )
+
+        await communicator.disconnect()
+
+    async def test_backpressure(self) -> None:
+        """Test that readers falling behind are disconnected"""
+
+        communicator = await self.connect()
+        await self.broadcast(1, 2, 3, 4)
+
+        self.assertEqual(
+            await communicator.receive_output(),
+            {"type": "websocket.close", "code": TRY_AGAIN_LATER},
+        )
+
+    async def test_inbound(self) -> None:
+        """Test that only staff may broadcast, at a limited rate"""
+
+        reader = await self.connect()
+        editor = await self.connect(self.editor)
+        article = {"title": "Breaking", "url": "/l/x/", "script": "<script>"}
+
+        await reader.send_json_to({"article": article})
+
+        self.assertTrue(await reader.receive_nothing())
+
+        await editor.send_json_to({"article": article})
+        await editor.send_json_to({"article": article})
+
+        self.assertEqual(
+            await reader.receive_json_from(), [{"title": "Breaking", "url": "/l/x/"}]
+        )
+        self.assertTrue(await reader.receive_nothing())
+
+        await reader.disconnect()
+        await editor.disconnect()
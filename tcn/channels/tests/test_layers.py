@@ -0,0 +1,191 @@
+"""Tests for tcn.channels.layers"""
+
+import asyncio
+import os
+import stat
+import tempfile
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import patch
+
+from channels.exceptions import ChannelFull
+from channels.testing import WebsocketCommunicator
+from django.test import SimpleTestCase
+
+from tcn.channels.broker import Broker, encode_frame, open_connection
+from tcn.channels.consumers import LiveFeedConsumer
+from tcn.channels.layers import BrokerChannelLayer
+from tcn.channels.replay import encode_message, live_replay
+
+
+# Create your tests here.
+class BrokerChannelLayerTests(SimpleTestCase):
+    """Broker channel layer tests"""
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.address = f"unix://{Path(directory.name) / 'broker.sock'}"
+        self.layers = []
+
+    @asynccontextmanager
+    async def serve(self):
+        """Run a broker on the loop of the test"""
+
+        broker = Broker(capacity=2, group_expiry=60)
+        server = await broker.serve(self.address)
+
+        try:
+            yield broker
+
+        finally:
+            for layer in self.layers:
+                await layer.close()
+
+            server.close()
+
+    def layer(self, **kwargs) -> BrokerChannelLayer:
+        layer = BrokerChannelLayer(address=self.address, **kwargs)
+        self.layers.append(layer)
+
+        return layer
+
+    async def test_group_send_across_processes(self) -> None:
+        """Test that a group send reaches the consumers of another process"""
+
+        async with self.serve() as broker:
+            subscriber, publisher = self.layer(), self.layer()
+            channels = [await subscriber.new_channel() for _ in range(3)]
+
+            for channel in channels:
+                await subscriber.group_add("en-live", channel)
+
+            await publisher.group_send("en-live", {"type": "broadcast", "n": 1})
+
+            for channel in channels:
+                message = await asyncio.wait_for(subscriber.receive(channel), 1)
+                self.assertEqual(message, {"type": "broadcast", "n": 1})
+
+            await subscriber.group_discard("en-live", channels[0])
+            self.assertEqual(set(broker.groups["en-live"]), set(channels[1:]))
+
+    async def test_send_and_capacity(self) -> None:
+        """Test direct sends and bounded queues"""
+
+        async with self.serve():
+            layer = self.layer(capacity=2)
+            await layer.send("tasks", {"type": "task", "n": 1})
+            await layer.send("tasks", {"type": "task", "n": 2})
+
+            with self.assertRaises(ChannelFull):
+                await layer.send("tasks", {"type": "task", "n": 3})
+
+            self.assertEqual((await layer.receive("tasks"))["n"], 1)
+
+            # Consumers that fall behind miss the newest messages
+            channel = await layer.new_channel()
+            await layer.group_add("en-live", channel)
+
+            for n in range(layer.capacity + 5):
+                await layer.group_send("en-live", {"type": "broadcast", "n": n})
+
+            await layer.group_send("en-live", {"type": "broadcast", "n": -1})
+            self.assertEqual(layer.dropped, 6)
+
+    async def test_group_expiry(self) -> None:
+        """Test that stale and disconnected memberships are dropped"""
+
+        async with self.serve() as broker:
+            layer = self.layer()
+            channel = await layer.new_channel()
+            await layer.group_add("en-live", channel)
+
+            with patch("tcn.channels.broker.time.time", return_value=10**12):
+                await layer.group_send("en-live", {"type": "broadcast"})
+
+            self.assertNotIn("en-live", broker.groups)
+
+            await layer.group_add("en-live", channel)
+            await layer.close()
+
+            for _ in range(100):
+                if "en-live" not in broker.groups:
+                    break
+
+                await asyncio.sleep(0.01)
+
+            self.assertNotIn("en-live", broker.groups)
+
+    async def test_protocol(self) -> None:
+        """Test that unauthenticated and malformed connections are closed"""
+
+        async with self.serve() as broker:
+            path = self.address[len("unix://") :]
+            self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+
+            frames = [
+                [{"op": "group_add", "group": "en-live", "channel": "x!y"}],
+                [{"op": "hello", "prefix": "a!", "secret": "wrong"}],
+                [{"op": "hello", "prefix": "b!", "secret": broker.secret}, ["op"]],
+                [{"op": "hello", "prefix": "c!", "secret": broker.secret}, {"op": "x"}],
+                [{"op": "hello", "prefix": "d!", "secret": broker.secret}, {"op": []}],
+                [
+                    {"op": "hello", "prefix": "e!", "secret": broker.secret},
+                    {"op": "send"},
+                ],
+            ]
+
+            for sent in frames:
+                reader, writer = await open_connection(self.address)
+
+                for frame in sent:
+                    writer.write(encode_frame(frame))
+
+                with self.assertLogs("tcn.channels.broker", "WARNING"):
+                    self.assertEqual(await asyncio.wait_for(reader.read(), 1), b"")
+
+                writer.close()
+
+            self.assertEqual(broker.processes, {})
+            self.assertNotIn("en-live", broker.groups)
+
+            # A layer with the wrong secret cannot send
+            with (
+                self.assertLogs("tcn.channels", "WARNING"),
+                self.assertRaises(ConnectionError),
+            ):
+                await self.layer(secret="wrong").group_send("en-live", {"type": "x"})
+
+            await self.layer().group_send("en-live", {"type": "x"})
+
+    async def test_live_feed_consumer(self) -> None:
+        """Test the live feed consumer over the broker"""
+
+        async with self.serve():
+            layer = self.layer()
+
+            with (
+                patch("channels.consumer.get_channel_layer", return_value=layer),
+                patch.object(live_replay, "since", return_value=[]),
+            ):
+                communicator = WebsocketCommunicator(
+                    LiveFeedConsumer.as_asgi(), "/wss/en/live/"
+                )
+                communicator.scope["url_route"] = {"kwargs": {"language_code": "en"}}
+                connected, _ = await communicator.connect()
+
+                self.assertTrue(connected)
+
+                await self.layer().group_send(
+                    "en-live",
+                    {
+                        "type": "broadcast",
+                        "messages": [encode_message({"title": "Breaking"})],
+                    },
+                )
+
+                self.assertEqual(
+                    await communicator.receive_json_from(), [{"title": "Breaking"}]
+                )
+
+                await communicator.disconnect()
@@ -0,0 +1,75 @@
+"""Tests for tcn.channels.metrics"""
+
+from unittest.mock import patch
+
+from channels.layers import InMemoryChannelLayer
+from channels.testing import WebsocketCommunicator
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from tcn.channels import metrics
+from tcn.channels.consumers import LiveFeedConsumer
+from tcn.channels.metrics import Histogram
+
+
+# Create your tests here.
+class MetricsTests(TestCase):
+    """Live feed metrics tests"""
+
+    def test_histogram(self) -> None:
+        """Test the text format of histograms"""
+
+        histogram = Histogram("latency_seconds", "Latency", ("language",))
+        histogram.buckets = (0.1, 1)
+        histogram.observe(0.05, language="en")
+        histogram.observe(0.5, language="en")
+
+        self.assertEqual(
+            histogram.render().splitlines(),
+            [
+                "# HELP latency_seconds Latency",
+                "# TYPE latency_seconds histogram",
+                'latency_seconds_bucket{language="en",le="0.1"} 1',
+                'latency_seconds_bucket{language="en",le="1"} 2',
+                'latency_seconds_bucket{language="en",le="+Inf"} 2',
+                'latency_seconds_sum{language="en"} 0.55',
+                'latency_seconds_count{language="en"} 2',
+            ],
+        )
+
+    @override_settings(LIVE_METRICS_TOKEN="secret")
+    def test_scrape(self) -> None:
+        """Test that only scrapers with the token read the metrics"""
+
+        url = reverse("tcn_live:metrics")
+
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        response = self.client.get(url, headers={"Authorization": "Bearer secret"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        self.assertIn(b"# TYPE tcn_live_fanout_seconds histogram", response.content)
+
+    async def test_subscribers(self) -> None:
+        """Test that connected readers are counted per language"""
+
+        def count() -> float:
+            return metrics.subscribers.values[("fr", "websocket")]
+
+        before = count()
+
+        with patch(
+            "channels.consumer.get_channel_layer", return_value=InMemoryChannelLayer()
+        ):
+            communicator = WebsocketCommunicator(
+                LiveFeedConsumer.as_asgi(), "/wss/fr/live/"
+            )
+            communicator.scope["url_route"] = {"kwargs": {"language_code": "fr"}}
+            await communicator.connect()
+
+            self.assertEqual(count(), before + 1)
+
+            await communicator.disconnect()
+
+        self.assertEqual(count(), before)
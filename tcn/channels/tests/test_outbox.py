@@ -0,0 +1,112 @@
+"""Tests for tcn.channels.outbox"""
+
+import json
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from channels.layers import InMemoryChannelLayer
+from django.test import TestCase
+from django.utils import timezone
+
+from tcn.apps.articles.tests import create_article, create_category
+from tcn.channels.models import LiveEvent
+from tcn.channels.outbox import LiveOutbox, live_outbox
+
+
+# Create your tests here.
+class LiveOutboxTests(TestCase):
+    """Live feed outbox tests"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup data"""
+
+        cls.category = create_category()
+        cls.articles = [
+            create_article(cls.category, f"breaking-{i}", is_breaking=True)
+            for i in range(3)
+        ]
+        cls.calm = create_article(cls.category, "calm")
+
+    def setUp(self) -> None:
+        self.layer = InMemoryChannelLayer()
+        self.outbox = LiveOutbox(batch_size=2, max_attempts=2)
+        patcher = patch(
+            "tcn.channels.outbox.get_channel_layer", return_value=self.layer
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_publish(self) -> None:
+        """Test that publishing breaking news only writes to the outbox"""
+
+        self.assertEqual(
+            list(LiveEvent.objects.values_list("article_id", flat=True)),
+            [article.id for article in self.articles],
+        )
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            create_article(self.category, "breaking-3", is_breaking=True)
+
+        self.assertEqual(LiveEvent.objects.filter(sent_at=None).count(), 4)
+        self.assertIn(live_outbox.dispatch_later, callbacks)
+
+    def test_dispatch(self) -> None:
+        """Test that pending events are sent in batches to their locale group"""
+
+        channel = async_to_sync(self.layer.new_channel)()
+        group = f"{self.articles[0].locale.language_code}-live"
+        async_to_sync(self.layer.group_add)(group, channel)
+
+        self.assertEqual(self.outbox.dispatch(), 3)
+        self.assertFalse(self.outbox.pending().exists())
+
+        titles = [
+            json.loads(message["data"])["title"]
+            for _ in range(2)
+            for message in async_to_sync(self.layer.receive)(channel)["messages"]
+        ]
+
+        self.assertEqual(titles, [article.title for article in self.articles])
+        self.assertEqual(self.outbox.dispatch(), 0)
+
+    def test_dispatch_contended(self) -> None:
+        """Test that events committed while the lock is held are still sent"""
+
+        send = self.outbox.send
+        published = []
+
+        def send_and_publish(channel_layer, events):
+            # Last batch, another publish commits and finds the lock taken
+            if len(events) < self.outbox.batch_size and not published:
+                published.append(LiveEvent.objects.create(article=self.calm))
+                self.assertEqual(self.outbox.dispatch(), 0)
+
+            return send(channel_layer, events)
+
+        with patch.object(self.outbox, "send", side_effect=send_and_publish):
+            self.assertEqual(self.outbox.dispatch(), 4)
+
+        self.assertFalse(self.outbox.pending().exists())
+
+    def test_dispatch_retry(self) -> None:
+        """Test that failed sends are retried later, up to `max_attempts`"""
+
+        with (
+            patch.object(self.layer, "group_send", side_effect=OSError("down")),
+            patch.object(self.outbox, "dispatch_later") as dispatch_later,
+            self.assertLogs("tcn.channels.outbox", "WARNING"),
+        ):
+            self.assertEqual(self.outbox.dispatch(), 0)
+
+        self.assertEqual(dispatch_later.call_count, 2)
+        self.assertFalse(self.outbox.pending().exists())
+
+        event = LiveEvent.objects.first()
+        self.assertEqual(event.attempts, 1)
+        self.assertIn("down", event.error)
+        self.assertGreater(event.available_at, timezone.now())
+
+        LiveEvent.objects.update(available_at=timezone.now())
+
+        self.assertEqual(self.outbox.dispatch(), 3)
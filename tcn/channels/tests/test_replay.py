@@ -0,0 +1,113 @@
+"""Tests for tcn.channels.replay"""
+
+import json
+from unittest.mock import patch
+
+from channels.db import database_sync_to_async
+from channels.layers import InMemoryChannelLayer
+from channels.testing import WebsocketCommunicator
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from tcn.apps.articles.tests import create_article, create_category
+from tcn.channels.consumers import LiveFeedConsumer
+from tcn.channels.models import LiveEvent
+from tcn.channels.replay import ReplayBuffer, live_message, live_replay
+
+
+# Create your tests here.
+class ReplayBufferTests(TestCase):
+    """Live feed replay buffer tests"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup data"""
+
+        cls.category = create_category()
+        cls.articles = [
+            create_article(cls.category, f"breaking-{i}", is_breaking=True)
+            for i in range(4)
+        ]
+        cls.language_code = cls.category.locale.language_code
+        LiveEvent.objects.update(sent_at=timezone.now())
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.buffer = ReplayBuffer(size=3)
+
+    def test_load(self) -> None:
+        """Test that a cold buffer holds the last events sent"""
+
+        self.assertEqual(
+            [
+                json.loads(message["data"])["title"]
+                for message in self.buffer.get(self.language_code)
+            ],
+            [article.title for article in self.articles[1:]],
+        )
+
+        with self.assertNumQueries(0):
+            self.buffer.get(self.language_code)
+
+    def test_live_message(self) -> None:
+        """Test that messages are encoded once, with an ISO date"""
+
+        message = live_message(self.articles[0], 1)
+
+        self.assertEqual(message["id"], 1)
+        self.assertEqual(
+            json.loads(message["data"]),
+            {
+                "id": 1,
+                "url": str(self.articles[0].short_link),
+                "title": self.articles[0].title,
+                "created_at": self.articles[0].created_at.isoformat(),
+            },
+        )
+
+    def test_extend(self) -> None:
+        """Test that the buffer is bounded and keeps events in order"""
+
+        ids = [message["id"] for message in self.buffer.get(self.language_code)]
+        self.buffer.extend(
+            self.language_code,
+            [{"id": ids[-1] + 1, "title": "New"}, {"id": ids[-1], "title": "Again"}],
+        )
+        messages = self.buffer.get(self.language_code)
+
+        self.assertEqual(
+            [message["id"] for message in messages], ids[1:] + [ids[-1] + 1]
+        )
+        self.assertEqual(self.buffer.since(self.language_code, ids[-1]), messages[-1:])
+
+    async def test_consumer_resume(self) -> None:
+        """Test that readers only get the events they missed, once"""
+
+        messages = await database_sync_to_async(live_replay.get)(self.language_code)
+        layer = InMemoryChannelLayer()
+
+        with patch("channels.consumer.get_channel_layer", return_value=layer):
+            communicator = WebsocketCommunicator(
+                LiveFeedConsumer.as_asgi(),
+                f"/wss/{self.language_code}/live/?last_event_id={messages[-3]['id']}",
+            )
+            communicator.scope["url_route"] = {
+                "kwargs": {"language_code": self.language_code}
+            }
+            connected, _ = await communicator.connect()
+
+            self.assertTrue(connected)
+
+            await layer.group_send(
+                f"{self.language_code}-live",
+                {"type": "broadcast", "messages": messages[-1:]},
+            )
+
+            self.assertEqual(
+                await communicator.receive_json_from(),
+                [json.loads(message["data"]) for message in messages[-2:]],
+            )
+            self.assertTrue(await communicator.receive_nothing())
+
+            await communicator.disconnect()
@@ -0,0 +1,119 @@
+"""Tests for tcn.channels.views"""
+
+import asyncio
+from contextlib import suppress
+from unittest.mock import patch
+
+from channels.layers import InMemoryChannelLayer
+from django.http import Http404
+from django.test import AsyncRequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from tcn.channels.replay import encode_message
+from tcn.channels.views import LiveEventsView
+
+
+# Create your tests here.
+@override_settings(LIVE_SSE_KEEPALIVE=0.05, LIVE_SSE_MAX_STREAMS=1)
+class LiveEventsViewTests(TestCase):
+    """Live feed server-sent events tests"""
+
+    def setUp(self) -> None:
+        self.layer = InMemoryChannelLayer()
+        self.url = reverse("tcn_live:live-events", args=["en"])
+        messages = [encode_message({"id": i, "title": f"{i}"}) for i in (1, 2, 3)]
+
+        for target, kwargs in [
+            ("tcn.channels.views.get_channel_layer", {"return_value": self.layer}),
+            ("tcn.channels.views.live_replay.since", {}),
+        ]:
+            patcher = patch(target, **kwargs)
+            mock = patcher.start()
+            self.addCleanup(patcher.stop)
+
+        mock.side_effect = lambda language_code, last_event_id: [
+            message for message in messages if message["id"] > (last_event_id or 0)
+        ]
+
+    async def test_language(self) -> None:
+        """Test that only configured languages have a live feed"""
+
+        with self.assertRaises(Http404):
+            await LiveEventsView.as_view()(
+                AsyncRequestFactory().get("/sse/xx/live/"), language_code="xx"
+            )
+
+        self.assertEqual(LiveEventsView.streams, 0)
+
+    async def test_reserve(self) -> None:
+        """Test that slots are taken before streams start, and released once"""
+
+        release = LiveEventsView.reserve()
+
+        self.assertEqual(LiveEventsView.streams, 1)
+        self.assertIsNone(LiveEventsView.reserve())
+
+        release()
+        release()
+
+        self.assertEqual(LiveEventsView.streams, 0)
+
+        # Responses closed before their stream is read
+        response = await LiveEventsView.as_view()(
+            AsyncRequestFactory().get(self.url), language_code="en"
+        )
+
+        self.assertEqual(LiveEventsView.streams, 1)
+
+        response.close()
+
+        self.assertEqual(LiveEventsView.streams, 0)
+
+    async def test_stream(self) -> None:
+        """Test resuming, live messages and keep-alives"""
+
+        response = await self.async_client.get(self.url, headers={"Last-Event-ID": "1"})
+        stream = aiter(response.streaming_content)
+
+        try:
+            self.assertEqual(response["Content-Type"], "text/event-stream")
+            self.assertEqual(await anext(stream), b"retry: 5000\n\n")
+            self.assertEqual(
+                await anext(stream), b'id: 2\ndata: {"id":2,"title":"2"}\n\n'
+            )
+            self.assertEqual(
+                await anext(stream), b'id: 3\ndata: {"id":3,"title":"3"}\n\n'
+            )
+            self.assertEqual(await anext(stream), b": keep-alive\n\n")
+
+            await self.layer.group_send(
+                "en-live",
+                {
+                    "type": "broadcast",
+                    "messages": [
+                        encode_message({"id": 3, "title": "3"}),
+                        encode_message({"id": 4, "title": "4"}),
+                    ],
+                },
+            )
+
+            self.assertEqual(
+                await anext(stream), b'id: 4\ndata: {"id":4,"title":"4"}\n\n'
+            )
+
+            # Streams per worker are bounded
+            response = await self.async_client.get(self.url)
+
+            self.assertEqual(response.status_code, 503)
+
+        finally:
+            # Readers going away cancel the stream
+            reading = asyncio.ensure_future(anext(stream))
+            await asyncio.sleep(0.01)
+            reading.cancel()
+
+            with suppress(asyncio.CancelledError):
+                await reading
+
+        self.assertEqual(LiveEventsView.streams, 0)
+        self.assertFalse(self.layer.groups.get("en-live"))
@@ -3,10 +3,20 @@
 from django.urls import path
 
 from tcn.channels.consumers import LiveFeedConsumer
+from tcn.channels.views import LiveEventsView, MetricsView
 
 # Create your URLConf here.
 app_name = "tcn_live"
 
-urlpatterns = [
+websocket_urlpatterns = [
     path("wss/<slug:language_code>/live/", LiveFeedConsumer.as_asgi(), name="live"),
 ]
+
+urlpatterns = websocket_urlpatterns + [
+    path(
+        "sse/<slug:language_code>/live/",
+        LiveEventsView.as_view(),
+        name="live-events",
+    ),
+    path("metrics/live/", MetricsView.as_view(), name="metrics"),
+]
@@ -0,0 +1,185 @@
+"""Views for tcn.channels"""
+
+import asyncio
+import threading
+from typing import AsyncIterator, Callable, Optional
+
+from asgiref.sync import sync_to_async
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse, StreamingHttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views import View
+
+from tcn.channels import metrics
+from tcn.channels.consumers import is_live_language
+from tcn.channels.replay import live_replay
+
+
+class EventStreamResponse(StreamingHttpResponse):
+    """Event stream releasing its slot once closed, even if never read"""
+
+    def __init__(self, streaming_content, release: Callable[[], None], **kwargs):
+        super().__init__(streaming_content, **kwargs)
+        self.release = release
+
+    def close(self) -> None:
+        super().close()
+        self.release()
+
+
+# Create your views here.
+class LiveEventsView(View):
+    """
+    Server-sent events fallback of the live feed, for readers whose proxies
+    block WebSockets
+
+    Streams the same messages as `LiveFeedConsumer`, one event per article,
+    resuming after the `Last-Event-ID` the browser sends when it reconnects.
+    Each worker serves at most `LIVE_SSE_MAX_STREAMS` streams at once, the
+    slot is taken before the response is returned.
+    """
+
+    streams = 0
+    lock = threading.Lock()
+
+    @classmethod
+    def reserve(cls) -> Optional[Callable[[], None]]:
+        """
+        Take a stream slot
+
+        Returns:
+            Callable | None: Releases the slot, once, or None if all are taken.
+        """
+
+        with cls.lock:
+            if cls.streams >= getattr(settings, "LIVE_SSE_MAX_STREAMS", 1000):
+                return None
+
+            cls.streams += 1
+
+        released = threading.Event()
+
+        def release() -> None:
+            with cls.lock:
+                if not released.is_set():
+                    released.set()
+                    cls.streams -= 1
+
+        return release
+
+    async def get(self, request: HttpRequest, language_code: str) -> HttpResponse:
+        if not is_live_language(language_code):
+            raise Http404
+
+        release = self.reserve()
+
+        if release is None:
+            return HttpResponse(status=503, headers={"Retry-After": "30"})
+
+        try:
+            last_event_id: Optional[int] = int(
+                request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+            )
+
+        except (TypeError, ValueError):
+            last_event_id = None
+
+        return EventStreamResponse(
+            self.events(language_code, last_event_id, release),
+            release,
+            content_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def events(
+        self,
+        language_code: str,
+        last_event_id: Optional[int],
+        release: Callable[[], None],
+    ) -> AsyncIterator[str]:
+        """Replay the missed messages, then follow the live feed group"""
+
+        metrics.subscribers.inc(language=language_code, transport="sse")
+        keepalive = getattr(settings, "LIVE_SSE_KEEPALIVE", 15)
+        channel_layer = get_channel_layer()
+        group = f"{language_code}-live"
+        channel = await channel_layer.new_channel()
+        receiving = None
+
+        try:
+            # Joined the group first, so nothing sent meanwhile is lost
+            await channel_layer.group_add(group, channel)
+            messages = await sync_to_async(live_replay.since)(
+                language_code, last_event_id
+            )
+
+            yield "retry: 5000\n\n"
+
+            while True:
+                for message in messages:
+                    if "id" in message:
+                        # Already replayed
+                        if message["id"] <= (last_event_id or 0):
+                            continue
+
+                        last_event_id = message["id"]
+                        yield f"id: {message['id']}\ndata: {message['data']}\n\n"
+
+                    else:
+                        yield f"data: {message['data']}\n\n"
+
+                # The receive is kept across keep-alives, cancelling it drops
+                # the channel from some layers
+                receiving = receiving or asyncio.ensure_future(
+                    channel_layer.receive(channel)
+                )
+                done, _ = await asyncio.wait({receiving}, timeout=keepalive)
+
+                if not done:
+                    messages = []
+                    yield ": keep-alive\n\n"
+                    continue
+
+                event, receiving = receiving.result(), None
+                messages = event.get("messages", [])
+
+        finally:
+            release()
+            metrics.subscribers.dec(language=language_code, transport="sse")
+
+            if receiving is not None:
+                receiving.cancel()
+
+            await channel_layer.group_discard(group, channel)
+
+
+class MetricsView(View):
+    """
+    Live feed metrics of this worker, in the Prometheus text format
+
+    Scrapers authenticate with `Authorization: Bearer <LIVE_METRICS_TOKEN>`,
+    without a token only staff can read them.
+    """
+
+    async def get(self, request: HttpRequest) -> HttpResponse:
+        token = getattr(settings, "LIVE_METRICS_TOKEN", None)
+
+        if token:
+            allowed = constant_time_compare(
+                request.headers.get("Authorization", ""), f"Bearer {token}"
+            )
+
+        else:
+            user = await request.auser()
+            allowed = user.is_staff
+
+        if not allowed:
+            return HttpResponse(status=403)
+
+        metrics.layer_dropped.set(getattr(get_channel_layer(), "dropped", 0))
+
+        return HttpResponse(
+            metrics.registry.render(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
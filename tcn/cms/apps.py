@@ -9,3 +9,10 @@ class CMSConfig(AppConfig):
 
     name = "tcn.cms"
     default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self) -> None:
+        """Register signal receivers"""
+
+        from tcn.cms.signals import register_rendition_signal_receivers
+
+        register_rendition_signal_receivers()
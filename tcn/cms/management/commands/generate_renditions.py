@@ -0,0 +1,51 @@
+"""Pre-generate the standard image renditions"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from wagtail.images import get_image_model
+
+from tcn.cms.renditions import rendition_pool
+
+Image = get_image_model()
+
+
+# Create your commands here.
+class Command(BaseCommand):
+    """Build the missing standard renditions of every image"""
+
+    help = "Generate the IMAGE_RENDITIONS of every image in a worker pool"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of images resized in parallel, 0 to resize inline (default: 4)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Number of images per worker task (default: 50)",
+        )
+
+    def handle(self, *args, **options):
+        ids = list(Image.objects.order_by("id").values_list("id", flat=True))
+        size = options["batch_size"]
+        batches = [ids[i : i + size] for i in range(0, len(ids), size)]
+
+        if options["workers"]:
+            with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+                count = sum(
+                    executor.map(rendition_pool.generate_in_background, batches)
+                )
+
+        else:
+            count = sum(map(rendition_pool.generate, batches))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {', '.join(rendition_pool.specs)} for {count} images"
+            )
+        )
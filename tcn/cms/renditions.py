@@ -0,0 +1,102 @@
+"""Pre-generation of image renditions"""
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.db import connections, transaction
+from wagtail.images import get_image_model
+
+logger = logging.getLogger(__name__)
+Image = get_image_model()
+
+
+# Create your rendition pools here.
+class RenditionPool:
+    """
+    Worker pool that builds the standard renditions of images
+
+    Images are handed over once the transaction that saved them commits, each
+    one is resized in a worker thread, so readers only ever find existing
+    renditions. With no workers the renditions are built inline instead.
+    """
+
+    def __init__(
+        self, workers: Optional[int] = None, specs: Optional[List[str]] = None
+    ) -> None:
+        self.workers = (
+            getattr(settings, "IMAGE_RENDITION_WORKERS", 2)
+            if workers is None
+            else workers
+        )
+        self.specs = specs or getattr(
+            settings,
+            "IMAGE_RENDITIONS",
+            ["fill-1920x1080", "fill-1080x1080", "fill-1200x630"],
+        )
+        self.lock = Lock()
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    def generate(self, image_ids: Iterable[int]) -> int:
+        """
+        Build the missing renditions of images
+
+        Args:
+            image_ids (Iterable): Image ids.
+
+        Returns:
+            int: Number of images processed.
+        """
+
+        count = 0
+
+        for image in Image.objects.filter(id__in=list(image_ids)).prefetch_renditions(
+            *self.specs
+        ):
+            try:
+                image.get_renditions(*self.specs)
+                count += 1
+
+            except Exception:
+                # A broken or missing file must not stop the other images
+                logger.exception("Could not generate the renditions of %s", image)
+
+        return count
+
+    def generate_in_background(self, image_ids: List[int]) -> int:
+        """Build renditions from a worker, then release its database connections"""
+
+        try:
+            return self.generate(image_ids)
+
+        finally:
+            connections.close_all()
+
+    def submit(self, *image_ids: int) -> None:
+        """Build the renditions of images once the current transaction commits"""
+
+        image_ids = [image_id for image_id in image_ids if image_id]
+
+        if image_ids:
+            transaction.on_commit(lambda: self.dispatch(image_ids))
+
+    def dispatch(self, image_ids: List[int]) -> Optional[List[Future]]:
+        if not self.workers:
+            self.generate(image_ids)
+            return None
+
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="renditions"
+                )
+
+        return [
+            self.executor.submit(self.generate_in_background, [image_id])
+            for image_id in image_ids
+        ]
+
+
+rendition_pool = RenditionPool()
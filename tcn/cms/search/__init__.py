@@ -0,0 +1,73 @@
+"""Full-text search backends, with stemming per locale"""
+
+import logging
+from typing import Dict, Optional
+
+from django.db import connection
+from wagtail.search.backends import database
+from wagtail.search.backends.database.fallback import DatabaseSearchBackend
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL text search configurations of the content languages
+LANGUAGE_CONFIGS = {
+    "ar": "arabic",
+    "en": "english",
+    "es": "spanish",
+    "fr": "french",
+    "tr": "turkish",
+}
+
+
+def search_config(
+    language_code: Optional[str], configs: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Text search configuration of a language, `simple` if it has none
+
+    Args:
+        language_code (str | None): Language code, regional variants use the
+            configuration of their language.
+        configs (Dict | None): Configurations by language code.
+    """
+
+    configs = LANGUAGE_CONFIGS if configs is None else configs
+    language_code = (language_code or "").lower()
+
+    return (
+        configs.get(language_code)
+        or configs.get(language_code.split("-")[0])
+        or "simple"
+    )
+
+
+# Create your search backends here.
+def SearchBackend(params):
+    """
+    Full-text search backend of the default database
+
+    PostgreSQL stores a `tsvector` per object, stemmed in the language of its
+    locale, in a GIN indexed table. SQLite matches an FTS5 table ranked with
+    BM25 in a single pass, unstemmed since the only stemmer of FTS5 is
+    English and breaks the prefix matching of autocompletion.
+    """
+
+    if connection.vendor == "postgresql":
+        from tcn.cms.search.postgres import LocalePostgresSearchBackend
+
+        return LocalePostgresSearchBackend(params)
+
+    backend = database.SearchBackend(params)
+
+    if isinstance(backend, DatabaseSearchBackend):
+        logger.warning(
+            "No full-text index on %s, search falls back to LIKE scans",
+            connection.vendor,
+        )
+
+    elif connection.vendor == "sqlite":
+        from tcn.cms.search.sqlite import RankedSQLiteSearchBackend
+
+        return RankedSQLiteSearchBackend(params)
+
+    return backend
@@ -0,0 +1,215 @@
+"""Search query hits aggregated in memory and written in batches"""
+
+import datetime
+import logging
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Optional, Set, Tuple
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F
+from django.utils import timezone
+from wagtail.contrib.search_promotions.models import Query, QueryDailyHits
+from wagtail.search.utils import normalise_query_string
+
+logger = logging.getLogger(__name__)
+
+# Characters no query needs, NUL cannot even be stored by PostgreSQL
+CONTROL_CHARACTERS = re.compile(r"[\x00-\x1f\x7f]")
+
+
+# Create your counters here.
+class SearchHitCounter:
+    """
+    Count search queries per day in process memory, and flush them to the
+    `search_promotions` tables without writing on the request path.
+
+    Queries are normalised like `Query.get` does, so "Cats " and "cats" share
+    a row. The first hit after a flush schedules the next one `interval`
+    seconds later, a flush creates the missing `Query` and `QueryDailyHits`
+    rows with two bulk inserts, then adds the counts with one `UPDATE ... SET
+    hits = hits + n` per distinct count. A process holding `threshold`
+    distinct pending queries flushes right away, so memory stays bounded.
+
+    Hits are lost if the process dies before its next flush, at most
+    `interval` seconds of them. The hits of a failed flush are kept for the
+    next one, those failing twice are written one query at a time and
+    dropped if they fail again, so a single bad row cannot hold back the
+    others forever.
+    """
+
+    def __init__(
+        self, interval: Optional[float] = None, threshold: Optional[int] = None
+    ) -> None:
+        self.interval = (
+            interval
+            if interval is not None
+            else getattr(settings, "SEARCH_HITS_FLUSH_INTERVAL", 60)
+        )
+        self.threshold = (
+            threshold
+            if threshold is not None
+            else getattr(settings, "SEARCH_HITS_FLUSH_THRESHOLD", 10_000)
+        )
+        self.pending: Counter = Counter()
+        self.timer: Optional[threading.Timer] = None
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        # Pairs kept after a failed flush, owned by the flush lock
+        self.retrying: Set[Tuple[str, datetime.date]] = set()
+
+    def hit(self, query_string: str, date: Optional[datetime.date] = None) -> None:
+        """
+        Record a search, without touching the database
+
+        Args:
+            query_string (str): Query as typed by the reader.
+            date (date | None): Day of the search, today by default.
+        """
+
+        query_string = normalise_query_string(CONTROL_CHARACTERS.sub(" ", query_string))
+
+        if not query_string:
+            return
+
+        with self.lock:
+            self.pending[(query_string, date or timezone.localdate())] += 1
+            full = len(self.pending) >= self.threshold
+
+            if full and self.timer is not None:
+                self.timer.cancel()
+
+            if full or self.timer is None:
+                self.timer = threading.Timer(
+                    0 if full else self.interval, self.flush_in_background
+                )
+                self.timer.daemon = True
+                self.timer.start()
+
+    def lag(self) -> int:
+        """Number of hits waiting for a flush"""
+
+        with self.lock:
+            return sum(self.pending.values())
+
+    def take(self) -> Counter:
+        """Swap the pending hits for an empty buffer"""
+
+        with self.lock:
+            pending, self.pending = self.pending, Counter()
+
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+        return pending
+
+    def write(self, pending: Counter) -> None:
+        """Add counts of `(query, date)` pairs to the database"""
+
+        query_strings = {query_string for query_string, _ in pending}
+
+        with transaction.atomic():
+            Query.objects.bulk_create(
+                [Query(query_string=query_string) for query_string in query_strings],
+                ignore_conflicts=True,
+            )
+            query_ids = dict(
+                Query.objects.filter(query_string__in=query_strings).values_list(
+                    "query_string", "id"
+                )
+            )
+            QueryDailyHits.objects.bulk_create(
+                [
+                    QueryDailyHits(query_id=query_ids[query_string], date=date)
+                    for query_string, date in pending
+                ],
+                ignore_conflicts=True,
+            )
+
+            groups = defaultdict(list)
+
+            for (query_string, date), count in pending.items():
+                groups[(date, count)].append(query_ids[query_string])
+
+            for (date, count), ids in groups.items():
+                QueryDailyHits.objects.filter(query_id__in=ids, date=date).update(
+                    hits=F("hits") + count
+                )
+
+    def flush(self) -> int:
+        """
+        Write pending hits to the database
+
+        Returns:
+            int: Number of hits written.
+        """
+
+        with self.flush_lock:
+            pending = self.take()
+
+            if not pending:
+                return 0
+
+            try:
+                self.write(pending)
+
+            except Exception as e:
+                logger.error("Failed to flush search hits: %s", e, exc_info=True)
+
+                # Counted again on the next flush, once
+                retried = Counter(
+                    {key: n for key, n in pending.items() if key in self.retrying}
+                )
+                self.retrying = set(pending) - set(retried)
+
+                with self.lock:
+                    self.pending.update(pending - retried)
+
+                return self.write_rows(retried)
+
+            self.retrying = set()
+
+            return sum(pending.values())
+
+    def write_rows(self, pending: Counter) -> int:
+        """
+        Write hits one query and day at a time, dropping the ones that fail
+
+        Returns:
+            int: Number of hits written.
+        """
+
+        written = 0
+
+        for (query_string, date), count in pending.items():
+            try:
+                self.write(Counter({(query_string, date): count}))
+
+            except Exception as e:
+                logger.error(
+                    "Dropped %d hits of search `%s` on %s: %s",
+                    count,
+                    query_string,
+                    date,
+                    e,
+                )
+
+            else:
+                written += count
+
+        return written
+
+    def flush_in_background(self) -> None:
+        """Flush from the timer thread, then release its database connections"""
+
+        try:
+            self.flush()
+
+        finally:
+            connections.close_all()
+
+
+search_hits = SearchHitCounter()
@@ -0,0 +1,71 @@
+"""PostgreSQL search stemmed in the language of each locale"""
+
+from typing import Dict, List, Optional
+
+from django.utils.translation import get_language
+from wagtail.search.backends.database.postgres.postgres import (
+    PostgresIndex,
+    PostgresSearchBackend,
+    PostgresSearchQueryCompiler,
+)
+
+from tcn.apps.locales import locales
+from tcn.cms.search import LANGUAGE_CONFIGS, search_config
+
+
+class LocalePostgresIndex(PostgresIndex):
+    """Index objects with the text search configuration of their locale"""
+
+    def add_items(self, model, objs):
+        languages = {locale.id: code for code, locale in locales.load().items()}
+        groups: Dict[str, List] = {}
+
+        for obj in objs:
+            language_code = languages.get(getattr(obj, "locale_id", None))
+            groups.setdefault(self.backend.get_config(language_code), []).append(obj)
+
+        default = self.backend.config
+
+        try:
+            for config, group in groups.items():
+                # Read by the object indexers of `PostgresIndex.add_items`
+                self.backend.config = config
+                super().add_items(model, group)
+
+        finally:
+            self.backend.config = default
+
+
+class LocalePostgresSearchQueryCompiler(PostgresSearchQueryCompiler):
+    """Stem queries in the active language"""
+
+    def get_config(self, backend):
+        return backend.get_config(get_language())
+
+
+# Create your search backends here.
+class LocalePostgresSearchBackend(PostgresSearchBackend):
+    """
+    PostgreSQL search, each object stemmed in the language of its locale
+
+    Queries are stemmed in the active language, the one the article listings
+    are filtered on, so they meet documents of the same configuration.
+
+    Params:
+        LANGUAGE_CONFIGS (Dict): Text search configurations by language code.
+        SEARCH_CONFIG (str): Configuration of objects without a locale.
+    """
+
+    query_compiler_class = LocalePostgresSearchQueryCompiler
+    index_class = LocalePostgresIndex
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.language_configs = params.get("LANGUAGE_CONFIGS", LANGUAGE_CONFIGS)
+        self.config = self.config or "simple"
+
+    def get_config(self, language_code: Optional[str]) -> str:
+        if language_code is None:
+            return self.config
+
+        return search_config(language_code, self.language_configs)
@@ -0,0 +1,94 @@
+"""SQLite FTS5 search ranked in a single pass"""
+
+from django.db.models import TextField
+from django.db.models.functions import Cast
+from wagtail.search.backends.database.sqlite.query import MatchExpression, normalize
+from wagtail.search.backends.database.sqlite.sqlite import (
+    SQLiteFTSIndexEntry,
+    SQLiteSearchBackend,
+    SQLiteSearchQueryCompiler,
+    SQLiteSearchResults,
+)
+from wagtail.search.query import MatchAll, Not
+from wagtail.search.utils import get_descendants_content_types_pks
+
+
+class RankedSQLiteSearchQueryCompiler(SQLiteSearchQueryCompiler):
+    """Search the FTS5 table once, ordered by BM25"""
+
+    def rank(self, config, start, stop):
+        """
+        Primary keys and scores of the best matches, best first
+
+        The stock compiler orders the objects by a correlated subquery that
+        runs the full-text match again for every matching object, this reads
+        the matches of the FTS5 table once, joined to the searched queryset.
+
+        Returns:
+            List | None: `(pk, score)` pairs, `None` for the queries that
+                are not ordered by relevance.
+        """
+
+        query = normalize(self.query)
+
+        if not self.order_by_relevance or isinstance(query, (MatchAll, Not)):
+            return None
+
+        match = MatchExpression(
+            self.fields or self.FTS_TABLE_FIELDS,
+            self.build_search_query(query, config=config),
+        )
+        object_ids = (
+            self.queryset.order_by()
+            .annotate(object_id=Cast("pk", output_field=TextField()))
+            .values("object_id")
+        )
+        matches = (
+            SQLiteFTSIndexEntry.objects.filter(match)
+            .filter(
+                index_entry__content_type__in=get_descendants_content_types_pks(
+                    self.queryset.model
+                ),
+                index_entry__object_id__in=object_ids,
+            )
+            .annotate(
+                score=self._build_rank_expression(self.get_search_vectors(), config)
+            )
+            .order_by("score", "-index_entry")
+            .values_list("index_entry__object_id", "score")
+        )
+        to_python = self.queryset.model._meta.pk.to_python
+
+        return [(to_python(pk), score) for pk, score in matches[start:stop]]
+
+
+class RankedSQLiteSearchResults(SQLiteSearchResults):
+    def _do_search(self):
+        ranked = self.query_compiler.rank(
+            self.query_compiler.get_config(self.backend), self.start, self.stop
+        )
+
+        if ranked is None:
+            return super()._do_search()
+
+        objects = self.query_compiler.queryset.in_bulk([pk for pk, _ in ranked])
+        results = []
+
+        for pk, score in ranked:
+            obj = objects.get(pk)
+
+            if obj is not None:
+                if self._score_field:
+                    setattr(obj, self._score_field, score)
+
+                results.append(obj)
+
+        return results
+
+
+# Create your search backends here.
+class RankedSQLiteSearchBackend(SQLiteSearchBackend):
+    """SQLite FTS5 search, relevance ordered results cost one match"""
+
+    query_compiler_class = RankedSQLiteSearchQueryCompiler
+    results_class = RankedSQLiteSearchResults
@@ -0,0 +1,31 @@
+"""Signals to pre-generate image renditions"""
+
+from django.db.models.signals import post_save
+from wagtail.images import get_image_model
+from wagtail.signals import page_published
+
+from tcn.apps.articles.models import Article
+from tcn.cms.renditions import rendition_pool
+
+
+def generate_image_renditions(sender, **kwargs):
+    """Build the renditions of a new or replaced image"""
+
+    image = kwargs["instance"]
+
+    # Skip saves that cannot have changed the file
+    if kwargs["created"] or "file" in (kwargs["update_fields"] or ["file"]):
+        rendition_pool.submit(image.id)
+
+
+def generate_article_renditions(sender, **kwargs):
+    """Build the renditions of the image of a published article"""
+
+    rendition_pool.submit(kwargs["instance"].image_id)
+
+
+def register_rendition_signal_receivers():
+    """Register signals to pre-generate renditions"""
+
+    post_save.connect(generate_image_renditions, sender=get_image_model())
+    page_published.connect(generate_article_renditions, sender=Article)
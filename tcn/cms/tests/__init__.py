@@ -0,0 +1 @@
+"""Tests for tcn.cms"""
@@ -0,0 +1,135 @@
+"""Tests for tcn.cms.search.hits"""
+
+import datetime
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse_lazy
+from django.utils import timezone
+from wagtail.contrib.search_promotions.models import Query, QueryDailyHits
+
+from tcn import APP_NAME
+from tcn.cms.search.hits import SearchHitCounter, search_hits
+
+
+# Create your tests here.
+class SearchHitCounterTests(TestCase):
+    """SearchHitCounter tests"""
+
+    def setUp(self) -> None:
+        """Use a counter that never flushes on its own"""
+
+        self.counter = SearchHitCounter(interval=3600, threshold=10_000)
+        self.addCleanup(self.counter.take)
+
+    def test_hit_does_not_write(self) -> None:
+        """Test that hits are normalised and buffered"""
+
+        with self.assertNumQueries(0):
+            for query in [
+                "Election",
+                "  election ",
+                "ELECTION\tresults",
+                "election\x00 results",
+                " ",
+                "\x00",
+            ]:
+                self.counter.hit(query)
+
+        self.assertEqual(
+            self.counter.take(),
+            {
+                ("election", timezone.localdate()): 2,
+                ("election results", timezone.localdate()): 2,
+            },
+        )
+        self.assertFalse(Query.objects.exists())
+
+    def test_flush(self) -> None:
+        """Test that a flush adds the hits of each query and day"""
+
+        today = timezone.localdate()
+        yesterday = today - datetime.timedelta(days=1)
+
+        for query in ["election", "Election", "weather"]:
+            self.counter.hit(query)
+
+        self.counter.hit("election", yesterday)
+
+        # Queries, their ids, daily rows, then one update per day and count
+        with self.assertNumQueries(8):
+            self.assertEqual(self.counter.flush(), 4)
+
+        self.assertEqual(self.counter.lag(), 0)
+        self.assertEqual(self.counter.flush(), 0)
+
+        # Existing rows are incremented
+        self.counter.hit("election")
+        self.assertEqual(self.counter.flush(), 1)
+
+        election = Query.objects.get(query_string="election")
+
+        self.assertEqual(election.hits, 4)
+        self.assertEqual(election.daily_hits.get(date=today).hits, 3)
+        self.assertEqual(election.daily_hits.get(date=yesterday).hits, 1)
+        self.assertEqual(Query.get("weather").hits, 1)
+        self.assertEqual(QueryDailyHits.objects.count(), 3)
+
+    def test_failed_flush(self) -> None:
+        """Test that hits of a failed flush stay pending"""
+
+        self.counter.hit("election")
+
+        with patch.object(self.counter, "write", side_effect=Exception("down")):
+            with self.assertLogs("tcn.cms.search.hits", "ERROR"):
+                self.assertEqual(self.counter.flush(), 0)
+
+        self.assertEqual(self.counter.lag(), 1)
+        self.assertEqual(self.counter.flush(), 1)
+
+    def test_failing_row(self) -> None:
+        """Test that hits failing twice are written row by row, or dropped"""
+
+        write = self.counter.write
+
+        def failing(pending):
+            if any(query_string == "bad" for query_string, _ in pending):
+                raise Exception("bad row")
+
+            write(pending)
+
+        self.counter.hit("bad")
+        self.counter.hit("election")
+
+        with (
+            patch.object(self.counter, "write", side_effect=failing),
+            self.assertLogs("tcn.cms.search.hits", "ERROR"),
+        ):
+            self.assertEqual(self.counter.flush(), 0)
+            self.assertEqual(self.counter.lag(), 2)
+
+            self.counter.hit("weather")
+
+            # Failed twice, "bad" is dropped and the new query kept, once
+            self.assertEqual(self.counter.flush(), 1)
+            self.assertEqual(self.counter.lag(), 1)
+            self.assertEqual(self.counter.flush(), 1)
+
+        self.assertEqual(self.counter.lag(), 0)
+        self.assertEqual(
+            set(Query.objects.values_list("query_string", flat=True)),
+            {"election", "weather"},
+        )
+
+    @patch.object(search_hits, "interval", 3600)
+    def test_search_view(self) -> None:
+        """Test that searching articles does not write its hit"""
+
+        self.addCleanup(search_hits.take)
+        response = self.client.get(
+            reverse_lazy(f"{APP_NAME}:articles"), {"search": "Election"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Query.objects.exists())
+        self.assertEqual(search_hits.lag(), 1)
@@ -0,0 +1,52 @@
+"""Tests for tcn.cms.renditions"""
+
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+from wagtail.images import get_image_model
+from wagtail.images.tests.utils import get_test_image_file
+
+from tcn.apps.articles.recommendations import recommendation_queue
+from tcn.apps.articles.tests import create_article, create_category
+from tcn.cms.renditions import rendition_pool
+
+Image = get_image_model()
+
+
+# Create your tests here.
+@patch.object(rendition_pool, "workers", 0)
+@patch.object(recommendation_queue, "workers", 0)
+class RenditionPoolTests(TestCase):
+    """Rendition pool tests"""
+
+    def specs(self, image) -> set:
+        return set(image.renditions.values_list("filter_spec", flat=True))
+
+    def test_upload(self) -> None:
+        """Test that renditions are built once an upload commits"""
+
+        with self.captureOnCommitCallbacks(execute=True):
+            image = Image.objects.create(title="Upload", file=get_test_image_file())
+
+        self.assertEqual(self.specs(image), set(rendition_pool.specs))
+
+    def test_publish(self) -> None:
+        """Test that publishing an article builds the renditions of its image"""
+
+        article = create_article(create_category(), "rendered")
+        article.image.renditions.all().delete()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            article.save_revision().publish()
+
+        self.assertEqual(self.specs(article.image), set(rendition_pool.specs))
+
+    def test_command(self) -> None:
+        """Test the backfill command"""
+
+        image = Image.objects.create(title="Backfill", file=get_test_image_file())
+        call_command("generate_renditions", workers=0, stdout=StringIO())
+
+        self.assertEqual(self.specs(image), set(rendition_pool.specs))
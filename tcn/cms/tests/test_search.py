@@ -0,0 +1,77 @@
+"""Tests for tcn.cms.search"""
+
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from wagtail.search.backends import database, get_search_backend
+
+from tcn.apps.articles.models import Article
+from tcn.apps.articles.tests import create_article, create_category
+from tcn.cms.search import search_config
+
+
+# Create your tests here.
+class SearchConfigTests(SimpleTestCase):
+    """Text search configuration tests"""
+
+    def test_search_config(self) -> None:
+        """Test that regional variants use the configuration of their language"""
+
+        self.assertEqual(search_config("ar-sy"), "arabic")
+        self.assertEqual(search_config("en"), "english")
+        self.assertEqual(search_config("de"), "simple")
+        self.assertEqual(search_config(None), "simple")
+        self.assertEqual(search_config("en-us", {"en-us": "us"}), "us")
+
+
+@skipUnless(connection.vendor == "sqlite", "SQLite FTS5 search")
+class RankedSQLiteSearchTests(TestCase):
+    """SQLite ranked search tests"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Setup data"""
+
+        category = create_category()
+        cls.body = create_article(category, "body", headline="Election results")
+        cls.title = create_article(category, "election", headline="Results")
+        cls.other = create_article(category, "other", headline="Weather")
+
+    def search(self, backend, queryset, query="election"):
+        return list(backend.search(query, queryset))
+
+    def test_ranking(self) -> None:
+        """Test that matches are ranked like the stock backend, in one match"""
+
+        backend = get_search_backend()
+        queryset = Article.objects.live()
+
+        # Matches, then the matched articles
+        with self.assertNumQueries(2):
+            results = self.search(backend, queryset)
+
+        self.assertEqual(results, self.search(database.SearchBackend({}), queryset))
+        self.assertCountEqual(results, [self.title, self.body])
+
+    def test_filters(self) -> None:
+        """Test that the searched queryset filters the matches"""
+
+        backend = get_search_backend()
+        queryset = Article.objects.live().exclude(id=self.title.id)
+
+        self.assertEqual(self.search(backend, queryset), [self.body])
+        self.assertEqual(self.search(backend, queryset, "missing"), [])
+        self.assertEqual(
+            list(backend.search("election", queryset, order_by_relevance=False)),
+            [self.body],
+        )
+
+    def test_scores(self) -> None:
+        """Test that scores are annotated"""
+
+        results = get_search_backend().search("election", Article.objects.live())
+
+        self.assertTrue(
+            all(result._score for result in results.annotate_score("_score"))
+        )
@@ -0,0 +1,105 @@
+"""Tests for tcn.cms.translators"""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from wagtail.models import Locale
+from wagtail_localize.strings import StringValue
+
+from tcn.cms.translators import FAILED, SEGMENT, HuggingFaceTranslator
+
+
+class StubCompletions:
+    """Chat completions that upper-case segments, in reverse order"""
+
+    def __init__(self, drop=(), fail: bool = False) -> None:
+        self.drop = set(drop)
+        self.fail = fail
+        self.prompts = []
+        self.lock = threading.Lock()
+
+    def create(self, messages, **kwargs):
+        prompt = messages[-1]["content"]
+
+        with self.lock:
+            self.prompts.append(prompt)
+
+        if self.fail:
+            raise ConnectionError("Inference endpoint is down")
+
+        segments = [
+            f'<segment id="{index}">{text.upper()}</segment>'
+            for index, text in SEGMENT.findall(prompt)
+            if int(index) not in self.drop
+        ]
+        content = "\n".join(reversed(segments)) or prompt.split("\n ", 1)[1].upper()
+
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+
+
+# Create your tests here.
+class HuggingFaceTranslatorTests(SimpleTestCase):
+    """HuggingFace translator tests"""
+
+    def setUp(self) -> None:
+        self.translator = HuggingFaceTranslator({})
+        self.source = Locale(language_code="en")
+        self.target = Locale(language_code="ar")
+
+    def translate(self, completions: StubCompletions, texts):
+        strings = [StringValue.from_source_html(text)[0] for text in texts]
+        client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+        with patch.object(self.translator, "client", client):
+            translations = self.translator.translate(self.source, self.target, strings)
+
+        return [translations[string].get_translatable_html() for string in strings]
+
+    def test_batches(self) -> None:
+        """Test that segments are packed up to the token budget"""
+
+        with patch.object(self.translator, "HF_TRANSLATION_BATCH_TOKENS", 20):
+            self.assertEqual(
+                self.translator.batches(["a" * 30, "b" * 3, "c" * 3, "d" * 60, "e"]),
+                [[0], [1, 2], [3], [4]],
+            )
+
+    @patch.object(HuggingFaceTranslator, "HF_TRANSLATION_BATCH_TOKENS", 40)
+    def test_translate(self) -> None:
+        """Test that batched translations map back to their strings"""
+
+        texts = [f"Segment <b>{i}</b> text" for i in range(10)]
+        completions = StubCompletions()
+
+        self.assertEqual(
+            self.translate(completions, [*texts, texts[0]]),
+            [f"SEGMENT <b>{i}</b> TEXT" for i in [*range(10), 0]],
+        )
+
+        # Distinct strings only, several per completion
+        self.assertEqual(len(completions.prompts), 5)
+
+    @patch.object(HuggingFaceTranslator, "HF_TRANSLATION_BATCH_TOKENS", 1000)
+    def test_missing_segments(self) -> None:
+        """Test that segments missing from a reply are translated on their own"""
+
+        completions = StubCompletions(drop=[1])
+
+        with self.assertLogs("tcn.cms.translators", "WARNING"):
+            translations = self.translate(completions, ["one", "two", "three"])
+
+        self.assertEqual(translations, ["ONE", "TWO", "THREE"])
+        self.assertEqual(len(completions.prompts), 2)
+
+    @patch.object(HuggingFaceTranslator, "HF_TRANSLATION_BATCH_TOKENS", 1000)
+    def test_failure(self) -> None:
+        """Test that a failed batch is reported for every one of its strings"""
+
+        with self.assertLogs("tcn.cms.translators", "ERROR"):
+            translations = self.translate(StubCompletions(fail=True), ["one", "two"])
+
+        self.assertEqual(translations, [FAILED, FAILED])
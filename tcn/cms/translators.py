@@ -1,6 +1,9 @@
 """HuggingFace Machine translator"""
 
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from math import ceil
 from typing import Any, Dict, List
 
 from django.conf import settings
@@ -11,6 +14,11 @@ from wagtail_localize.strings import StringValue
 
 logger = logging.getLogger(__name__)
 
+FAILED = "Failed to translate. Please try again later."
+
+# Segments of a batch, in the prompt and in the reply
+SEGMENT = re.compile(r'<segment id="(\d+)">(.*?)</segment>', re.DOTALL)
+
 
 # Create your translators here.
 class HuggingFaceTranslator(BaseMachineTranslator):
@@ -24,6 +32,8 @@ class HuggingFaceTranslator(BaseMachineTranslator):
         "HF_TRANSLATION_MODEL",
         "meta-llama/Meta-Llama-3-8B-Instruct",
     )
+    HF_TRANSLATION_BATCH_TOKENS = getattr(settings, "HF_TRANSLATION_BATCH_TOKENS", 1500)
+    HF_TRANSLATION_WORKERS = getattr(settings, "HF_TRANSLATION_WORKERS", 4)
     SYSTEM_MESSAGE = """You are a professional multi-lingual editor and translator.
     Translate the provided segments into the requested target language EXACTLY as specified.
     - Use Modern Standard Arabic for Arabic targets, suitable for news publishing.
@@ -63,7 +73,106 @@ class HuggingFaceTranslator(BaseMachineTranslator):
         except Exception as e:
             logger.error("Translation failed: %s", e, exc_info=True)
 
-            return "Failed to translate. Please try again later."
+            return FAILED
+
+    @staticmethod
+    def tokens(text: str) -> int:
+        """Rough number of tokens of a segment, with its delimiters"""
+
+        return ceil(len(text) / 3) + 8
+
+    def batches(self, texts: List[str]) -> List[List[int]]:
+        """
+        Pack segments into batches of `HF_TRANSLATION_BATCH_TOKENS` tokens
+
+        Args:
+            texts (List): Segments, in document order.
+
+        Returns:
+            List: Indexes of the segments of each batch, a segment larger
+                than the budget is a batch of its own.
+        """
+
+        batches: List[List[int]] = []
+        tokens = 0
+
+        for index, text in enumerate(texts):
+            size = self.tokens(text)
+
+            if not batches or tokens + size > self.HF_TRANSLATION_BATCH_TOKENS:
+                batches.append([])
+                tokens = 0
+
+            batches[-1].append(index)
+            tokens += size
+
+        return batches
+
+    def trans_batch(self, texts: Dict[int, str], src: str, tgt: str) -> Dict[int, str]:
+        """
+        Translate many segments in a single completion
+
+        Each segment is wrapped in a `<segment id="N">` element, the reply is
+        expected to keep the elements and translate their content. Segments
+        missing from the reply are translated one by one.
+
+        Args:
+            texts (Dict): Segments by index.
+            src (str): Source Locale language code.
+            tgt (str): Target Locale language code.
+
+        Returns:
+            Dict: Translations by index.
+        """
+
+        if len(texts) == 1:
+            return {index: self.trans(text, src, tgt) for index, text in texts.items()}
+
+        segments = "\n".join(
+            f'<segment id="{index}">{text}</segment>' for index, text in texts.items()
+        )
+
+        try:
+            response = self.client.chat.completions.create(
+                messages=[
+                    {"role": "system", "content": self.SYSTEM_MESSAGE},
+                    {
+                        "role": "user",
+                        "content": (
+                            f"Translate the content of every segment from {src} to "
+                            f"{tgt}. Reply with every segment, keeping each "
+                            '`<segment id="N">` element and its id unchanged:\n'
+                            f"{segments}"
+                        ),
+                    },
+                ],
+            )
+            reply = str(response.choices[0].message.content)
+
+        except Exception as e:
+            logger.error("Translation failed: %s", e, exc_info=True)
+
+            return {index: FAILED for index in texts}
+
+        translations = {}
+
+        for match in SEGMENT.finditer(reply):
+            index = int(match.group(1))
+
+            if index in texts and index not in translations:
+                translations[index] = match.group(2).strip()
+
+        missing = [index for index in texts if index not in translations]
+
+        if missing:
+            logger.warning(
+                "%d of %d segments missing from a batch", len(missing), len(texts)
+            )
+
+        for index in missing:
+            translations[index] = self.trans(texts[index], src, tgt)
+
+        return translations
 
     def translate(
         self,
@@ -74,6 +183,9 @@ class HuggingFaceTranslator(BaseMachineTranslator):
         """
         Perform translation using HuggingFace
 
+        Distinct segments are packed into token-budgeted batches, translated
+        concurrently by up to `HF_TRANSLATION_WORKERS` completions.
+
         Args:
             source_locale (Locale): Source locale
             target_locale (Locale): Target Locale
@@ -83,13 +195,30 @@ class HuggingFaceTranslator(BaseMachineTranslator):
             Dict: Translation output
         """
 
-        return {
-            string: StringValue.from_translated_html(
-                self.trans(
-                    string.get_translatable_html(),
+        texts = list(
+            dict.fromkeys(string.get_translatable_html() for string in strings)
+        )
+        batches = self.batches(texts)
+        translations: Dict[int, str] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.HF_TRANSLATION_WORKERS, len(batches)))
+        ) as executor:
+            for translated in executor.map(
+                lambda batch: self.trans_batch(
+                    {index: texts[index] for index in batch},
                     source_locale.language_code,
                     target_locale.language_code,
-                )
+                ),
+                batches,
+            ):
+                translations.update(translated)
+
+        indexes = {text: index for index, text in enumerate(texts)}
+
+        return {
+            string: StringValue.from_translated_html(
+                translations[indexes[string.get_translatable_html()]]
             )
             for string in strings
         }
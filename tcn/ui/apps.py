@@ -9,3 +9,10 @@ class TheCertainNewUIConfig(AppConfig):
 
     name = "tcn.ui"
     default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self) -> None:
+        """Register signal receivers"""
+
+        from tcn.apps.signals import register_locale_signal_receivers
+
+        register_locale_signal_receivers()
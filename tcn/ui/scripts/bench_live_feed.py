@@ -0,0 +1,115 @@
+"""Benchmark the live feed fan-out across simulated processes"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from channels.layers import InMemoryChannelLayer
+from channels.testing import WebsocketCommunicator
+
+from tcn.channels.broker import Broker
+from tcn.channels.consumers import LiveFeedConsumer
+from tcn.channels.layers import BrokerChannelLayer
+from tcn.channels.replay import encode_message
+
+
+async def connect(layer, language: str = "en") -> WebsocketCommunicator:
+    """Connect a simulated reader through a channel layer"""
+
+    with patch("channels.consumer.get_channel_layer", return_value=layer):
+        communicator = WebsocketCommunicator(
+            LiveFeedConsumer.as_asgi(), f"/wss/{language}/live/"
+        )
+        communicator.scope["url_route"] = {"kwargs": {"language_code": language}}
+        await communicator.connect()
+
+    return communicator
+
+
+async def receive(client, messages: int) -> None:
+    """Wait until a client got every message, bursts share frames"""
+
+    received = 0
+
+    while received < messages:
+        received += len(await client.receive_json_from(60))
+
+
+async def broadcast(publisher, clients, messages: int) -> float:
+    """Send breaking news and wait until every client got all of them"""
+
+    start = time.perf_counter()
+
+    for n in range(messages):
+        await publisher.group_send(
+            "en-live",
+            {
+                "type": "broadcast",
+                "messages": [encode_message({"title": f"Breaking {n}", "n": n})],
+            },
+        )
+
+    await asyncio.gather(*[receive(client, messages) for client in clients])
+
+    return time.perf_counter() - start
+
+
+async def bench(clients: int, processes: int, messages: int) -> None:
+    # Single process baseline
+    layer = InMemoryChannelLayer(capacity=messages * 2)
+    readers = [await connect(layer) for _ in range(clients)]
+    elapsed = await broadcast(layer, readers, messages)
+    report("in-memory, 1 process", clients, messages, elapsed)
+
+    for reader in readers:
+        await reader.disconnect()
+
+    with tempfile.TemporaryDirectory() as directory:
+        address = f"unix://{Path(directory) / 'broker.sock'}"
+        server = await Broker().serve(address)
+        layers = [
+            BrokerChannelLayer(address=address, capacity=messages * 2)
+            for _ in range(processes)
+        ]
+
+        start = time.perf_counter()
+        readers = [await connect(layers[i % processes]) for i in range(clients)]
+        print(f"Connected {clients} clients in {time.perf_counter() - start:.2f} s")
+
+        publisher = BrokerChannelLayer(address=address)
+        elapsed = await broadcast(publisher, readers, messages)
+        report(f"broker, {processes} processes", clients, messages, elapsed)
+
+        for reader in readers:
+            await reader.disconnect()
+
+        for layer in [*layers, publisher]:
+            await layer.close()
+
+        server.close()
+
+
+def report(name: str, clients: int, messages: int, elapsed: float) -> None:
+    print(
+        f"{name:<24} {messages} messages to {clients} clients in {elapsed:.2f} s, "
+        f"{clients * messages / elapsed:,.0f} deliveries/s, "
+        f"{elapsed / messages * 1e3:.1f} ms per broadcast"
+    )
+
+
+def run(*args) -> None:
+    """
+    Fan breaking news out to simulated `LiveFeedConsumer` clients
+
+    Usage:
+        python manage.py runscript bench_live_feed --script-args \
+            [clients] [processes] [messages]
+    """
+
+    clients = int(args[0]) if len(args) > 0 else 2_000
+    processes = int(args[1]) if len(args) > 1 else 4
+    messages = int(args[2]) if len(args) > 2 else 20
+
+    asyncio.run(bench(clients, processes, messages))
@@ -0,0 +1,125 @@
+"""Benchmark the CPU cost of a live feed broadcast to many readers"""
+
+import asyncio
+import time
+
+from django.test import override_settings
+from django.utils import timezone
+
+from tcn.channels.consumers import LiveFeedConsumer
+from tcn.channels.replay import encode_message
+
+
+class EncodingConsumer(LiveFeedConsumer):
+    """Baseline, every reader encodes the messages it sends"""
+
+    async def write(self) -> None:
+        while True:
+            messages = [await self.queue.get()]
+
+            while not self.queue.empty():
+                messages.append(self.queue.get_nowait())
+
+            await self.send_json([message["payload"] for message in messages])
+
+
+async def readers(consumer_class, count: int):
+    """Consumers wired to a socket that discards their frames"""
+
+    async def discard(message) -> None:
+        pass
+
+    consumers = []
+
+    for _ in range(count):
+        consumer = consumer_class()
+        consumer.base_send = discard
+        consumer.queue = asyncio.Queue(maxsize=100)
+        consumer.writer = asyncio.ensure_future(consumer.write())
+        consumers.append(consumer)
+
+    return consumers
+
+
+async def settle(consumers) -> None:
+    """Let every writer send its queued frame"""
+
+    while any(not consumer.queue.empty() for consumer in consumers):
+        await asyncio.sleep(0)
+
+    await asyncio.sleep(0)
+
+
+async def fan_out(consumers, events) -> float:
+    """CPU time to broadcast events to every consumer"""
+
+    start = time.process_time()
+
+    for event in events:
+        for consumer in consumers:
+            await consumer.broadcast(event)
+
+        await settle(consumers)
+
+    elapsed = time.process_time() - start
+
+    for consumer in consumers:
+        consumer.writer.cancel()
+
+    return elapsed
+
+
+async def bench(count: int, broadcasts: int) -> None:
+    payloads = [
+        {
+            "id": n,
+            "url": f"https://tcn.example/l/{n:06d}/",
+            "title": f"Breaking news number {n} from around the world",
+            "created_at": timezone.now().isoformat(),
+        }
+        for n in range(broadcasts)
+    ]
+
+    elapsed = await fan_out(
+        await readers(EncodingConsumer, count),
+        [
+            {"type": "broadcast", "messages": [{"id": p["id"], "payload": p}]}
+            for p in payloads
+        ],
+    )
+    report("encode per reader", count, broadcasts, elapsed)
+
+    # Encoded once at publish time, readers join the shared text
+    start = time.process_time()
+    events = [
+        {"type": "broadcast", "messages": [encode_message(payload)]}
+        for payload in payloads
+    ]
+    encoding = time.process_time() - start
+
+    elapsed = await fan_out(await readers(LiveFeedConsumer, count), events)
+    report("shared frame", count, broadcasts, elapsed + encoding)
+
+
+def report(name: str, count: int, broadcasts: int, elapsed: float) -> None:
+    print(
+        f"{name:<18} {broadcasts} broadcasts to {count:,} readers, "
+        f"{elapsed / broadcasts * 1e3:.1f} ms CPU per broadcast, "
+        f"{elapsed / broadcasts / count * 1e6:.2f} us per reader"
+    )
+
+
+def run(*args) -> None:
+    """
+    Broadcast breaking news to simulated `LiveFeedConsumer` readers
+
+    Usage:
+        python manage.py runscript bench_live_frames --script-args \
+            [readers] [broadcasts]
+    """
+
+    count = int(args[0]) if len(args) > 0 else 10_000
+    broadcasts = int(args[1]) if len(args) > 1 else 20
+
+    with override_settings(LIVE_FEED_COALESCE_DELAY=0):
+        asyncio.run(bench(count, broadcasts))
@@ -0,0 +1,80 @@
+"""Benchmark random sampling against `ORDER BY RANDOM()`"""
+
+import time
+
+from django.db import connection, models
+
+from tcn.apps.sampling import IdSampler, sample_by_id
+
+
+class SampledRow(models.Model):
+    """Throwaway table to sample from"""
+
+    title = models.CharField(max_length=255)
+
+    class Meta:
+        app_label = "home"
+        managed = False
+        db_table = "home_benchmark_sampling"
+
+
+def measure(sample, repeat: int) -> float:
+    """Average time of a sample in milliseconds"""
+
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        sample()
+
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def run(*args) -> None:
+    """
+    Sample 5 rows out of tables of increasing size
+
+    Usage:
+        python manage.py runscript bench_sampling --script-args [rows ...]
+    """
+
+    sizes = [int(arg) for arg in args] or [10_000, 1_000_000]
+    sampler = IdSampler("benchmark")
+
+    with connection.schema_editor() as editor:
+        editor.create_model(SampledRow)
+
+    try:
+        count = 0
+
+        for size in sorted(sizes):
+            SampledRow.objects.bulk_create(
+                (SampledRow(title=f"Row {i}") for i in range(count, size)),
+                batch_size=10_000,
+            )
+            count = size
+            queryset = SampledRow.objects.all()
+            sampler.clear()
+
+            results = {
+                "ORDER BY RANDOM()": measure(
+                    lambda: list(queryset.order_by("?")[:5]), 5
+                ),
+                "id range": measure(lambda: sample_by_id(queryset, 5), 50),
+                "cached ids (cold)": measure(
+                    lambda: sampler.clear() or sampler.sample(queryset, 5, "rows"), 5
+                ),
+                "cached ids (warm)": measure(
+                    lambda: sampler.sample(queryset, 5, "rows"), 50
+                ),
+            }
+
+            print(f"{size} rows")
+
+            for name, elapsed in results.items():
+                print(f"  {name:<20} {elapsed:9.2f} ms")
+
+    finally:
+        sampler.clear()
+
+        with connection.schema_editor() as editor:
+            editor.delete_model(SampledRow)
@@ -0,0 +1,127 @@
+"""Benchmark batched machine translation against a local stub inference server"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from math import ceil
+
+from huggingface_hub import InferenceClient
+from wagtail.models import Locale
+from wagtail_localize.strings import StringValue
+
+from tcn.cms.translators import SEGMENT, HuggingFaceTranslator
+
+# Latency of a completion, and generation time per output token (seconds)
+LATENCY = 0.2
+PER_TOKEN = 0.002
+
+
+class StubInferenceHandler(BaseHTTPRequestHandler):
+    """OpenAI compatible chat completions that upper-case the text"""
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["messages"][-1]["content"]
+        segments = SEGMENT.findall(prompt)
+
+        if segments:
+            content = "\n".join(
+                f'<segment id="{index}">{text.upper()}</segment>'
+                for index, text in segments
+            )
+
+        else:
+            content = prompt.split("\n ", 1)[-1].upper()
+
+        time.sleep(LATENCY + ceil(len(content) / 4) * PER_TOKEN)
+
+        data = json.dumps(
+            {
+                "id": "stub",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": "stub",
+                "system_fingerprint": "stub",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0,
+                },
+            }
+        ).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def run(*args) -> None:
+    """
+    Translate articles of increasing segment counts, one completion per
+    segment as before, then in concurrent token-budgeted batches
+
+    The stub server answers every completion after a fixed latency plus a
+    generation time per output token, and serves completions concurrently.
+
+    Usage:
+        python manage.py runscript bench_translators --script-args [segments ...]
+    """
+
+    sizes = [int(arg) for arg in args] or [50, 200]
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubInferenceHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    translator = HuggingFaceTranslator({})
+    translator.client = InferenceClient(
+        base_url=f"http://127.0.0.1:{server.server_address[1]}"
+    )
+    source, target = Locale(language_code="en"), Locale(language_code="ar")
+
+    try:
+        for size in sizes:
+            strings = [
+                StringValue.from_source_html(
+                    f"Paragraph {i} of the article, with <b>bold</b> words and "
+                    "a sentence long enough to look like real news copy."
+                )[0]
+                for i in range(size)
+            ]
+            texts = [string.get_translatable_html() for string in strings]
+
+            start = time.perf_counter()
+
+            for text in texts:
+                translator.trans(text, source.language_code, target.language_code)
+
+            sequential = time.perf_counter() - start
+
+            start = time.perf_counter()
+            translations = translator.translate(source, target, strings)
+            batched = time.perf_counter() - start
+
+            assert all(
+                translations[string].get_translatable_html().upper() == text.upper()
+                for string, text in zip(strings, texts)
+            ), "Translations do not match their strings"
+
+            print(
+                f"{size:>4} segments, {len(translator.batches(texts)):>3} batches: "
+                f"sequential {sequential:6.2f} s, batched {batched:6.2f} s, "
+                f"{sequential / batched:5.1f}x"
+            )
+
+    finally:
+        server.shutdown()
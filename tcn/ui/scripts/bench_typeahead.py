@@ -0,0 +1,64 @@
+"""Benchmark typeahead lookups against the size of the index"""
+
+import random
+import time
+
+from tcn.api.typeahead import PrefixIndex
+
+WORDS = [f"w{i:04d}" for i in range(5_000)]
+PREFIXES = {
+    "1 character": "w",
+    "3 characters": "w00",
+    "word": "w0042",
+    "two words": "w0042 w",
+    "no match": "missing",
+}
+
+
+def measure(search, repeat: int) -> float:
+    """Average time of a lookup in microseconds"""
+
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        search()
+
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def run(*args) -> None:
+    """
+    Look up prefixes in indexes of increasing size, first without then with
+    the memoized results, and time an incremental update
+
+    Usage:
+        python manage.py runscript bench_typeahead --script-args [titles ...]
+    """
+
+    sizes = [int(arg) for arg in args] or [10_000, 100_000]
+    rng = random.Random(0)
+
+    for size in sizes:
+        index = PrefixIndex()
+        start = time.perf_counter()
+
+        index.extend(
+            "article",
+            ((ref, " ".join(rng.choices(WORDS, k=8)), ref, {}) for ref in range(size)),
+        )
+
+        print(
+            f"{size} titles, {len(index.keys['article'])} keys, "
+            f"built in {time.perf_counter() - start:.1f} s"
+        )
+
+        for name, prefix in PREFIXES.items():
+            cold = measure(lambda: (index.memo.clear(), index.search(prefix, 5)), 20)
+            warm = measure(lambda: index.search(prefix, 5), 1_000)
+            print(f"  {name:<13} {cold:10.1f} us cold {warm:6.1f} us memoized")
+
+        elapsed = measure(
+            lambda: index.add("article", 0, " ".join(rng.choices(WORDS, k=8)), 0),
+            100,
+        )
+        print(f"  {'update':<13} {elapsed:10.1f} us")
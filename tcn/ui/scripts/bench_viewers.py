@@ -0,0 +1,114 @@
+"""Benchmark unique viewer sketches against the former `Link.views` table"""
+
+import random
+import time
+
+from django.db import connection, models, transaction
+
+from tcn.apps.links.counters import ViewCounter
+from tcn.apps.links.models import DailyViewers, Link
+
+
+class LegacyViews(models.Model):
+    """Same shape as the `Link.views` through table"""
+
+    link = models.ForeignKey(
+        Link, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+"
+    )
+    user = models.ForeignKey(
+        "users.User", on_delete=models.DO_NOTHING, db_constraint=False, related_name="+"
+    )
+
+    class Meta:
+        app_label = "links"
+        managed = False
+        db_table = "links_benchmark_views"
+        unique_together = [("link", "user")]
+
+
+def table_size(table: str) -> int | None:
+    """Size of a table and its indexes in bytes, if the backend can tell"""
+
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute("SELECT pg_total_relation_size(%s)", [table])
+            return cursor.fetchone()[0]
+
+        if connection.vendor == "sqlite":
+            try:
+                cursor.execute(
+                    "SELECT SUM(pgsize) FROM dbstat WHERE tbl_name = %s", [table]
+                )
+                return cursor.fetchone()[0]
+
+            except Exception:
+                return None
+
+    return None
+
+
+def run(*args) -> None:
+    """
+    Replay random authenticated hits against both storages
+
+    Usage:
+        python manage.py runscript bench_viewers --script-args [hits] [users]
+    """
+
+    hits = int(args[0]) if len(args) > 0 else 10_000
+    users = int(args[1]) if len(args) > 1 else 2_000
+    link_ids = list(Link.objects.values_list("id", flat=True)[:100])
+
+    if not link_ids:
+        print("No links found, publish some articles first")
+        return
+
+    stream = [(random.choice(link_ids), random.randint(1, users)) for _ in range(hits)]
+
+    with connection.schema_editor() as editor:
+        editor.create_model(LegacyViews)
+
+    try:
+        # Former request path: `views.contains()` then `views.add()` per hit
+        start = time.perf_counter()
+
+        for link_id, user_id in stream:
+            if not LegacyViews.objects.filter(
+                link_id=link_id, user_id=user_id
+            ).exists():
+                LegacyViews.objects.create(link_id=link_id, user_id=user_id)
+
+        legacy_time = time.perf_counter() - start
+        legacy_rows = LegacyViews.objects.count()
+        legacy_size = table_size(LegacyViews._meta.db_table)
+
+    finally:
+        with connection.schema_editor() as editor:
+            editor.delete_model(LegacyViews)
+
+    with transaction.atomic():
+        # Sketches, written once per flush by the view counter
+        start = time.perf_counter()
+        ViewCounter().record_viewers(set(stream))
+        sketch_time = time.perf_counter() - start
+        sketch_size = sum(
+            len(viewers)
+            for queryset in [
+                Link.objects.filter(id__in=link_ids),
+                DailyViewers.objects.filter(link_id__in=link_ids),
+            ]
+            for viewers in queryset.values_list("viewers", flat=True)
+        )
+
+        transaction.set_rollback(True)
+
+    print(f"{hits} hits by {users} users on {len(link_ids)} links")
+    print(
+        f"Link.views table: {legacy_rows} rows, "
+        f"{legacy_size if legacy_size is not None else 'n/a'} bytes, "
+        f"{legacy_time / hits * 1e6:.1f} µs/hit"
+    )
+    print(
+        f"Viewer sketches:  {len(link_ids)} links and buckets, {sketch_size} bytes, "
+        f"{sketch_time / hits * 1e6:.1f} µs/hit"
+    )
@@ -10,6 +10,7 @@ from wagtail.models import Locale
 
 from tcn.apps.articles.models import Article
 from tcn.apps.categories.models import Category
+from tcn.apps.sampling import sample_by_id
 
 Image = get_image_model()
 
@@ -57,7 +58,7 @@ def run(src_path: str, language_code: str) -> None:
 
     for item in data:
         # Get a random image
-        image = Image.objects.order_by("?").first()
+        image = next(iter(sample_by_id(Image.objects.all())), None)
 
         try:
             with transaction.atomic():
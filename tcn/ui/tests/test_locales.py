@@ -0,0 +1,80 @@
+"""Tests for tcn.apps.locales"""
+
+from unittest.mock import patch
+
+from django.conf import settings
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+from rest_framework import status
+from wagtail.models import Locale
+
+from tcn import APP_NAME
+from tcn.apps.locales import LocaleMap, get_request_locale, locales
+
+
+# Create your tests here.
+class LocaleResolutionTests(TestCase):
+    """Locale resolution tests"""
+
+    def setUp(self) -> None:
+        locales.clear()
+
+    def test_get(self) -> None:
+        """Test that locales are loaded once and fall back to the default"""
+
+        default = Locale.objects.get(language_code=settings.LANGUAGE_CODE)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(locales.get(settings.LANGUAGE_CODE), default)
+            self.assertEqual(locales.get("missing"), default)
+            self.assertEqual(get_request_locale(RequestFactory().get("/")), default)
+
+    def test_clear_on_save(self) -> None:
+        """Test that saving a locale reloads the map"""
+
+        locales.load()
+        locale = Locale.objects.create(language_code="fr")
+
+        self.assertEqual(locales.get("fr"), locale)
+
+        # Rolled back with the test, drop it from the map as well
+        locale.delete()
+
+    def test_clear_in_other_processes(self) -> None:
+        """Test that other processes reload the map once it is too old"""
+
+        other = LocaleMap(max_age=60)
+        other.load()
+        locales.clear()
+
+        with patch("tcn.apps.locales.time.monotonic", return_value=0):
+            other.checked = 0
+
+            with self.assertNumQueries(0):
+                other.load()
+
+        with patch("tcn.apps.locales.time.monotonic", return_value=other.checked + 60):
+            with self.assertNumQueries(1):
+                other.load()
+
+            # Up to date, only the version is read again
+            other.checked -= 60
+
+            with self.assertNumQueries(0):
+                other.load()
+
+    def test_warm_request(self) -> None:
+        """Test that a warm worker does not query locales"""
+
+        url = reverse_lazy(f"{APP_NAME}:rss-latest")
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(
+            [query for query in queries if "wagtailcore_locale" in query["sql"]]
+        )
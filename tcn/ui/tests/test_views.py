@@ -73,3 +73,16 @@ class ViewTests(TestCase):
                 [status.HTTP_200_OK, status.HTTP_302_FOUND],
                 f"Failed for {url}: {response.status_code}",
             )
+
+    def test_article_pages(self) -> None:
+        """Test that article lists take cursors, `1` and `last` as pages"""
+
+        url = reverse_lazy(f"{APP_NAME}:articles")
+
+        for page in ["1", "last"]:
+            response = self.client.get(url, {"page": page})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(url, {"page": "not-a-cursor"})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -1,26 +1,29 @@
 """Views for tcn.ui"""
 
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
-from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.messages.views import SuccessMessageMixin
+from django.core.paginator import InvalidPage, Paginator
 from django.db.models import QuerySet
-from django.http import HttpRequest
+from django.http import Http404, HttpRequest
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
-from django.utils.translation import get_language_from_request
 from django.utils.translation import gettext_lazy as _
 from django.views import generic
 from django_filters.views import FilterView
-from wagtail.contrib.search_promotions.models import Query
-from wagtail.models import Locale
 
 from tcn import APP_NAME
+from tcn.apps.articles.counts import article_counter
 from tcn.apps.articles.models import Article
+from tcn.apps.articles.searches import SearchResults, search_cache
+from tcn.apps.links.counters import view_counter
 from tcn.apps.links.models import Link
+from tcn.apps.links.resolvers import link_resolver
 from tcn.apps.mixins import PaginatorMixin
+from tcn.apps.paginators import CursorPaginator
+from tcn.cms.search.hits import search_hits
 from tcn.ui import mixins
 from tcn.ui.forms import UserCreateForm
 
@@ -48,26 +51,27 @@ class UserDetailView(PaginatorMixin, generic.DetailView):
     """User detail view"""
 
     model = User
+    paginator_class = CursorPaginator
     template_name = "tcn/authors/id.html"
 
+    def get_paginate_count(self, queryset):
+        """Cached number of articles of the user in the active language"""
+
+        return article_counter.count(
+            queryset, "owner", self.object.id, self.request.locale.id
+        )
+
     def get_context_data(self, **kwargs: Dict[str, Any]) -> Dict[str, Any]:
         """Add articles to context"""
 
         context = super().get_context_data(**kwargs)
 
-        lang = get_language_from_request(self.request, check_path=True)
-
-        try:
-            locale = Locale.objects.get(language_code=lang)
-
-        except Locale.DoesNotExist:
-            locale = Locale.objects.get(language_code=settings.LANGUAGE_CODE)
-
         # Pagination
         queryset = (
             Article.objects.live()
             .public()
-            .filter(owner=context["user"], locale=locale)
+            .filter(owner=context["user"], locale=self.request.locale)
+            .with_card_data()
             .order_by("-created_at")
         )
 
@@ -162,14 +166,18 @@ class LinkRedirectView(generic.DetailView):
     ) -> mixins.HttpResponse:
         """Redirect to news article"""
 
-        link = self.get_object()
-        link.view_count += 1
-        link.save()
+        try:
+            link_id, url = link_resolver.resolve(kwargs["slug"])
 
-        if request.user.is_authenticated and not link.views.contains(self.request.user):
-            link.views.add(self.request.user)
+        except Link.DoesNotExist:
+            raise Http404(_("No link found matching the query"))
 
-        return redirect(link.article.get_url())
+        # Buffered, written to the database in batches
+        view_counter.hit(
+            link_id, request.user.id if request.user.is_authenticated else None
+        )
+
+        return redirect(url)
 
 
 # Articles
@@ -183,27 +191,101 @@ class BaseArticleListView:
     ordering = "-created_at"
     date_field = "created_at"
     context_object_name = "articles"
-    queryset = Article.objects.live().public().prefetch_related("link")
+    queryset = Article.objects.live().public().with_card_data()
     filterset_fields = ["country", "is_breaking"]
+    paginator_class = CursorPaginator
 
     def get_queryset(self) -> QuerySet[Article]:
         """Filter queryset by active language"""
 
-        lang = get_language_from_request(self.request, check_path=True)
+        return super().get_queryset().filter(locale=self.request.locale)
 
-        try:
-            locale = Locale.objects.get(language_code=lang)
+    def get_paginate_count(self, queryset):
+        """Number of articles known beforehand, `None` to leave them uncounted"""
+
+        return None
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        """Number the pages of search results, their ids are already counted"""
+
+        if isinstance(queryset, SearchResults):
+            kwargs.pop("count", None)
+            return Paginator(queryset, per_page, **kwargs)
+
+        return super().get_paginator(queryset, per_page, **kwargs)
+
+    def paginate_queryset(self, queryset, page_size):
+        """Paginate by keyset, pages are opaque cursors, `1` or `last`"""
+
+        paginator = self.get_paginator(
+            queryset,
+            page_size,
+            orphans=self.get_paginate_orphans(),
+            allow_empty_first_page=self.get_allow_empty(),
+            count=self.get_paginate_count(queryset),
+        )
+        page_kwarg = self.page_kwarg
+        page = self.kwargs.get(page_kwarg) or self.request.GET.get(page_kwarg)
 
-        except Locale.DoesNotExist:
-            locale = Locale.objects.get(language_code=settings.LANGUAGE_CODE)
+        if page == "last" and not getattr(paginator, "keyset", False):
+            page = paginator.num_pages
 
-        return super().get_queryset().filter(locale=locale)
+        try:
+            page = paginator.page(page or 1)
+            return (paginator, page, page.object_list, page.has_other_pages())
+
+        except InvalidPage as e:
+            raise Http404(
+                _("Invalid page (%(page_number)s): %(message)s")
+                % {"page_number": page, "message": str(e)}
+            )
 
 
 class ArticleListView(BaseArticleListView, FilterView, generic.ListView):
     """Article list"""
 
     template_name = "tcn/articles/list.html"
+    counted = True
+    search_cached = True
+
+    def get_paginate_count(self, queryset):
+        """Cached number of articles of the active language, when unfiltered"""
+
+        if not self.counted or set(self.request.GET) - {self.page_kwarg}:
+            return None
+
+        return article_counter.count(queryset, "locale", self.request.locale.id)
+
+    def get_search_scope(self) -> Optional[Dict[str, Any]]:
+        """
+        Everything the searched articles depend on besides the query
+
+        Returns:
+            Dict | None: Locale and filters, `None` if the articles depend on
+                the user, their results are not cached then.
+        """
+
+        if not self.search_cached:
+            return None
+
+        return {
+            "locale": self.request.locale.id,
+            **{
+                name: self.request.GET.getlist(name)
+                for name in self.filterset.filters
+                if name in self.request.GET
+            },
+        }
+
+    def paginate_queryset(self, queryset, page_size):
+        """Paginate the cached ids of the search results when searching"""
+
+        query = self.request.GET.get("search", None)
+
+        if query:
+            queryset = search_cache.results(queryset, query, self.get_search_scope())
+
+        return super().paginate_queryset(queryset, page_size)
 
     def get_context_data(self, **kwargs: Dict[str, Any]) -> Dict[str, Any]:
         """Search articles if query is present"""
@@ -213,10 +295,10 @@ class ArticleListView(BaseArticleListView, FilterView, generic.ListView):
 
         if query:
             context["search"] = query
-            context[self.context_object_name] = self.filterset.qs.search(query)
 
-            # Log the query so Wagtail can suggest promoted results
-            Query.get(query).add_hit()
+            # Log the query so Wagtail can suggest promoted results, the hits
+            # are written in batches off the request path
+            search_hits.hit(query)
 
         return context
 
@@ -225,6 +307,8 @@ class SavedArticleListView(LoginRequiredMixin, ArticleListView):
     """Saved articles list"""
 
     template_name = "tcn/articles/saved.html"
+    counted = False
+    search_cached = False
 
     def get_queryset(self) -> QuerySet[Article]:
         """Filter articles to show only saved articles"""
@@ -240,6 +324,8 @@ class FollowingArticleListView(LoginRequiredMixin, ArticleListView):
     """Articles from followed authors"""
 
     template_name = "tcn/articles/following.html"
+    counted = False
+    search_cached = False
 
     def get_queryset(self) -> QuerySet[Article]:
         """Filter articles to show only saved articles"""
@@ -254,6 +340,7 @@ class SearchView(ArticleListView):
 
     template_name = "tcn/search.html"
     context_object_name = "search_results"
+    counted = False
 
     def get_queryset(self) -> QuerySet[Article]:
         """Check if search query is provided to return the queryset else none"""